@@ -21,6 +21,7 @@ from typing import Optional
 import redis
 
 from src.core.config import FetcherConfig
+from src.services.command_subscriber import enqueue_command
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -80,7 +81,14 @@ def main(argv: Optional[list[str]] = None) -> int:
     client.ping()
 
     # Push to queue head to prioritize recent (LPUSH) or tail (RPUSH) for strict FIFO
-    client.rpush(config.commands_queue, json.dumps(payload))
+    enqueue_command(
+        client,
+        config.commands_queue,
+        payload,
+        max_queue_depth=config.commands_max_queue_depth,
+        delay_ms=config.commands_enqueue_delay_ms,
+        max_delay_ms=config.commands_enqueue_max_delay_ms,
+    )
 
     print(
         "Enqueued command to '"
@@ -1,10 +1,10 @@
 """Allow running the package as a module: python -m src."""
 
-import asyncio
 import sys
 
 from src.main import main
+from src.utils.event_loop import run as run_event_loop
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    exit_code = run_event_loop(main())
     sys.exit(exit_code)
@@ -87,6 +87,12 @@ class FetcherConfig(BaseSettings):
     max_parallel_channels: int = Field(
         default=3, ge=1, le=10, description="Maximum channels to process in parallel"
     )
+    max_parallel_days: int = Field(
+        default=4,
+        ge=1,
+        le=16,
+        description="Maximum days of one daemon command fetched in parallel",
+    )
 
     # === Per-Chat Concurrency ===
     fetch_concurrency_per_chat: int = Field(
@@ -95,6 +101,15 @@ class FetcherConfig(BaseSettings):
         le=20,
         description="Maximum parallel date ranges per chat",
     )
+    extract_concurrency: int = Field(
+        default=8,
+        ge=1,
+        le=64,
+        description=(
+            "Messages extracted concurrently within a date range "
+            "(overlaps comment lookups; 1 = sequential)"
+        ),
+    )
 
     # === Retry Settings ===
     max_retry_attempts: int = Field(
@@ -109,6 +124,20 @@ class FetcherConfig(BaseSettings):
         le=10.0,
         description="Exponential backoff factor for retries",
     )
+    max_flood_wait_seconds: int = Field(
+        default=600,
+        ge=0,
+        description="Longest FloodWait a worker sleeps through in-place",
+    )
+    flood_wait_defer_threshold: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "When other commands are queued, FloodWaits longer than this are "
+            "not slept through; the command is deferred and re-queued after "
+            "the wait (0 disables deferral)"
+        ),
+    )
 
     # === Progress Reset ===
     progress_reset: bool = Field(
@@ -130,6 +159,13 @@ class FetcherConfig(BaseSettings):
         default=True,
         description=("Enable publishing of start/complete/failed/skipped/stage events"),
     )
+    events_fire_and_forget: bool = Field(
+        default=True,
+        description=(
+            "Publish events from a background thread without waiting for the "
+            "Redis reply (drained on shutdown)"
+        ),
+    )
     progress_interval: int = Field(
         default=100,
         ge=1,
@@ -244,6 +280,15 @@ class FetcherConfig(BaseSettings):
     redis_password: Optional[str] = Field(
         default=None, description="Redis password (if required)"
     )
+    redis_max_connections: Optional[int] = Field(
+        default=None,
+        ge=2,
+        le=1000,
+        description=(
+            "Max connections in the daemon's Redis publisher pool "
+            "(None uses the daemon's default of 4)"
+        ),
+    )
 
     # === Redis Commands Queue (BLPOP) ===
     commands_queue: str = Field(
@@ -255,6 +300,51 @@ class FetcherConfig(BaseSettings):
         le=3600,
         description="Default BLPOP timeout in seconds for command subscriber",
     )
+    commands_max_queue_depth: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Producer backpressure threshold for the commands list "
+            "(0 disables); deeper queues delay enqueueing"
+        ),
+    )
+    commands_enqueue_delay_ms: int = Field(
+        default=100,
+        ge=0,
+        description="Base enqueue delay per threshold-worth of excess queue depth",
+    )
+    commands_enqueue_max_delay_ms: int = Field(
+        default=5000,
+        ge=0,
+        description="Cap for the producer-side enqueue delay",
+    )
+    commands_ack_enabled: bool = Field(
+        default=False,
+        description=(
+            "Move each command to a per-worker processing list (BLMOVE) and "
+            "remove it only after handling, so a crashed worker leaves it "
+            "recoverable instead of lost"
+        ),
+    )
+    commands_blpop_max_timeout: int = Field(
+        default=30,
+        ge=1,
+        le=3600,
+        description=(
+            "Upper bound for adaptive BLPOP timeout while idle (doubles from "
+            "commands_blpop_timeout on each empty poll)"
+        ),
+    )
+    commands_prefetch_count: int = Field(
+        default=1,
+        ge=1,
+        le=100,
+        description=(
+            "Max commands a worker takes per poll; extra queued commands are "
+            "drained in one pipelined round-trip and handled concurrently "
+            "(one at a time per chat)"
+        ),
+    )
 
     # === Schema / Versioning ===
     data_schema_version: str = Field(
@@ -4,7 +4,6 @@ This module provides thread-safe progress tracking to ensure
 idempotent fetch operations across restarts and failures.
 """
 
-import json
 import threading
 from datetime import date as Date
 from datetime import datetime
@@ -13,6 +12,8 @@ from typing import Any, Optional
 
 from pydantic import BaseModel, Field
 
+from src.utils import serialization
+
 
 class CommandProgress(BaseModel):
     """Progress record for a single fetch command."""
@@ -70,13 +71,12 @@ class ProgressTracker:
             return
 
         try:
-            with open(self.progress_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                self._data = {
-                    cmd_id: CommandProgress(**progress)
-                    for cmd_id, progress in data.items()
-                }
-        except (json.JSONDecodeError, ValueError):
+            with open(self.progress_file, "rb") as f:
+                data = serialization.loads(f.read())
+            self._data = {
+                cmd_id: CommandProgress(**progress) for cmd_id, progress in data.items()
+            }
+        except (serialization.JSONDecodeError, ValueError):
             # Corrupted file - backup and start fresh
             backup = self.progress_file.with_suffix(".json.backup")
             if self.progress_file.exists():
@@ -93,8 +93,8 @@ class ProgressTracker:
 
         # Atomic write with temp file
         temp_file = self.progress_file.with_suffix(".tmp")
-        with open(temp_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(temp_file, "wb") as f:
+            f.write(serialization.dumps(data, indent=True))
 
         temp_file.replace(self.progress_file)
 
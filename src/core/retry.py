@@ -35,6 +35,18 @@ def _get_flood_seconds(exc: BaseException) -> int:
     return 0
 
 
+def _decorrelated_delay(
+    base_delay: float, prev_delay: float, max_delay: float
+) -> float:
+    """Sample the next sleep using AWS-style "decorrelated jitter".
+
+    ``sleep = min(cap, uniform(base, prev_sleep * 3))`` keeps retries from
+    independent workers spread out instead of clustering on the same window.
+    """
+    upper = max(base_delay, prev_delay * 3)
+    return min(max_delay, random.uniform(base_delay, upper))
+
+
 async def retry_with_backoff(
     operation: Callable[[], Awaitable[Any]],
     *,
@@ -140,9 +152,12 @@ async def safe_operation(  # noqa: C901 - orchestrator combining floodwait + ret
 
     FloodWait-type exceptions (with .seconds/.capture/.wait_seconds) are handled by
     sleeping and retrying. Other exceptions listed in `retry_on` are retried with
-    backoff/jitter up to `max_attempts`.
+    backoff up to `max_attempts`; with `jitter=True` delays use decorrelated
+    jitter (see `_decorrelated_delay`), otherwise plain exponential backoff.
+    The actually sampled delay is passed to `on_retry`.
     """
     attempt = 0
+    prev_delay = base_delay
     while True:
         try:
             attempt += 1
@@ -164,10 +179,12 @@ async def safe_operation(  # noqa: C901 - orchestrator combining floodwait + ret
                 raise
             if attempt >= max_attempts:
                 raise
-            base = base_delay * (exponential_base ** (attempt - 1))
-            delay = min(max_delay, base)
             if jitter:
-                delay = random.uniform(0.5 * delay, 1.5 * delay)
+                delay = _decorrelated_delay(base_delay, prev_delay, max_delay)
+                prev_delay = delay
+            else:
+                base = base_delay * (exponential_base ** (attempt - 1))
+                delay = min(max_delay, base)
             name = operation_name or "operation"
             logger.warning(
                 "Retrying %s",
@@ -6,12 +6,14 @@ Supports horizontal scaling - multiple workers can run simultaneously.
 
 import asyncio
 import contextlib
-import os
+import logging
 import signal
 import sys
-from datetime import datetime, timedelta, timezone
+import time
+from datetime import date, datetime, timedelta, timezone
 from typing import Any, Awaitable, Callable, cast
 
+import redis
 from pydantic import ValidationError
 
 from src.core.config import FetcherConfig
@@ -22,24 +24,61 @@ from src.core.exceptions import (
     TelegramAuthError,
 )
 from src.core.retry import safe_operation
-from src.observability.logging_config import get_logger, setup_logging
+from src.models.command import FetchRequest
+from src.observability.logging_config import (
+    ContextLoggerAdapter,
+    get_logger,
+    setup_logging,
+)
 from src.observability.metrics import (
+    WORKER_ID,
+    chat_label,
     ensure_metrics_server,
     fetch_duration_seconds,
     fetch_errors_total,
     fetch_messages_total,
     fetch_retries_total,
     floodwait_wait_seconds,
+    track_redis_pool,
 )
+from src.observability.metrics_adapter import PrometheusMetricsAdapter
 from src.services.command_subscriber import CommandSubscriber
 from src.services.event_publisher import EventPublisher
 from src.services.fetcher_service import FetcherService
 from src.utils.correlation import CorrelationContext
+from src.utils.event_loop import run as run_event_loop
+
+# Seconds a Redis call waits for a free pooled connection before failing
+_POOL_WAIT_TIMEOUT = 10
+
+# Publisher pool users: the event loop thread (publishes are synchronous
+# calls from coroutines) plus the single fire-and-forget worker of each of
+# the two EventPublishers sharing the pool, with one spare
+_PUB_POOL_SIZE = 4
+
+# Precomputed retry reason labels for the (closed) set of retryable errors
+_RETRY_REASONS: dict[type[BaseException], str] = {
+    NetworkError: "networkerror",
+    FloodWaitError: "floodwait",
+}
 
 
 class FetcherDaemon:
     """Daemon that listens for Redis commands and executes fetch operations."""
 
+    __slots__ = (
+        "config",
+        "logger",
+        "running",
+        "worker_id",
+        "command_subscriber",
+        "event_publisher",
+        "_queue_pool",
+        "_pub_pool",
+        "_fetcher_service",
+        "_shutdown_event",
+    )
+
     def __init__(self, config: FetcherConfig):
         """Initialize daemon.
 
@@ -51,11 +90,20 @@ class FetcherDaemon:
         self.running = False
 
         # Worker ID for logging and monitoring
-        self.worker_id = os.getenv("HOSTNAME", "fetcher-1")
+        self.worker_id = WORKER_ID
 
         # Redis clients
         self.command_subscriber: CommandSubscriber | None = None
         self.event_publisher: EventPublisher | None = None
+        # Dedicated pools: the blocking BLPOP consumer must not starve publishes
+        self._queue_pool: redis.ConnectionPool | None = None
+        self._pub_pool: redis.ConnectionPool | None = None
+
+        # Fetcher service is built once and reused across commands/day offsets
+        self._fetcher_service: FetcherService | None = None
+
+        # Set from the loop's signal handlers to interrupt the listen loop
+        self._shutdown_event = asyncio.Event()
 
     async def start(self) -> None:
         """Start daemon and listen for commands."""
@@ -74,13 +122,31 @@ class FetcherDaemon:
 
         # Setup Redis connections
         try:
-            # Command subscriber (queue pattern - fair distribution)
-            self.command_subscriber = CommandSubscriber(
-                redis_url=self.config.redis_url,
-                redis_password=self.config.redis_password,
-                command_handler=self._handle_fetch_command,
-                worker_id=self.worker_id,
+            # The listener thread holds one connection in BLPOP; handlers use
+            # the rest (LLEN, ZADD, ack LREM), one set per prefetched command.
+            # Publishes get their own pool so they never queue behind BLPOP.
+            # Blocking pools make a momentary shortage wait, not fail.
+            self._queue_pool = redis.BlockingConnectionPool.from_url(
+                self.config.redis_url,
+                password=self.config.redis_password,
+                decode_responses=True,
+                socket_keepalive=True,
+                max_connections=2 + self.config.commands_prefetch_count,
+                timeout=_POOL_WAIT_TIMEOUT,
             )
+            self._pub_pool = redis.BlockingConnectionPool.from_url(
+                self.config.redis_url,
+                password=self.config.redis_password,
+                decode_responses=True,
+                socket_keepalive=True,
+                max_connections=self._pub_pool_size(),
+                timeout=_POOL_WAIT_TIMEOUT,
+            )
+            track_redis_pool("queue", self._queue_pool, self.worker_id)
+            track_redis_pool("pub", self._pub_pool, self.worker_id)
+
+            # Command subscriber (queue pattern - fair distribution)
+            self.command_subscriber = self._create_command_subscriber()
             self.command_subscriber.connect()
 
             # Event publisher (broadcast pattern)
@@ -88,29 +154,133 @@ class FetcherDaemon:
                 redis_url=self.config.redis_url,
                 redis_password=self.config.redis_password,
                 enabled=self.config.enable_events,
+                connection_pool=self._pub_pool,
+                max_retry_attempts=self.config.max_retry_attempts,
+                retry_backoff_factor=self.config.retry_backoff_factor,
+                fire_and_forget=self.config.events_fire_and_forget,
             )
             self.event_publisher.connect()
 
             self.logger.info("Redis connections established")
 
+            # Build the fetcher service once per daemon (container, runtime init)
+            service = self._get_fetcher_service()
+
         except Exception as e:
-            self.logger.error(f"Failed to setup Redis: {e}", exc_info=True)
+            self.logger.error("Failed to setup Redis: %s", e, exc_info=True)
             raise
 
+        # Connect Telegram once; commands reuse the live client until stop()
+        try:
+            await service.open_session()
+        except Exception:
+            self.logger.warning(
+                "Telegram pre-connect failed; connecting per command", exc_info=True
+            )
+
         # Setup signal handlers
-        signal.signal(signal.SIGTERM, self._handle_shutdown)
-        signal.signal(signal.SIGINT, self._handle_shutdown)
+        self._install_signal_handlers()
 
         self.running = True
 
         # Start listening for commands
         try:
-            await self.command_subscriber.listen(timeout=5)
+            await self._listen_until_shutdown()
         except Exception as e:
-            self.logger.error(f"Error in daemon listen loop: {e}", exc_info=True)
+            self.logger.error("Error in daemon listen loop: %s", e, exc_info=True)
         finally:
             await self.stop()
 
+    def _pub_pool_size(self) -> int:
+        """Return the publisher pool size (REDIS_MAX_CONNECTIONS or default).
+
+        Publishing is synchronous, so in-flight days take turns on the event
+        loop thread rather than each holding a connection; the only other
+        users are the publishers' background workers. The default therefore
+        does not grow with ``max_parallel_days``.
+        """
+        if self.config.redis_max_connections:
+            return self.config.redis_max_connections
+        return _PUB_POOL_SIZE
+
+    def _command_dates(
+        self, date_str: str | None, days_back: int, today: date
+    ) -> list[str]:
+        """Return the distinct day windows a fetch command covers.
+
+        Only ``fetch_mode=date`` honours a per-day date, so ``days_back``
+        fans out into one window per offset there. An explicit date, or a
+        strategy that picks its own window (``yesterday``), would fetch the
+        same window for every offset into the same file, so it is fetched
+        once and reported under the date it actually covers.
+
+        Args:
+            date_str: Explicit date from the command, if any
+            days_back: Number of days requested
+            today: Command start date (UTC)
+
+        Returns:
+            ISO dates to fetch, newest first
+        """
+        if date_str:
+            return [date_str]
+        if self.config.fetch_mode == "date":
+            return [
+                (today - timedelta(days=day_offset)).isoformat()
+                for day_offset in range(days_back)
+            ]
+        # YesterdayOnlyStrategy uses the local date
+        return [(date.today() - timedelta(days=1)).isoformat()]
+
+    def _create_command_subscriber(self) -> CommandSubscriber:
+        """Build the queue consumer from the COMMANDS_* settings.
+
+        Mirrors ``Container.provide_command_subscriber`` (same settings and
+        command counters) with the daemon's handler and queue pool.
+        BLPOP returns as soon as a command is pushed, so the timeout only
+        bounds idle polls; it starts at ``commands_blpop_timeout`` and backs
+        off to ``commands_blpop_max_timeout`` while the queue stays empty.
+        """
+        return CommandSubscriber(
+            redis_url=self.config.redis_url,
+            redis_password=self.config.redis_password,
+            command_handler=self._handle_fetch_command,
+            worker_id=self.worker_id,
+            commands_queue=self.config.commands_queue,
+            blpop_timeout=self.config.commands_blpop_timeout,
+            max_blpop_timeout=self.config.commands_blpop_max_timeout,
+            ack_enabled=self.config.commands_ack_enabled,
+            prefetch_count=self.config.commands_prefetch_count,
+            delayed_enabled=self.config.flood_wait_defer_threshold > 0,
+            metrics=(
+                PrometheusMetricsAdapter() if self.config.enable_metrics else None
+            ),
+            connection_pool=self._queue_pool,
+        )
+
+    async def _listen_until_shutdown(self) -> None:
+        """Run the command listener until it exits or shutdown is requested.
+
+        On shutdown an idle BLPOP is abandoned right away (anything it still
+        pops is re-queued by the subscriber), while a command that is being
+        handled is allowed to finish.
+        """
+        assert self.command_subscriber is not None
+        listen_task = asyncio.create_task(self.command_subscriber.listen())
+        shutdown_task = asyncio.create_task(self._shutdown_event.wait())
+        try:
+            await asyncio.wait(
+                {listen_task, shutdown_task}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not listen_task.done():
+                self.command_subscriber.stop()
+                if not self.command_subscriber.busy:
+                    listen_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await listen_task
+        finally:
+            shutdown_task.cancel()
+
     async def stop(self) -> None:
         """Stop daemon gracefully."""
         if not self.running:
@@ -127,20 +297,52 @@ class FetcherDaemon:
         if self.event_publisher:
             self.event_publisher.disconnect()
 
+        if self._fetcher_service is not None:
+            await self._fetcher_service.aclose()
+            self._fetcher_service = None
+
+        for pool in (self._queue_pool, self._pub_pool):
+            if pool is not None:
+                with contextlib.suppress(Exception):
+                    pool.disconnect()
+
         self.logger.info("Fetcher Daemon stopped")
 
-    def _handle_shutdown(self, signum: int, frame: Any) -> None:
+    def _get_fetcher_service(self) -> FetcherService:
+        """Return the shared FetcherService, constructing it on first use."""
+        if self._fetcher_service is None:
+            # Progress/stage events share the daemon's publish pool
+            self._fetcher_service = FetcherService(
+                self.config, redis_pool=self._pub_pool
+            )
+        return self._fetcher_service
+
+    def _install_signal_handlers(self) -> None:
+        """Route SIGTERM/SIGINT to the shutdown event via the running loop."""
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler(sig, self._handle_shutdown, sig)
+            except (NotImplementedError, RuntimeError):
+                # Windows event loops lack add_signal_handler
+                signal.signal(
+                    sig,
+                    lambda signum, _frame: loop.call_soon_threadsafe(
+                        self._handle_shutdown, signum
+                    ),
+                )
+
+    def _handle_shutdown(self, signum: int) -> None:
         """Handle shutdown signals.
 
         Args:
             signum: Signal number
-            frame: Current stack frame
         """
         self.logger.info(
             "Received shutdown signal; initiating graceful shutdown...",
-            extra={"signum": signum},
+            extra={"signum": int(signum)},
         )
-        self.running = False
+        self._shutdown_event.set()
 
     async def _handle_fetch_command(  # noqa: C901
         self, command: dict[str, Any]
@@ -174,230 +376,320 @@ class FetcherDaemon:
                 )
                 return
 
-            self.logger.info(
-                "Processing fetch command",
-                extra={
+            # Fields shared by every record of this command are merged in once
+            log = ContextLoggerAdapter(
+                self.logger,
+                {
                     "correlation_id": correlation_id,
-                    "chat": chat,
-                    "days_back": days_back,
-                    "limit": limit,
-                    "strategy": strategy,
-                    "requested_by": requested_by,
                     "worker_id": self.worker_id,
-                    "mode": "date" if date_str else "recent",
-                    "date": date_str,
+                    "chat": chat,
                 },
             )
+            # Resolve level checks once so disabled records build no `extra`
+            info_on = log.isEnabledFor(logging.INFO)
+            debug_on = log.isEnabledFor(logging.DEBUG)
+
+            if info_on:
+                log.info(
+                    "Processing fetch command",
+                    extra={
+                        "days_back": days_back,
+                        "limit": limit,
+                        "strategy": strategy,
+                        "requested_by": requested_by,
+                        "mode": "date" if date_str else "recent",
+                        "date": date_str,
+                    },
+                )
 
-            start_time = datetime.now(timezone.utc)
+            # One wall-clock read per command (day windows, start_ts); durations
+            # use the monotonic clock
+            start_time = time.monotonic()
+            started_at = datetime.now(timezone.utc)
+            today = started_at.date()
+            # Explicit date requests force "date" mode on the shared service
+            override_mode = "date" if date_str else None
+            # Default for failure events raised before the first day is computed
+            fetch_date = today.isoformat()
 
             try:
-                # Execute fetch for each requested day with retry/backoff wrapper
-                for day_offset in range(days_back):
-                    fetch_date = (
-                        datetime.now(timezone.utc) - timedelta(days=day_offset)
-                    ).strftime("%Y-%m-%d")
-
-                    self.logger.info(
-                        "Starting fetch operation",
-                        extra={
-                            "correlation_id": correlation_id,
-                            "chat": chat,
-                            "date": fetch_date,
-                            "day_offset": day_offset,
-                            "worker_id": self.worker_id,
-                        },
-                    )
-
-                    # Create fetcher service config for this request
-                    fetch_config = self.config.model_copy(deep=True)
-                    if date_str:
-                        fetch_config.fetch_mode = "date"
-                        fetch_config.fetch_date = date_str
-                    service = FetcherService(fetch_config)
-
-                    # Fetch with retry/backoff
-                    actual_date = date_str if date_str else fetch_date
-
-                    async def _op(
-                        service: FetcherService = service,
-                        actual_date: str = actual_date,
-                    ) -> dict[str, Any]:
-                        return await service.fetch_single_chat(chat, actual_date)
-
-                    result = await self._run_with_retries(
-                        _op,
-                        chat=chat,
-                        date=actual_date,
-                        correlation_id=correlation_id,
-                    )
-
-                    if result and self.event_publisher:
-                        # Publish success event
-                        duration = (
-                            datetime.now(timezone.utc) - start_time
-                        ).total_seconds()
-                        # Metrics
-                        with contextlib.suppress(Exception):
-                            fetch_duration_seconds.labels(
-                                chat=chat, date=actual_date, worker=self.worker_id
-                            ).observe(duration)
-
-                        self.event_publisher.publish_fetch_complete(
+                service = self._get_fetcher_service()
+                dates = self._command_dates(date_str, days_back, today)
+                # Bound the per-day fan-out to stay within Telegram rate limits
+                day_slots = asyncio.Semaphore(self.config.max_parallel_days)
+
+                async def _fetch_day(
+                    day_offset: int, actual_date: str
+                ) -> tuple[float, Any]:
+                    async with day_slots:
+                        day_started = time.monotonic()
+                        # Start is folded into the completion record (start_ts);
+                        # only emit a separate record when debugging
+                        if debug_on:
+                            log.debug(
+                                "Starting fetch operation",
+                                extra={
+                                    "date": actual_date,
+                                    "day_offset": day_offset,
+                                },
+                            )
+
+                        # Fetch with retry/backoff
+                        req = FetchRequest(chat, actual_date, override_mode)
+
+                        async def _op() -> dict[str, Any]:
+                            return await service.fetch_request(req)
+
+                        result = await self._run_with_retries(
+                            _op,
                             chat=chat,
                             date=actual_date,
-                            message_count=result.get("message_count", 0),
-                            file_path=result.get("file_path", ""),
-                            duration_seconds=duration,
-                            checksum_sha256=result.get("checksum_sha256"),
-                            estimated_tokens_total=result.get("estimated_tokens_total"),
-                            first_message_ts=result.get("first_message_ts"),
-                            last_message_ts=result.get("last_message_ts"),
-                            schema_version="1",
-                            preprocessing_version="1",
-                            summary_file_path=result.get("summary_file_path"),
-                            threads_file_path=result.get("threads_file_path"),
-                            participants_file_path=result.get("participants_file_path"),
+                            correlation_id=correlation_id,
                         )
+                        return day_started, result
+
+                outcomes = await asyncio.gather(
+                    *(_fetch_day(i, d) for i, d in enumerate(dates)),
+                    return_exceptions=True,
+                )
 
-                        self.logger.info(
-                            "Fetch completed successfully",
-                            extra={
-                                "correlation_id": correlation_id,
+                # Completion events of all days are flushed in one round-trip
+                publish_batch = (
+                    self.event_publisher.pipeline()
+                    if self.event_publisher
+                    else contextlib.nullcontext()
+                )
+                failure: Exception | None = None
+                with publish_batch:
+                    for day_offset, (actual_date, outcome) in enumerate(
+                        zip(dates, outcomes)
+                    ):
+                        if isinstance(outcome, BaseException):
+                            if not isinstance(outcome, Exception):
+                                raise outcome
+                            # First failing day drives the error handling below
+                            if failure is None:
+                                failure, fetch_date = outcome, actual_date
+                            continue
+
+                        day_started, result = outcome
+                        if result and self.event_publisher:
+                            # Publish success event
+                            duration = time.monotonic() - start_time
+                            # Metrics
+                            with contextlib.suppress(Exception):
+                                fetch_duration_seconds.labels(
+                                    chat=chat_label(chat), worker=self.worker_id
+                                ).observe(duration)
+
+                            # The payload dict goes to the publisher as-is (no
+                            # kwargs round-trip); the log record reuses its values
+                            event: dict[str, Any] = {
                                 "chat": chat,
                                 "date": actual_date,
                                 "message_count": result.get("message_count", 0),
+                                "file_path": result.get("file_path", ""),
                                 "duration_seconds": round(duration, 2),
-                                "worker_id": self.worker_id,
-                                "status": "success",
-                            },
-                        )
-                    else:
-                        raise Exception("Fetch returned no result")
+                                "checksum_sha256": result.get("checksum_sha256"),
+                                "estimated_tokens_total": result.get(
+                                    "estimated_tokens_total"
+                                ),
+                                "first_message_ts": result.get("first_message_ts"),
+                                "last_message_ts": result.get("last_message_ts"),
+                                "schema_version": "1",
+                                "preprocessing_version": "1",
+                                "summary_file_path": result.get("summary_file_path"),
+                                "threads_file_path": result.get("threads_file_path"),
+                                "participants_file_path": result.get(
+                                    "participants_file_path"
+                                ),
+                            }
+                            self.event_publisher.publish_fetch_complete_payload(event)
+
+                            if info_on:
+                                log.info(
+                                    "Fetch completed successfully",
+                                    extra={
+                                        "date": actual_date,
+                                        "day_offset": day_offset,
+                                        # Wall clock derived from the single
+                                        # per-command timestamp
+                                        "start_ts": (
+                                            started_at
+                                            + timedelta(
+                                                seconds=day_started - start_time
+                                            )
+                                        ).isoformat(),
+                                        "message_count": event["message_count"],
+                                        "duration_seconds": event["duration_seconds"],
+                                        "status": "success",
+                                    },
+                                )
+                        elif failure is None:
+                            failure = Exception("Fetch returned no result")
+                            fetch_date = actual_date
+
+                if failure is not None:
+                    raise failure
 
             except TelegramAuthError as e:
                 # Auth errors - don't retry
-                duration = (datetime.now(timezone.utc) - start_time).total_seconds()
-                self.logger.error(
+                self._report_failure(
+                    log,
                     "Telegram authentication failed",
-                    extra={
-                        "correlation_id": correlation_id,
-                        "error_type": "auth_error",
-                        "chat": chat,
-                        "phone": getattr(e, "phone", None),
-                        "worker_id": self.worker_id,
-                        "duration_seconds": round(duration, 2),
-                        "status": "failed",
-                    },
-                    exc_info=True,
+                    chat=chat,
+                    date=date_str or fetch_date,
+                    error_type="auth_error",
+                    error=f"auth_error: {str(e)}",
+                    duration=time.monotonic() - start_time,
+                    phone=getattr(e, "phone", None),
                 )
 
-                if self.event_publisher:
-                    self.event_publisher.publish_fetch_failed(
-                        chat=chat,
-                        date=date_str or fetch_date,
-                        error=f"auth_error: {str(e)}",
-                        duration_seconds=duration,
-                    )
-
             except FloodWaitError as e:
                 # Rate limit - log and wait (already handled inside
-                # retry loop if raised there)
-                duration = (datetime.now(timezone.utc) - start_time).total_seconds()
-                self.logger.warning(
+                # retry loop if raised there). Waits too long to sleep through
+                # while other work is queued are deferred and re-queued later.
+                deferred = self._maybe_defer(command, e.wait_seconds)
+                self._report_failure(
+                    log,
                     "Telegram rate limit hit",
-                    extra={
-                        "correlation_id": correlation_id,
-                        "error_type": "rate_limit",
-                        "chat": chat,
-                        "wait_seconds": e.wait_seconds,
-                        "worker_id": self.worker_id,
-                        "duration_seconds": round(duration, 2),
-                        "status": "rate_limited",
-                    },
+                    chat=chat,
+                    date=date_str or fetch_date,
+                    error_type="rate_limit",
+                    error=(
+                        f"rate_limit: deferred {e.wait_seconds}s"
+                        if deferred
+                        else f"rate_limit: wait {e.wait_seconds}s"
+                    ),
+                    duration=time.monotonic() - start_time,
+                    level=logging.WARNING,
+                    status="deferred" if deferred else "rate_limited",
+                    exc_info=False,
+                    wait_seconds=e.wait_seconds,
                 )
 
-                if self.event_publisher:
-                    self.event_publisher.publish_fetch_failed(
-                        chat=chat,
-                        date=date_str or fetch_date,
-                        error=f"rate_limit: wait {e.wait_seconds}s",
-                        duration_seconds=duration,
-                    )
-
             except NetworkError as e:
                 # Network errors - can retry
-                duration = (datetime.now(timezone.utc) - start_time).total_seconds()
-                self.logger.error(
+                self._report_failure(
+                    log,
                     "Network error during fetch",
-                    extra={
-                        "correlation_id": correlation_id,
-                        "error_type": "network_error",
-                        "chat": chat,
-                        "retry_count": e.retry_count,
-                        "worker_id": self.worker_id,
-                        "duration_seconds": round(duration, 2),
-                        "status": "failed",
-                    },
-                    exc_info=True,
+                    chat=chat,
+                    date=date_str or fetch_date,
+                    error_type="network_error",
+                    error=f"network_error: {str(e)}",
+                    duration=time.monotonic() - start_time,
+                    retry_count=e.retry_count,
                 )
 
-                if self.event_publisher:
-                    self.event_publisher.publish_fetch_failed(
-                        chat=chat,
-                        date=date_str or fetch_date,
-                        error=f"network_error: {str(e)}",
-                        duration_seconds=duration,
-                    )
-
             except ChatNotFoundError as e:
                 # Chat doesn't exist - don't retry
-                duration = (datetime.utcnow() - start_time).total_seconds()
-                self.logger.error(
+                self._report_failure(
+                    log,
                     "Chat not found",
-                    extra={
-                        "correlation_id": correlation_id,
-                        "error_type": "chat_not_found",
-                        "chat": chat,
-                        "worker_id": self.worker_id,
-                        "duration_seconds": round(duration, 2),
-                        "status": "failed",
-                    },
-                    exc_info=True,
+                    chat=chat,
+                    date=date_str or fetch_date,
+                    error_type="chat_not_found",
+                    error=f"chat_not_found: {str(e)}",
+                    duration=time.monotonic() - start_time,
                 )
 
-                if self.event_publisher:
-                    self.event_publisher.publish_fetch_failed(
-                        chat=chat,
-                        date=date_str or fetch_date,
-                        error=f"chat_not_found: {str(e)}",
-                        duration_seconds=duration,
-                    )
-
             except Exception as e:
                 # Unknown errors - log with full context
-                duration = (datetime.utcnow() - start_time).total_seconds()
-                self.logger.error(
+                self._report_failure(
+                    log,
                     "Unexpected error during fetch",
-                    extra={
-                        "correlation_id": correlation_id,
-                        "error_type": "unknown_error",
-                        "chat": chat,
-                        "error_class": type(e).__name__,
-                        "worker_id": self.worker_id,
-                        "duration_seconds": round(duration, 2),
-                        "status": "failed",
-                    },
-                    exc_info=True,
+                    chat=chat,
+                    date=date_str or fetch_date,
+                    error_type="unknown_error",
+                    error=f"{type(e).__name__}: {str(e)}",
+                    duration=time.monotonic() - start_time,
+                    error_class=type(e).__name__,
                 )
 
-                if self.event_publisher:
-                    self.event_publisher.publish_fetch_failed(
-                        chat=chat,
-                        date=date_str or fetch_date,
-                        error=f"{type(e).__name__}: {str(e)}",
-                        duration_seconds=duration,
-                    )
+    def _report_failure(
+        self,
+        log: logging.LoggerAdapter,
+        message: str,
+        *,
+        chat: str,
+        date: str,
+        error_type: str,
+        error: str,
+        duration: float,
+        level: int = logging.ERROR,
+        status: str = "failed",
+        exc_info: bool = True,
+        **context: Any,
+    ) -> None:
+        """Log a failed fetch command and publish its fetch_failed event.
+
+        Must be called from an ``except`` block when ``exc_info`` is True.
+
+        Args:
+            log: Command-scoped logger adapter (correlation/worker/chat)
+            message: Log message
+            chat: Chat identifier
+            date: Date the failure is reported for (YYYY-MM-DD)
+            error_type: Short error category for the log record
+            error: Error string carried by the fetch_failed event
+            duration: Seconds elapsed since the command started
+            level: Log level
+            status: Status field of the log record
+            exc_info: Whether to attach the active exception to the record
+            **context: Extra error-specific log fields
+        """
+        log.log(
+            level,
+            message,
+            extra={
+                "error_type": error_type,
+                **context,
+                "duration_seconds": round(duration, 2),
+                "status": status,
+            },
+            exc_info=exc_info,
+        )
+
+        if self.event_publisher:
+            self.event_publisher.publish_fetch_failed(
+                chat=chat,
+                date=date,
+                error=error,
+                duration_seconds=duration,
+            )
+
+    async def _max_flood_wait(self) -> int:
+        """Return the longest FloodWait to sleep through for the next fetch.
+
+        While other commands are waiting in the queue, long sleeps would
+        starve them, so the limit drops to ``flood_wait_defer_threshold``
+        and longer waits surface as FloodWaitError (see ``_maybe_defer``).
+        The queue depth is only read when deferral is enabled, off the loop.
+        """
+        limit = self.config.max_flood_wait_seconds
+        threshold = self.config.flood_wait_defer_threshold
+        if (
+            threshold > 0
+            and self.command_subscriber is not None
+            and await self.command_subscriber.queue_depth_async() > 0
+        ):
+            return min(limit, threshold)
+        return limit
+
+    def _maybe_defer(self, command: dict[str, Any], wait_seconds: int) -> bool:
+        """Re-queue a rate-limited command after its FloodWait, if enabled.
+
+        Returns:
+            True if the command was handed to the delayed set
+        """
+        threshold = self.config.flood_wait_defer_threshold
+        if (
+            threshold <= 0
+            or wait_seconds <= threshold
+            or self.command_subscriber is None
+        ):
+            return False
+        return self.command_subscriber.defer_command(command, wait_seconds)
 
     async def _run_with_retries(  # noqa: C901
         self,
@@ -411,14 +703,16 @@ class FetcherDaemon:
         Hooks for metrics/logging are invoked on retry/success/failure events.
         """
         retried_flag = {"value": False}
+        chat_lbl = chat_label(chat)
 
         def on_retry(attempt: int, delay: float, exc: BaseException) -> None:
             # Count retry by reason and mark that success will be "after retry"
             retried_flag["value"] = True
-            reason = type(exc).__name__.lower()
+            exc_type = type(exc)
+            reason = _RETRY_REASONS.get(exc_type) or exc_type.__name__.lower()
             with contextlib.suppress(Exception):
                 fetch_retries_total.labels(
-                    chat=chat, date=date, reason=reason, worker=self.worker_id
+                    chat=chat_lbl, reason=reason, worker=self.worker_id
                 ).inc()
             self.logger.warning(
                 "Retrying operation",
@@ -427,7 +721,8 @@ class FetcherDaemon:
                     "chat": chat,
                     "date": date,
                     "attempt": attempt,
-                    "sleep_seconds": round(delay, 2),
+                    # Actual sampled (decorrelated-jitter) sleep before next try
+                    "sleep_seconds": round(delay, 3),
                     "worker_id": self.worker_id,
                     "error_type": reason,
                 },
@@ -437,10 +732,10 @@ class FetcherDaemon:
             # Observe floodwait and increment retries counter
             with contextlib.suppress(Exception):
                 floodwait_wait_seconds.labels(
-                    chat=chat, date=date, worker=self.worker_id
+                    chat=chat_lbl, worker=self.worker_id
                 ).observe(wait_seconds)
                 fetch_retries_total.labels(
-                    chat=chat, date=date, reason="floodwait", worker=self.worker_id
+                    chat=chat_lbl, reason="floodwait", worker=self.worker_id
                 ).inc()
             self.logger.warning(
                 "FloodWait encountered, sleeping",
@@ -455,6 +750,7 @@ class FetcherDaemon:
                 },
             )
 
+        max_flood_wait = await self._max_flood_wait()
         try:
             result = await safe_operation(
                 op,
@@ -464,25 +760,25 @@ class FetcherDaemon:
                 max_delay=max(1.0, self.config.retry_backoff_factor * 4),
                 jitter=True,
                 retry_on=(NetworkError,),
-                max_flood_wait=600,
+                max_flood_wait=max_flood_wait,
                 operation_name="fetch_single_chat",
                 on_retry=on_retry,
                 on_flood=on_flood,
             )
         except ChatNotFoundError:
             fetch_errors_total.labels(
-                chat=chat, date=date, error_type="chat_not_found", worker=self.worker_id
+                chat=chat_lbl, error_type="chat_not_found", worker=self.worker_id
             ).inc()
             raise
         except TelegramAuthError:
             fetch_errors_total.labels(
-                chat=chat, date=date, error_type="auth_error", worker=self.worker_id
+                chat=chat_lbl, error_type="auth_error", worker=self.worker_id
             ).inc()
             raise
         except Exception as e:
             # Unknown error
             fetch_errors_total.labels(
-                chat=chat, date=date, error_type=type(e).__name__, worker=self.worker_id
+                chat=chat_lbl, error_type=type(e).__name__, worker=self.worker_id
             ).inc()
             raise
 
@@ -490,14 +786,13 @@ class FetcherDaemon:
         # If there were retries, add a synthetic success_after_retry
         try:
             result_typed = cast(dict[str, Any], result)
-            fetch_messages_total.labels(
-                chat=chat, date=date, worker=self.worker_id
-            ).inc(result_typed.get("message_count", 0))
+            fetch_messages_total.labels(chat=chat_lbl, worker=self.worker_id).inc(
+                result_typed.get("message_count", 0)
+            )
             if retried_flag["value"]:
                 with contextlib.suppress(Exception):
                     fetch_retries_total.labels(
-                        chat=chat,
-                        date=date,
+                        chat=chat_lbl,
                         reason="success_after_retry",
                         worker=self.worker_id,
                     ).inc()
@@ -536,21 +831,15 @@ async def main() -> int:
     # Create and start daemon
     daemon = FetcherDaemon(config)
 
+    # SIGINT/SIGTERM are handled by the loop's signal handlers (see start())
     try:
         await daemon.start()
         return 0
-
-    except KeyboardInterrupt:
-        print("\nInterrupted by user")
-        return 0
-    except Exception as e:
-        print(f"Fatal error in daemon: {e}", file=sys.stderr)
-        import traceback
-
-        traceback.print_exc()
+    except Exception:
+        daemon.logger.critical("Fatal error in daemon", exc_info=True)
         return 1
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    exit_code = run_event_loop(main())
     sys.exit(exit_code)
@@ -6,12 +6,15 @@ Builds and provides core services and use-cases to keep facades thin.
 from __future__ import annotations
 
 from contextlib import suppress
+from dataclasses import replace
+from functools import cached_property, lru_cache
 from typing import Any, Awaitable, Callable, Optional, cast
 
 from telethon import TelegramClient
 from telethon.hints import Entity
 
 from src.core.config import FetcherConfig
+from src.models.command import FetchRequest
 from src.models.schemas import SourceInfo
 from src.observability.metrics import ensure_metrics_server
 from src.observability.metrics_adapter import (
@@ -20,7 +23,6 @@ from src.observability.metrics_adapter import (
     PrometheusMetricsAdapter,
 )
 from src.repositories.message_repository import MessageRepository
-from src.repositories.mongo_repository import MongoMessageRepository
 from src.repositories.protocols import MessageRepositoryProtocol
 from src.services.command_subscriber import CommandSubscriber
 from src.services.event_publisher import EventPublisher, EventPublisherProtocol
@@ -43,66 +45,161 @@ from src.services.usecases.fetch_date_range import (
     FetchDateRangeDeps,
     FetchDateRangeUseCase,
 )
+from src.utils.correlation import ensure_correlation_id
+
+
+def _parse_command(command_data: dict[str, Any]) -> Optional[FetchRequest]:
+    """Parse a decoded queue command into a FetchRequest.
+
+    Returns None for unsupported commands (validation is done in the
+    subscriber as well) or when no target chat is given.
+    """
+    if command_data.get("command") != "fetch":
+        return None
+    chat = command_data.get("chat")
+    if not chat:
+        return None
+    return FetchRequest(str(chat), command_data.get("date"))
 
 
 class Container:
-    """Container building all primary services for the fetcher app."""
+    """Container building all primary services for the fetcher app.
+
+    Services are built lazily on first use (``cached_property``), so commands
+    that only need a subset (e.g. ``listen`` vs ``single``) skip the rest.
+    Entry points share one wired graph per process via :meth:`instance`.
+    """
+
+    _instance: Optional[Container] = None
+
+    def __init__(
+        self, *, config: FetcherConfig, redis_pool: Optional[Any] = None
+    ) -> None:
+        """Store configuration; components are wired on first access.
 
-    def __init__(self, *, config: FetcherConfig) -> None:
-        """Build and wire core components from configuration."""
+        Args:
+            config: Application configuration
+            redis_pool: Optional Redis connection pool owned by the caller
+                (the daemon); the event publisher borrows from it instead of
+                opening its own connections
+        """
         self._config = config
+        self._redis_pool = redis_pool
+        # Strategy label last pushed to the date-range processor
+        self._last_strategy_name: Optional[str] = None
+
+    @classmethod
+    def instance(
+        cls, config: FetcherConfig, *, redis_pool: Optional[Any] = None
+    ) -> Container:
+        """Return the process-wide container for ``config``.
+
+        The first call builds the container; later calls with the same config
+        object reuse it (and its Redis pools, session and use-cases). A
+        different config object replaces the shared instance.
+
+        Args:
+            config: Application configuration
+            redis_pool: Optional shared Redis pool, used when the container
+                is built by this call
 
-        # Session
-        self._session = SessionManager(
+        Returns:
+            Shared Container instance
+        """
+        inst = cls._instance
+        if inst is None or inst._config is not config:
+            inst = cls._instance = cls(config=config, redis_pool=redis_pool)
+        return inst
+
+    @classmethod
+    def reset(cls) -> None:
+        """Forget the shared instance (for tests and reconfiguration)."""
+        cls._instance = None
+
+    # Session
+    @cached_property
+    def _session(self) -> SessionManager:
+        config = self._config
+        return SessionManager(
             api_id=config.telegram_api_id,
             api_hash=config.telegram_api_hash,
             phone=config.telegram_phone,
             session_dir=config.session_dir,
         )
 
-        # Repository and post-processing
+    # Repository and post-processing
+    @cached_property
+    def _repository(self) -> MessageRepositoryProtocol:
+        config = self._config
         if config.storage_backend == "mongo":
-            self._repository: MessageRepositoryProtocol = MongoMessageRepository(
+            # Deferred: only the mongo backend pays for the pymongo import
+            from src.repositories.mongo_repository import MongoMessageRepository
+
+            return MongoMessageRepository(
                 url=config.mongo_url,
                 db=config.mongo_db,
                 collection=config.mongo_collection,
             )
-        else:
-            self._repository = MessageRepository(
-                config.data_dir, schema_version=config.data_schema_version
-            )
-        self._finalizer = ResultFinalizer(self._repository)
+        return MessageRepository(
+            config.data_dir, schema_version=config.data_schema_version
+        )
 
-        # Events and metrics
-        self._event_publisher: EventPublisherProtocol = EventPublisher(
+    @cached_property
+    def _finalizer(self) -> ResultFinalizer:
+        return ResultFinalizer(self._repository)
+
+    # Events and metrics
+    @cached_property
+    def _event_publisher(self) -> EventPublisherProtocol:
+        config = self._config
+        return EventPublisher(
             redis_url=config.redis_url,
             redis_password=config.redis_password,
             enabled=config.enable_events,
             events_channel=config.events_channel,
             service_name=config.service_name,
+            max_retry_attempts=config.max_retry_attempts,
+            retry_backoff_factor=config.retry_backoff_factor,
+            fire_and_forget=config.events_fire_and_forget,
+            connection_pool=self._redis_pool,
         )
-        self._metrics: MetricsAdapter = cast(
+
+    @cached_property
+    def _metrics(self) -> MetricsAdapter:
+        return cast(
             MetricsAdapter,
             (
                 PrometheusMetricsAdapter()
-                if config.enable_metrics
+                if self._config.enable_metrics
                 else NoopMetricsAdapter()
             ),
         )
 
-        # Progress
-        self._progress_tracker = ProgressTracker(
-            config.progress_file, schema_version=config.progress_schema_version
+    # Progress
+    @cached_property
+    def _progress_tracker(self) -> ProgressTracker:
+        return ProgressTracker(
+            self._config.progress_file,
+            schema_version=self._config.progress_schema_version,
         )
-        self._progress = ProgressService(
+
+    @cached_property
+    def _progress(self) -> ProgressService:
+        return ProgressService(
             metrics=self._metrics,
             event_publisher=self._event_publisher,
-            enable_events=config.enable_progress_events,
+            enable_events=self._config.enable_progress_events,
         )
 
-        # Mapping, preprocessing, gateway
-        self._source_mapper = SourceInfoMapper()
-        self._preprocessor = MessagePreprocessor(
+    # Mapping, preprocessing, gateway
+    @cached_property
+    def _source_mapper(self) -> SourceInfoMapper:
+        return SourceInfoMapper()
+
+    @cached_property
+    def _preprocessor(self) -> MessagePreprocessor:
+        config = self._config
+        return MessagePreprocessor(
             link_normalize_enabled=config.link_normalize_enabled,
             token_estimate_enabled=config.token_estimate_enabled,
             message_classifier_enabled=config.message_classifier_enabled,
@@ -117,25 +214,97 @@ class Container:
             classify_message_fn=pp_strategies.classify_message,
             detect_language_fn=pp_strategies.detect_language,
         )
-        self._telegram_gateway = TelegramGateway()
-        self._message_extractor = MessageExtractor(
+
+    @cached_property
+    def _telegram_gateway(self) -> TelegramGateway:
+        return TelegramGateway()
+
+    @cached_property
+    def _message_extractor(self) -> MessageExtractor:
+        return MessageExtractor(
             self._telegram_gateway,
-            comments_limit=config.comments_limit_per_message,
+            comments_limit=self._config.comments_limit_per_message,
         )
 
-        # Iteration helper and strategy factory
-        self._date_range_processor = DateRangeProcessor(
+    # Iteration helper and strategy factory
+    @cached_property
+    def _date_range_processor(self) -> DateRangeProcessor:
+        return DateRangeProcessor(
             config=self._config,
             event_publisher=self._event_publisher,
             metrics=self._metrics,
             strategy_name=self._config.fetch_mode,
         )
-        self._strategy_factory = StrategyFactory(self._config)
+
+    @cached_property
+    def _strategy_factory(self) -> StrategyFactory:
+        return StrategyFactory(self._config)
+
+    @cached_property
+    def _create_strategy(
+        self,
+    ) -> Callable[..., StrategyProtocol]:
+        # Strategies hold no per-run state, so one instance per (date, mode)
+        # is shared by every command asking for it
+        return lru_cache(maxsize=32)(self._strategy_factory.create)
+
+    def reset_strategy_cache(self) -> None:
+        """Drop memoized strategies (call after changing fetch configuration)."""
+        self.__dict__.pop("_create_strategy", None)
+
+    # Use-case graph: stateless after construction, composed once and reused
+    # by every command instead of being rebuilt per call
+    @cached_property
+    def _finalization_orchestrator(self) -> FinalizationOrchestrator:
+        return FinalizationOrchestrator(
+            finalizer=self._finalizer,
+            progress_service=self._progress,
+            schema_version=self._config.data_schema_version,
+            preprocessing_version=self._config.preprocessing_version,
+        )
+
+    @cached_property
+    def _date_range_deps(self) -> FetchDateRangeDeps:
+        return FetchDateRangeDeps(
+            config=self._config,
+            repository=self._repository,
+            preprocessor=self._preprocessor,
+            source_mapper=self._source_mapper,
+            date_range_processor=self._date_range_processor,
+            progress_service=self._progress,
+            progress_tracker=self._progress_tracker,
+            finalization_orchestrator=self._finalization_orchestrator,
+            extract_message_data=self._message_extractor.extract,
+        )
+
+    @cached_property
+    def _date_range_use_case(self) -> FetchDateRangeUseCase:
+        return FetchDateRangeUseCase(self._date_range_deps)
+
+    @cached_property
+    def _chat_deps(self) -> FetchChatDeps:
+        return FetchChatDeps(
+            config=self._config,
+            telegram_gateway=self._telegram_gateway,
+            source_mapper=self._source_mapper,
+            date_range_use_case=self._date_range_use_case,
+        )
+
+    @cached_property
+    def _chat_use_case(self) -> FetchChatUseCase:
+        return FetchChatUseCase(self._chat_deps)
+
+    @cached_property
+    def _fetch_runner(self) -> FetchRunner:
+        deps = FetchRunnerDeps(
+            config=self._config,
+            session_manager=self._session,
+            chat_use_case=self._chat_use_case,
+        )
+        return FetchRunner(deps)
 
     def initialize_runtime(self) -> None:
         """Perform side-effectful initialization (connect events, metrics server)."""
-        from contextlib import suppress
-
         with suppress(Exception):
             self._event_publisher.connect()
         if self._config.enable_metrics and self._config.metrics_mode in (
@@ -145,18 +314,21 @@ class Container:
             with suppress(Exception):
                 ensure_metrics_server(self._config.metrics_port)
 
+    async def provide_client(self) -> TelegramClient:
+        """Connect the Telegram client up front and keep it for later commands.
+
+        Long-running workers call this once at startup so each command reuses
+        the live connection instead of paying a connect/auth handshake.
+        """
+        return await self._session.open()
+
     def provide_telegram_gateway(self) -> TelegramGateway:
         """Provide Telegram gateway instance."""
         return self._telegram_gateway
 
     def provide_finalization_orchestrator(self) -> FinalizationOrchestrator:
         """Provide finalization orchestrator instance."""
-        return FinalizationOrchestrator(
-            finalizer=self._finalizer,
-            progress_service=self._progress,
-            schema_version=self._config.data_schema_version,
-            preprocessing_version=self._config.preprocessing_version,
-        )
+        return self._finalization_orchestrator
 
     def provide_progress_service(self) -> ProgressService:
         """Provide progress service facade."""
@@ -166,12 +338,16 @@ class Container:
         """Provide Telegram session manager."""
         return self._session
 
-    def provide_strategy(self, date_str: Optional[str] = None) -> StrategyProtocol:
-        """Provide active fetch strategy based on config or explicit date."""
-        strategy = self._strategy_factory.create(date_str)
-        # keep processor labels in sync
-        with suppress(Exception):
-            self._date_range_processor.set_strategy_name(strategy.get_strategy_name())
+    def provide_strategy(
+        self, date_str: Optional[str] = None, *, mode: Optional[str] = None
+    ) -> StrategyProtocol:
+        """Provide active fetch strategy based on config or explicit date/mode."""
+        strategy = self._create_strategy(date_str, mode=mode)
+        # keep processor labels in sync (only when the label actually changes)
+        name = strategy.get_strategy_name()
+        if name != self._last_strategy_name:
+            self._date_range_processor.set_strategy_name(name)
+            self._last_strategy_name = name
         return strategy
 
     def provide_progress_tracker(self) -> ProgressTracker:
@@ -204,24 +380,15 @@ class Container:
                 Telethon message
 
         Returns:
-            Configured FetchDateRangeUseCase
+            Configured FetchDateRangeUseCase (shared instance for the default
+            extractor)
         """
-        deps = FetchDateRangeDeps(
-            config=self._config,
-            repository=self._repository,
-            preprocessor=self._preprocessor,
-            source_mapper=self._source_mapper,
-            date_range_processor=self._date_range_processor,
-            progress_service=self._progress,
-            progress_tracker=self._progress_tracker,
-            finalization_orchestrator=self.provide_finalization_orchestrator(),
-            extract_message_data=(
-                extract_message_data
-                if extract_message_data is not None
-                else self._message_extractor.extract
-            ),
+        if extract_message_data is None:
+            return self._date_range_use_case
+        # Only the extractor differs: clone the shared deps instead of rewiring
+        return FetchDateRangeUseCase(
+            replace(self._date_range_deps, extract_message_data=extract_message_data)
         )
-        return FetchDateRangeUseCase(deps)
 
     def provide_fetch_chat_use_case(
         self, *, date_range_use_case: FetchDateRangeUseCase
@@ -230,14 +397,16 @@ class Container:
 
         Args:
             date_range_use_case: Previously provisioned FetchDateRangeUseCase
+
+        Returns:
+            The shared FetchChatUseCase for the default date-range use-case,
+            otherwise a new one around ``date_range_use_case``
         """
-        deps = FetchChatDeps(
-            config=self._config,
-            telegram_gateway=self.provide_telegram_gateway(),
-            source_mapper=self._source_mapper,
-            date_range_use_case=date_range_use_case,
+        if date_range_use_case is self._date_range_use_case:
+            return self._chat_use_case
+        return FetchChatUseCase(
+            replace(self._chat_deps, date_range_use_case=date_range_use_case)
         )
-        return FetchChatUseCase(deps)
 
     def provide_message_extractor(self) -> MessageExtractor:
         """Provide message extractor for core/message fields and comments."""
@@ -245,17 +414,10 @@ class Container:
 
     def provide_fetch_runner(self) -> FetchRunner:
         """Provide FetchRunner coordinator with composed dependencies."""
-        deps = FetchRunnerDeps(
-            config=self._config,
-            session_manager=self._session,
-            chat_use_case=self.provide_fetch_chat_use_case(
-                date_range_use_case=self.provide_fetch_date_range_use_case()
-            ),
-        )
-        return FetchRunner(deps)
+        return self._fetch_runner
 
     def provide_command_handler(self) -> Callable[[dict[str, Any]], Awaitable[None]]:
-        """Provide default async handler for Redis commands.
+        """Provide default async handler for Redis commands (built once).
 
         Supported command JSON keys:
         - command: must be 'fetch'
@@ -263,26 +425,21 @@ class Container:
         - date: optional date string YYYY-MM-DD to influence strategy
         Other keys are currently ignored.
         """
+        return self._command_handler
 
-        async def _handler(command_data: dict[str, Any]) -> None:
-            # Lazy imports to avoid any potential import cycles at module import time
-            from src.utils.correlation import ensure_correlation_id
+    @cached_property
+    def _command_handler(self) -> Callable[[dict[str, Any]], Awaitable[None]]:
+        runner = self._fetch_runner
 
-            if command_data.get("command") != "fetch":
-                # Ignore unsupported commands; validation is done in subscriber as well
-                return
-
-            chat = command_data.get("chat")
-            date_str = command_data.get("date")
-            if not chat:
-                # Nothing to do without a target chat
+        async def _handler(command_data: dict[str, Any]) -> None:
+            req = _parse_command(command_data)
+            if req is None:
                 return
 
-            strategy = self.provide_strategy(date_str)
-            runner = self.provide_fetch_runner()
+            strategy = self.provide_strategy(req.date, mode=req.fetch_mode)
             await runner.run_single(
                 strategy=strategy,
-                chat_identifier=str(chat),
+                chat_identifier=req.chat,
                 correlation_id=ensure_correlation_id(),
             )
 
@@ -306,5 +463,8 @@ class Container:
             worker_id=worker_id or self._config.service_name,
             commands_queue=self._config.commands_queue,
             blpop_timeout=self._config.commands_blpop_timeout,
+            max_blpop_timeout=self._config.commands_blpop_max_timeout,
+            ack_enabled=self._config.commands_ack_enabled,
+            prefetch_count=self._config.commands_prefetch_count,
             metrics=self._metrics,
         )
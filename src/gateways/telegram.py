@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import AsyncIterator, cast
+from typing import AsyncIterator
 
 from telethon import TelegramClient
 from telethon.tl.custom import Message as TelethonMessage
@@ -13,6 +13,8 @@ from src.gateways.telegram_protocols import TelegramGatewayProtocol
 class TelethonGateway(TelegramGatewayProtocol):
     """Adapter over Telethon client to provide gateway operations."""
 
+    __slots__ = ("_client",)
+
     def __init__(self, client: TelegramClient) -> None:
         """Initialize gateway with a Telethon client instance.
 
@@ -34,9 +36,6 @@ class TelethonGateway(TelegramGatewayProtocol):
             limit: Max number of comments to iterate
         """
         # Delegate to Telethon's iter_messages with reply_to filter
-        return cast(
-            AsyncIterator[TelethonMessage],
-            self._client.iter_messages(
-                channel_id, reply_to=reply_to_max_id, limit=limit
-            ),
+        return self._client.iter_messages(  # type: ignore[no-any-return]
+            channel_id, reply_to=reply_to_max_id, limit=limit
         )
@@ -21,6 +21,9 @@ class TelegramGatewayProtocol(Protocol):
     The full gateway surface can be expanded iteratively.
     """
 
+    # Lets slotted adapters that subclass the port stay dict-free
+    __slots__ = ()
+
     async def extract_reactions(self, message: TelethonMessage) -> list[Reaction]:
         """Extract reactions from a message.
 
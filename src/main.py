@@ -6,15 +6,15 @@ environment-based configuration selectively.
 """
 
 import argparse
-import asyncio
 import contextlib
 import sys
+import traceback
 
 from pydantic import ValidationError
 
 from src.core.config import FetcherConfig
-from src.di.container import Container
 from src.observability.logging_config import get_logger, setup_logging
+from src.utils.event_loop import run as run_event_loop
 
 
 def _build_parser() -> argparse.ArgumentParser:
@@ -101,57 +101,107 @@ def _build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+# CLI arguments that override FetcherConfig fields, per subcommand
+_CONFIG_OVERRIDE_KEYS: dict[str, tuple[str, ...]] = {
+    "run": ("fetch_mode", "fetch_date", "fetch_start", "fetch_end", "telegram_chats"),
+    "listen": ("commands_queue", "commands_blpop_timeout"),
+}
+
+
 def _load_config(command: str, args: argparse.Namespace) -> FetcherConfig | None:
     """Load configuration from environment and apply CLI overrides.
 
     Returns None if validation/loading failed (errors are printed).
     """
     try:
-        overrides = {}
-        if command == "run":
-            overrides = {
-                **{
-                    k: v
-                    for k, v in {
-                        "fetch_mode": getattr(args, "fetch_mode", None),
-                        "fetch_date": getattr(args, "fetch_date", None),
-                        "fetch_start": getattr(args, "fetch_start", None),
-                        "fetch_end": getattr(args, "fetch_end", None),
-                        "telegram_chats": getattr(args, "telegram_chats", None),
-                    }.items()
-                    if v is not None
-                }
-            }
-        elif command == "listen":
-            overrides = {
-                **{
-                    k: v
-                    for k, v in {
-                        "commands_queue": getattr(args, "commands_queue", None),
-                        "commands_blpop_timeout": getattr(
-                            args, "commands_blpop_timeout", None
-                        ),
-                    }.items()
-                    if v is not None
-                }
-            }
+        overrides = {
+            k: v
+            for k in _CONFIG_OVERRIDE_KEYS.get(command, ())
+            if (v := getattr(args, k, None)) is not None
+        }
         config = FetcherConfig(**overrides)
         config.validate_mode_requirements()
         return config
     except ValidationError as e:  # pragma: no cover - args parsing paths
         print(f"Configuration validation error:\n{e}", file=sys.stderr)
-        import traceback
-
         traceback.print_exc()
         return None
     except Exception as e:  # pragma: no cover - unexpected env issues
         print(f"Failed to load configuration: {e}", file=sys.stderr)
-        import traceback
-
         traceback.print_exc()
         return None
 
 
+def _pushgateway_enabled(config: FetcherConfig) -> bool:
+    """Return True if metrics should be pushed to a Pushgateway after a run."""
+    return bool(
+        config.enable_metrics
+        and config.pushgateway_url
+        and config.metrics_mode in ("push", "both")
+    )
+
+
+def _push_metrics(config: FetcherConfig) -> None:
+    """Push the default registry to the Pushgateway (best-effort)."""
+    logger = get_logger(__name__)
+    try:
+        # Imported only when pushing; other runs never touch the push client
+        from prometheus_client import REGISTRY, push_to_gateway
+
+        from src.observability.metrics import WORKER_ID
+
+        assert config.pushgateway_url is not None
+        # Same id as the `worker` label of the pushed series
+        instance = WORKER_ID
+        # Push default registry as is; group by job and instance
+        push_to_gateway(
+            config.pushgateway_url.replace("http://", "").replace("https://", ""),
+            job=config.service_name,
+            registry=REGISTRY,
+            grouping_key={"instance": instance},
+        )
+        logger.info(
+            "Metrics pushed to Pushgateway",
+            extra={
+                "pushgateway_url": config.pushgateway_url,
+                "instance": instance,
+            },
+        )
+    except Exception:
+        logger.debug("Metrics push failed (non-fatal)", exc_info=True)
+
+
+async def _run_listen(args: argparse.Namespace, config: FetcherConfig) -> None:
+    """Consume Redis commands until stopped, sharing one Telegram client."""
+    # Local import: argument parsing and --help skip the Telethon graph
+    from src.di.container import Container
+
+    logger = get_logger(__name__)
+    container = Container.instance(config)
+    container.initialize_runtime()
+    subscriber = container.provide_command_subscriber(
+        worker_id=getattr(args, "worker_id", None)
+    )
+    subscriber.connect()
+    try:
+        # Connect Telegram once; commands reuse the live client
+        await container.provide_client()
+    except Exception:
+        logger.warning(
+            "Telegram pre-connect failed; connecting per command", exc_info=True
+        )
+    try:
+        await subscriber.listen()
+    finally:
+        # Ensure proper disconnect on exit
+        with contextlib.suppress(Exception):
+            subscriber.stop()
+        with contextlib.suppress(Exception):
+            subscriber.disconnect()
+        with contextlib.suppress(Exception):
+            await container.provide_session_manager().close()
+
+
 async def _run_command(
     command: str, args: argparse.Namespace, config: FetcherConfig
 ) -> int:
@@ -174,23 +224,13 @@ async def _run_command(
         },
     )
 
+    # Optionally push metrics to Pushgateway for one-shot runs (never listen)
+    push_metrics = command != "listen" and _pushgateway_enabled(config)
+
     try:
         if command == "listen":
             # Long-running worker listening to Redis queue
-            container = Container(config=config)
-            container.initialize_runtime()
-            subscriber = container.provide_command_subscriber(
-                worker_id=getattr(args, "worker_id", None)
-            )
-            subscriber.connect()
-            try:
-                await subscriber.listen()
-            finally:
-                # Ensure proper disconnect on exit
-                with contextlib.suppress(Exception):
-                    subscriber.stop()
-                with contextlib.suppress(Exception):
-                    subscriber.disconnect()
+            await _run_listen(args, config)
         else:
             # Local import to keep CLI type-check lightweight
             from src.services.fetcher_service import FetcherService as _FetcherService
@@ -213,37 +253,8 @@ async def _run_command(
 
         logger.info("Fetcher service completed successfully")
 
-        # Optionally push metrics to Pushgateway for one-shot runs
-        try:
-            if (
-                config.enable_metrics
-                and config.pushgateway_url
-                and config.metrics_mode in ("push", "both")
-                and command != "listen"
-            ):
-                import os
-
-                from prometheus_client import REGISTRY, push_to_gateway
-
-                instance = os.getenv("HOSTNAME", "fetcher-1")
-                # Push default registry as is; group by job and instance
-                push_to_gateway(
-                    config.pushgateway_url.replace("http://", "").replace(
-                        "https://", ""
-                    ),
-                    job=config.service_name,
-                    registry=REGISTRY,
-                    grouping_key={"instance": instance},
-                )
-                logger.info(
-                    "Metrics pushed to Pushgateway",
-                    extra={
-                        "pushgateway_url": config.pushgateway_url,
-                        "instance": instance,
-                    },
-                )
-        except Exception:
-            logger.debug("Metrics push failed (non-fatal)", exc_info=True)
+        if push_metrics:
+            _push_metrics(config)
         return 0
     except KeyboardInterrupt:
         logger.info("Interrupted by user")
@@ -280,10 +291,9 @@ def cli() -> None:
 
     Wraps the async main() to integrate with setuptools/PEP 621 scripts.
     """
-    exit_code = asyncio.run(main())
+    exit_code = run_event_loop(main())
     sys.exit(exit_code)
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
-    sys.exit(exit_code)
+    cli()
@@ -1,18 +1,26 @@
 """Data models package.
 
 Exports all Pydantic models for message schemas and configuration.
+
+Exports are resolved lazily (PEP 562): importing a submodule such as
+``src.models.command`` does not build every schema model up front.
 """
 
-from src.models.schemas import (
-    ForwardInfo,
-    Message,
-    MessageCollection,
-    ProgressEntry,
-    ProgressFile,
-    Reaction,
-    Sender,
-    SourceInfo,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.models.schemas import (
+        ForwardInfo,
+        Message,
+        MessageCollection,
+        ProgressEntry,
+        ProgressFile,
+        Reaction,
+        Sender,
+        SourceInfo,
+    )
 
 __all__ = [
     "Message",
@@ -24,3 +32,18 @@ __all__ = [
     "ProgressEntry",
     "ProgressFile",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import ``src.models.schemas`` on first access to one of its exports."""
+    if name in __all__:
+        from src.models import schemas
+
+        value = getattr(schemas, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
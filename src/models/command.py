@@ -4,14 +4,26 @@ This module defines strongly-typed command models for validating
 and processing fetch requests from Redis queues.
 """
 
+import re
 import uuid
+from dataclasses import dataclass
 from datetime import date as Date
 from datetime import datetime, timedelta
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
+# Numeric chat/channel IDs, optionally negative (e.g. "-1001234567890")
+_NUMERIC_CHAT_RE = re.compile(r"-*\d+")
+
+
+@lru_cache(maxsize=4096)
+def _iso(d: Date) -> str:
+    """Memoized ``date.isoformat()``; commands keep formatting the same days."""
+    return d.isoformat()
+
 
 class FetchMode(str, Enum):
     """Supported fetch modes."""
@@ -28,6 +40,24 @@ class FetchStrategy(str, Enum):
     PER_DAY = "per_day"  # Fetch day by day
 
 
+@dataclass(slots=True, frozen=True)
+class FetchRequest:
+    """Per-call fetch parameters passed to FetcherService.
+
+    A plain slotted dataclass (no validation) built once per day of a daemon
+    command, so per-request overrides never touch the shared FetcherConfig.
+
+    Attributes:
+        chat: Chat identifier
+        date: Target date (YYYY-MM-DD) or None for the strategy default
+        fetch_mode: fetch_mode override (e.g. "date") or None to use config
+    """
+
+    chat: str
+    date: Optional[str] = None
+    fetch_mode: Optional[str] = None
+
+
 class FetchCommand(BaseModel):
     """Validated fetch command from Redis queue.
 
@@ -106,19 +136,19 @@ class FetchCommand(BaseModel):
     def normalize_chat(cls, v: str) -> str:
         """Normalize chat identifier (ensure @ prefix for usernames)."""
         v = v.strip()
-        # Don't add @ to numeric IDs or negative IDs
-        if v and not v.startswith("@") and not v.startswith("http"):
-            # Check if it's a numeric ID (possibly negative)
-            if v.lstrip("-").isdigit():
-                return v
-            return f"@{v}"
-        return v
+        # Usernames with @, links and numeric IDs (possibly negative) stay as-is
+        if not v or v[0] == "@" or v.startswith("http"):
+            return v
+        if _NUMERIC_CHAT_RE.fullmatch(v):
+            return v
+        return f"@{v}"
 
     def expand_dates(self) -> list[Date]:
         """Expand command into list of target dates.
 
         Returns:
-            List of dates to fetch, sorted chronologically
+            List of dates to fetch: ascending for ``range``, newest first
+            (yesterday backwards) for ``days``
 
         Raises:
             ValueError: If mode is invalid or required fields are missing
@@ -138,16 +168,23 @@ class FetchCommand(BaseModel):
             if self.from_date is None or self.to_date is None:
                 raise ValueError("mode=range requires both 'from' and 'to' fields")
 
-            dates = []
-            current = self.from_date
-            while current <= self.to_date:
-                dates.append(current)
-                current += timedelta(days=1)
-            return dates
+            start = self.from_date
+            span = (self.to_date - start).days + 1
+            return [start + timedelta(days=i) for i in range(span)]
 
         else:
             raise ValueError(f"Unknown mode: {self.mode}")
 
+    @property
+    def chat_name(self) -> str:
+        """Chat identifier without its leading ``@`` (used in output paths).
+
+        Derived on access: the model is mutable and ``model_copy`` carries
+        cached values over, so a cached name could outlive its ``chat``.
+        """
+        chat = self.chat
+        return chat[1:] if chat[:1] == "@" else chat
+
     def get_output_path(self, base_dir: str, target_date: Date) -> str:
         """Generate output file path for given date.
 
@@ -158,10 +195,10 @@ class FetchCommand(BaseModel):
         Returns:
             Path in format: base_dir/chat/YYYY/discussions_YYYY-MM-DD.json
         """
-        chat_name = self.chat.lstrip("@")
-        year = target_date.year
-        filename = f"discussions_{target_date.isoformat()}.json"
-        return f"{base_dir}/{chat_name}/{year}/{filename}"
+        return (
+            f"{base_dir}/{self.chat_name}/{target_date.year}/"
+            f"discussions_{_iso(target_date)}.json"
+        )
 
     def to_event_params(self) -> dict[str, Any]:
         """Convert command to event parameters dict.
@@ -169,25 +206,26 @@ class FetchCommand(BaseModel):
         Returns:
             Dictionary suitable for event publishing
         """
+        # str-valued enums: equal to and JSON-encoded as their plain values
         params: dict[str, Any] = {
-            "mode": self.mode.value,
-            "strategy": self.strategy.value,
+            "mode": self.mode,
+            "strategy": self.strategy,
             "force": self.force,
         }
 
-        if self.mode == FetchMode.DATE and self.date:
-            params["date"] = self.date.isoformat()
-        elif self.mode == FetchMode.DAYS and self.days:
-            params["days"] = self.days
-        elif (
-            self.mode == FetchMode.RANGE
-            and self.from_date is not None
-            and self.to_date is not None
-        ):
-            params["from"] = self.from_date.isoformat()
-            params["to"] = self.to_date.isoformat()
-
-        if self.limit:
+        match self.mode:
+            case FetchMode.DATE if self.date is not None:
+                params["date"] = _iso(self.date)
+            case FetchMode.DAYS if self.days is not None:
+                params["days"] = self.days
+            case FetchMode.RANGE if (
+                self.from_date is not None and self.to_date is not None
+            ):
+                params["from"] = _iso(self.from_date)
+                params["to"] = _iso(self.to_date)
+
+        # limit is validated as >= 1, so None is the only "unset" value
+        if self.limit is not None:
             params["limit"] = self.limit
 
         return params
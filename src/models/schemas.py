@@ -4,11 +4,14 @@ This module defines all data models used for message storage with
 strict validation and automatic serialization.
 """
 
+from bisect import bisect_left
 from datetime import datetime
 from typing import Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from src.utils import serialization
+
 
 class Reaction(BaseModel):
     """Single reaction to a message.
@@ -182,13 +185,26 @@ class MessageCollection(BaseModel):
         description="Timezone of message timestamps (default UTC)",
     )
     source_info: SourceInfo = Field(..., description="Source metadata")
-    senders: dict[str, str] = Field(
+    # Int keys in memory; JSON object keys are strings and are coerced on load
+    senders: dict[int, str] = Field(
         default_factory=dict, description="Mapping of sender_id to display_name"
     )
     messages: list[Message] = Field(
         default_factory=list, description="List of messages"
     )
 
+    def to_json_bytes(self) -> bytes:
+        """Encode the collection as indented UTF-8 JSON for storage.
+
+        Pydantic produces the JSON-compatible payload (its datetime and
+        nested-model formatting); orjson then encodes it straight to bytes
+        instead of going through the pure-Python indented ``json`` encoder.
+
+        Returns:
+            JSON document bytes
+        """
+        return serialization.dumps(self.model_dump(mode="json"), indent=True)
+
     def add_sender(self, sender_id: int, display_name: str) -> None:
         """Add or update sender information.
 
@@ -196,7 +212,11 @@ class MessageCollection(BaseModel):
             sender_id: Sender user/channel ID
             display_name: Sender display name
         """
-        self.senders[str(sender_id)] = display_name
+        self.senders[sender_id] = display_name
+
+    def senders_json(self) -> dict[str, str]:
+        """Return senders keyed by string IDs, as stored in JSON documents."""
+        return {str(k): v for k, v in self.senders.items()}
 
     def get_sender_name(self, sender_id: int) -> Optional[str]:
         """Get sender display name by ID.
@@ -207,7 +227,7 @@ class MessageCollection(BaseModel):
         Returns:
             Display name if found, None otherwise
         """
-        return self.senders.get(str(sender_id))
+        return self.senders.get(sender_id)
 
 
 class ProgressEntry(BaseModel):
@@ -229,12 +249,16 @@ class ProgressEntry(BaseModel):
     def mark_date_completed(self, date_str: str) -> None:
         """Mark a date as fully processed.
 
+        ``completed_dates`` is kept sorted, so the date is inserted in place
+        instead of re-sorting the whole list on every call.
+
         Args:
             date_str: Date in YYYY-MM-DD format
         """
-        if date_str not in self.completed_dates:
-            self.completed_dates.append(date_str)
-            self.completed_dates.sort()
+        dates = self.completed_dates
+        idx = bisect_left(dates, date_str)
+        if idx == len(dates) or dates[idx] != date_str:
+            dates.insert(idx, date_str)
 
 
 class ProgressFile(BaseModel):
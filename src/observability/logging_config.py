@@ -3,17 +3,25 @@
 Provides setup for both local logging (text/JSON) and remote logging to Loki
 for centralized observability.
 
-Adds a ContextFilter to inject core fields (service, environment, host,
-version, git_sha) into every record and supports optional Loki batching.
+Installs a LogRecord factory that gives every record the core fields
+(service, environment, host, version, git_sha) and supports optional Loki
+batching.
+
+``pythonjsonlogger`` and ``logging_loki`` are imported only when JSON output
+or a Loki URL is requested, so text-mode CLI runs do not pay for them.
 """
 
+import atexit
 import logging
 import os
 import socket
 import sys
-from typing import Optional
+import time
+from functools import lru_cache
+from queue import Queue
+from typing import Any, MutableMapping, Optional
 
-from pythonjsonlogger import jsonlogger
+from src.utils import serialization
 
 
 class _ExcludeLoggerFilter(logging.Filter):
@@ -32,68 +40,120 @@ class _ExcludeLoggerFilter(logging.Filter):
         return not any(name.startswith(p) for p in self._prefixes)
 
 
-class CustomJsonFormatter(jsonlogger.JsonFormatter):
-    """Custom JSON formatter with additional fields."""
+@lru_cache(maxsize=8)
+def _format_second(second: int, datefmt: str) -> str:
+    """``strftime`` for one wall-clock second; log bursts reuse the text."""
+    return time.strftime(datefmt, time.localtime(second))
 
-    def add_fields(
-        self, log_record: dict, record: logging.LogRecord, message_dict: dict
-    ) -> None:
-        """Add custom fields to log record.
 
-        Args:
-            log_record: Dictionary to be logged
-            record: Original LogRecord
-            message_dict: Message dictionary from format string
-        """
-        super().add_fields(log_record, record, message_dict)
+@lru_cache(maxsize=1)
+def _get_json_formatter_cls() -> type[logging.Formatter]:  # noqa: C901
+    """Build ``CustomJsonFormatter`` on first use (imports pythonjsonlogger)."""
+    from pythonjsonlogger import jsonlogger
 
-        # Add timestamp
-        log_record["timestamp"] = self.formatTime(record, self.datefmt)
+    class CustomJsonFormatter(jsonlogger.JsonFormatter):
+        """Custom JSON formatter with additional fields."""
 
-        # Add level name
-        log_record["level"] = record.levelname
+        # Unknown ``extra`` values (exceptions, objects) keep the library's
+        # str()/isoformat() fallbacks when encoded by orjson.
+        _encoder = jsonlogger.JsonEncoder()
 
-        # Add logger name
-        log_record["logger"] = record.name
+        def jsonify_log_record(self, log_record: dict) -> str:
+            """Serialize the record via orjson; stdlib ``json`` for odd payloads.
 
-        # Add thread info if available
-        if hasattr(record, "thread"):
-            log_record["thread"] = record.thread
+            orjson rejects non-``str`` keys and integers beyond 64 bits, so
+            those records fall back to the library encoder unchanged.
+            """
+            try:
+                return serialization.dumps(
+                    log_record, default=self._encoder.default
+                ).decode("utf-8")
+            except TypeError:
+                return super().jsonify_log_record(log_record)
 
-        # Add correlation_id if present in extra
-        if hasattr(record, "correlation_id"):
-            log_record["correlation_id"] = record.correlation_id
+        def formatTime(  # noqa: N802 - logging.Formatter API
+            self, record: logging.LogRecord, datefmt: Optional[str] = None
+        ) -> str:
+            """Format the record time, cached per second for explicit datefmt."""
+            if datefmt and self.converter is time.localtime:
+                return _format_second(int(record.created), datefmt)
+            return super().formatTime(record, datefmt)
 
-        # Include common context fields if present
-        for key in ("service", "environment", "host", "version", "git_sha"):
-            if hasattr(record, key):
-                log_record[key] = getattr(record, key)
+        def add_fields(
+            self, log_record: dict, record: logging.LogRecord, message_dict: dict
+        ) -> None:
+            """Add custom fields to log record.
 
+            Args:
+                log_record: Dictionary to be logged
+                record: Original LogRecord
+                message_dict: Message dictionary from format string
+            """
+            super().add_fields(log_record, record, message_dict)
 
-class _ContextFilter(logging.Filter):
-    """Inject default context fields into every log record if missing."""
+            # Add timestamp
+            log_record["timestamp"] = self.formatTime(record, self.datefmt)
 
-    def __init__(self, service_name: str) -> None:
-        super().__init__()
-        self._service = service_name
-        self._environment = os.getenv("ENVIRONMENT", "development")
-        # Prefer ENV HOSTNAME over socket hostname for consistency in containers
-        self._host = os.getenv("HOSTNAME", socket.gethostname())
-        self._version = os.getenv("APP_VERSION", None)
-        self._git_sha = os.getenv("GIT_SHA", None)
+            # Add level name
+            log_record["level"] = record.levelname
+
+            # Add logger name
+            log_record["logger"] = record.name
+
+            # Add thread info if available
+            if hasattr(record, "thread"):
+                log_record["thread"] = record.thread
+
+            # Add correlation_id if present in extra
+            if hasattr(record, "correlation_id"):
+                log_record["correlation_id"] = record.correlation_id
+
+            # Include common context fields if present
+            for key in ("service", "environment", "host", "version", "git_sha"):
+                if hasattr(record, key):
+                    log_record[key] = getattr(record, key)
+
+    return CustomJsonFormatter
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``CustomJsonFormatter`` lazily for existing importers."""
+    if name == "CustomJsonFormatter":
+        return _get_json_formatter_cls()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _stop_listener(listener: Any) -> None:
+    """Flush and stop a QueueListener once (later calls are no-ops)."""
+    if getattr(listener, "_thread", None) is not None:
+        listener.stop()
 
-    def filter(self, record: logging.LogRecord) -> bool:
-        if not hasattr(record, "service"):
-            record.service = self._service
-        if not hasattr(record, "environment"):
-            record.environment = self._environment
-        if not hasattr(record, "host"):
-            record.host = self._host
-        if self._version and not hasattr(record, "version"):
-            record.version = self._version
-        if self._git_sha and not hasattr(record, "git_sha"):
-            record.git_sha = self._git_sha
-        return True
+
+def _install_context_defaults(service_name: str) -> None:
+    """Give every log record default context fields via the record factory.
+
+    The defaults are class attributes of a ``LogRecord`` subclass, so they
+    cost nothing per record, reach records from every logger (not just the
+    root), and are still overridden by per-call ``extra`` values.
+
+    Args:
+        service_name: Value for the ``service`` field
+    """
+    defaults: dict[str, Any] = {
+        "service": service_name,
+        "environment": os.getenv("ENVIRONMENT", "development"),
+        # Prefer ENV HOSTNAME over socket hostname for consistency in containers
+        "host": os.getenv("HOSTNAME", socket.gethostname()),
+    }
+    version = os.getenv("APP_VERSION")
+    if version:
+        defaults["version"] = version
+    git_sha = os.getenv("GIT_SHA")
+    if git_sha:
+        defaults["git_sha"] = git_sha
+    logging.setLogRecordFactory(
+        type("ContextLogRecord", (logging.LogRecord,), defaults)
+    )
 
 
 def setup_logging(  # noqa: C901
@@ -117,11 +177,13 @@ def setup_logging(  # noqa: C901
     root_logger = logging.getLogger()
     root_logger.setLevel(numeric_level)
 
-    # Remove existing handlers
+    # Remove existing handlers (stopping background Loki senders first)
+    for handler in root_logger.handlers:
+        _stop_listener(getattr(handler, "listener", None))
     root_logger.handlers.clear()
 
-    # Install context filter (adds service/environment/host/version/git_sha)
-    root_logger.addFilter(_ContextFilter(service_name))
+    # Default service/environment/host/version/git_sha on every record
+    _install_context_defaults(service_name)
 
     # === Console Handler ===
     console_handler = logging.StreamHandler(sys.stdout)
@@ -129,7 +191,7 @@ def setup_logging(  # noqa: C901
 
     if log_format == "json":
         # JSON formatter for structured logging
-        json_formatter = CustomJsonFormatter(
+        json_formatter = _get_json_formatter_cls()(
             "%(timestamp)s %(level)s %(logger)s %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S",
         )
@@ -150,28 +212,35 @@ def setup_logging(  # noqa: C901
             import logging_loki
 
             loki_handler = None
-            # Optional batching via LokiQueueHandler (best-effort)
-            enable_batch = os.getenv("LOKI_BATCH", "false").lower() in (
+            push_url = f"{loki_url}/loki/api/v1/push"
+            # Stream labels must stay low-cardinality (like Prometheus labels):
+            # each distinct label set is a separate Loki stream and index entry.
+            # Only service (plus the handler's own severity/logger) is a label;
+            # correlation_id, chat and date stay in the log line, never tags.
+            loki_tags = {"service": service_name}
+            # Push from a background thread by default so callers never wait
+            # on Loki's HTTP round-trip; LOKI_BATCH=false sends inline
+            enable_batch = os.getenv("LOKI_BATCH", "true").lower() in (
                 "1",
                 "true",
                 "yes",
             )
             if enable_batch and hasattr(logging_loki, "LokiQueueHandler"):
                 try:
-                    # Some versions support capacity/batch_size
-                    # Keep minimal to avoid API mismatch
-                    push_url = f"{loki_url}/loki/api/v1/push"  # noqa: E501
                     loki_handler = logging_loki.LokiQueueHandler(
+                        Queue(-1),
                         url=push_url,
-                        tags={"service": service_name},
+                        tags=loki_tags,
                         version="1",
                     )
+                    # Drain queued records on interpreter exit
+                    atexit.register(_stop_listener, loki_handler.listener)
                 except Exception:
                     loki_handler = None
             if loki_handler is None:
                 loki_handler = logging_loki.LokiHandler(
-                    url=f"{loki_url}/loki/api/v1/push",
-                    tags={"service": service_name},
+                    url=push_url,
+                    tags=loki_tags,
                     version="1",
                 )
             loki_handler.setLevel(numeric_level)
@@ -237,6 +306,20 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
+class ContextLoggerAdapter(logging.LoggerAdapter):
+    """LoggerAdapter that merges its context into each call's ``extra``.
+
+    The stdlib adapter replaces a per-call ``extra`` with its own; this one
+    keeps both (per-call keys win), so shared fields are passed once.
+    """
+
+    def process(self, msg: Any, kwargs: MutableMapping[str, Any]) -> tuple[Any, Any]:
+        """Merge adapter context with the call's ``extra`` mapping."""
+        extra = kwargs.get("extra")
+        kwargs["extra"] = {**self.extra, **extra} if extra else self.extra
+        return msg, kwargs
+
+
 def add_correlation_id(
     logger: logging.Logger, correlation_id: str
 ) -> logging.LoggerAdapter:
@@ -249,4 +332,4 @@ def add_correlation_id(
     Returns:
         LoggerAdapter with correlation_id in extra fields
     """
-    return logging.LoggerAdapter(logger, {"correlation_id": correlation_id})
+    return ContextLoggerAdapter(logger, {"correlation_id": correlation_id})
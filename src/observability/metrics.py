@@ -7,44 +7,82 @@ HTTP server when enabled via configuration.
 from __future__ import annotations
 
 import logging
+import os
+import socket
+import sys
+from typing import Any
 
 from prometheus_client import Counter, Gauge, Histogram, start_http_server
 
 logger = logging.getLogger(__name__)
 
 
+def _resolve_worker_id() -> str:
+    """Return this process's worker id.
+
+    HOSTNAME is often unset outside interactive shells, so fall back to the
+    real host name (then the pid) rather than a placeholder every replica
+    would share.
+    """
+    return os.getenv("HOSTNAME") or socket.gethostname() or f"fetcher-{os.getpid()}"
+
+
+# `worker` label value, resolved once per process so every metric (daemon,
+# adapters, iterator, publisher, pushes) reports the same interned string.
+WORKER_ID: str = sys.intern(_resolve_worker_id())
+
+# Chats reported under their own `chat` label value (comma-separated, as they
+# appear in the label, e.g. "@news,-100123"). Others are folded into "other"
+# so ad-hoc fetches cannot grow the series count. Unset: every chat is kept.
+_CHAT_ALLOWLIST: frozenset[str] = frozenset(
+    c.strip() for c in os.getenv("METRICS_CHAT_ALLOWLIST", "").split(",") if c.strip()
+)
+
+
+def chat_label(chat: str) -> str:
+    """Return the `chat` label value for a chat, honouring the allowlist."""
+    if not _CHAT_ALLOWLIST or chat in _CHAT_ALLOWLIST:
+        return chat
+    return "other"
+
+
 # Histograms/Counters
-# Note: Keep label cardinality low. We expose chat and date where helpful.
+# Note: Keep label cardinality low. Dates are unbounded, so they belong in logs
+# and events, never in labels: each value would open a new series per chat.
+# Histogram buckets multiply series too, so each boundary below answers one
+# operational question; add a bucket only together with the query that uses it.
 fetch_duration_seconds = Histogram(
     "fetch_duration_seconds",
-    "Total duration of a fetch operation (per chat+date)",
-    labelnames=("chat", "date", "worker"),
-    buckets=(0.5, 1, 2, 5, 10, 20, 30, 60, 120, 300),
+    "Total duration of a fetch operation (per chat)",
+    labelnames=("chat", "worker"),
+    # 1s: cache/empty-day fast path; 5s: typical day; 30s: slow chat;
+    # 120s: at risk of command timeouts; 600s: stuck fetch
+    buckets=(1, 5, 30, 120, 600),
 )
 
 fetch_messages_total = Counter(
     "fetch_messages_total",
-    "Number of messages fetched (per chat+date)",
-    labelnames=("chat", "date", "worker"),
+    "Number of messages fetched (per chat)",
+    labelnames=("chat", "worker"),
 )
 
-# Total runs (per chat/date), helps track jobs executed
+# Total runs (per chat/strategy), helps track jobs executed
 fetch_runs_total = Counter(
     "fetch_runs_total",
-    "Number of fetch runs (per chat+date)",
-    labelnames=("chat", "date", "worker", "strategy"),
+    "Number of fetch runs (per chat)",
+    labelnames=("chat", "worker", "strategy"),
 )
 
 fetch_errors_total = Counter(
     "fetch_errors_total",
     "Number of fetch errors by type",
-    labelnames=("chat", "date", "error_type", "worker"),
+    labelnames=("chat", "error_type", "worker"),
 )
 
 fetch_retries_total = Counter(
     "fetch_retries_total",
     "Number of retry attempts by reason",
-    labelnames=("chat", "date", "reason", "worker"),
+    labelnames=("chat", "reason", "worker"),
 )
 
 last_retry_delay_seconds = Gauge(
@@ -56,8 +94,10 @@ last_retry_delay_seconds = Gauge(
 floodwait_wait_seconds = Histogram(
     "fetch_floodwait_wait_seconds",
     "Observed wait seconds due to rate limiting (FloodWait)",
-    labelnames=("chat", "date", "worker"),
-    buckets=(1, 5, 10, 20, 30, 60, 120, 300, 600, 1200),
+    labelnames=("chat", "worker"),
+    # 5s: routine throttling; 30s: noticeable; 120s: degraded throughput;
+    # 600s: account-level FloodWait worth paging on
+    buckets=(5, 30, 120, 600),
 )
 
 rate_limit_hits_total = Counter(
@@ -69,13 +109,17 @@ rate_limit_hits_total = Counter(
 dedup_skipped_total = Counter(
     "dedup_skipped_total",
     "Number of messages skipped due to deduplication",
-    labelnames=("chat", "date", "reason", "worker"),
+    labelnames=("chat", "reason", "worker"),
 )
 
 fetch_progress_messages_current = Gauge(
     "fetch_progress_messages_current",
     "Current messages processed in active fetch run",
-    labelnames=("chat", "date", "worker"),
+    # One series per worker: the sum of messages processed by all of its
+    # in-flight runs (parallel days/chats add up; see PrometheusMetricsAdapter).
+    # A per-chat gauge would leave a stale series behind for every chat fetched;
+    # per-run progress is in the fetch logs and progress events.
+    labelnames=("worker",),
 )
 
 # Command subscriber metrics
@@ -123,17 +167,48 @@ breaker_open_total = Counter(
     labelnames=("target", "worker", "reason"),
 )
 
+# Redis connection pools (daemon)
+redis_pool_in_use = Gauge(
+    "redis_pool_connections_in_use",
+    "Redis pool connections currently checked out, per pool",
+    labelnames=("pool", "worker"),
+)
+
 fetch_lag_seconds = Histogram(
     "fetch_lag_seconds",
     "Lag between now and the latest fetched message timestamp",
-    labelnames=("chat", "date", "worker"),
-    buckets=(10, 30, 60, 120, 300, 600, 1200, 1800, 3600, 7200, 14400, 28800, 86400),
+    labelnames=("chat", "worker"),
+    # 1m: live; 5m: near real time; 1h: behind; 4h: stale; 1d: missed a day
+    buckets=(60, 300, 3600, 14400, 86400),
 )
 
 
 _server_started: bool = False
 
 
+def track_redis_pool(name: str, pool: Any, worker: str) -> None:
+    """Expose in-use connections of a Redis pool, evaluated at scrape time.
+
+    Args:
+        name: Pool label (e.g. "queue" or "pub")
+        pool: redis.ConnectionPool instance
+        worker: Worker identifier label
+    """
+
+    def _in_use() -> float:
+        in_use = getattr(pool, "_in_use_connections", None)
+        if in_use is not None:
+            return float(len(in_use))
+        # BlockingConnectionPool: connections created minus those idle in it
+        idle = sum(c is not None for c in list(pool.pool.queue))
+        return float(len(pool._connections) - idle)
+
+    try:
+        redis_pool_in_use.labels(pool=name, worker=worker).set_function(_in_use)
+    except Exception:
+        logger.debug("track_redis_pool failed (non-fatal)", exc_info=True)
+
+
 def ensure_metrics_server(port: int) -> None:
     """Start Prometheus metrics HTTP server once per process.
 
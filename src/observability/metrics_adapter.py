@@ -8,10 +8,11 @@ easier testing while keeping FetcherService free of direct Prometheus usage.
 from __future__ import annotations
 
 import logging
-import os
-from typing import Protocol
+from functools import lru_cache
+from typing import Any, Protocol
 
 from src.observability.metrics import (
+    WORKER_ID,
     commands_failed_total,
     commands_received_total,
     commands_success_total,
@@ -21,6 +22,20 @@ from src.observability.metrics import (
 
 logger = logging.getLogger(__name__)
 
+# Last reported progress per in-flight (chat, date) run. Module-level like the
+# gauge itself, so every adapter instance adds to and removes from one sum.
+_IN_FLIGHT: dict[tuple[str, str], int] = {}
+
+
+@lru_cache(maxsize=1024)
+def _child(metric: Any, *label_values: str) -> Any:
+    """Return the labelled child of ``metric`` (values in labelnames order).
+
+    ``.labels()`` validates and hashes the values and takes the metric lock on
+    every call; hot paths reuse the bound child instead.
+    """
+    return metric.labels(*label_values)
+
 
 class MetricsAdapter(Protocol):
     """Abstract metrics interface used by services.
@@ -55,15 +70,22 @@ class PrometheusMetricsAdapter:
     """
 
     def __init__(self) -> None:
-        """Initialize adapter and cache worker identifier."""
-        self._worker_id = os.getenv("HOSTNAME", "fetcher-1")
+        """Initialize adapter with the process-wide worker identifier."""
+        self._worker_id = WORKER_ID
 
     def set_progress(self, chat: str, date_str: str, value: int) -> None:
-        """Set gauge to the given value for (chat, date)."""
+        """Report a run's progress into the worker's gauge.
+
+        Runs of one worker overlap (parallel days, chats and date ranges), so
+        the gauge moves by the run's delta and holds the sum of all of them
+        instead of the last writer's value.
+        """
         try:
-            fetch_progress_messages_current.labels(
-                chat=chat, date=date_str, worker=self._worker_id
-            ).set(value)
+            key = (chat, date_str)
+            delta = value - _IN_FLIGHT.get(key, 0)
+            _IN_FLIGHT[key] = value
+            if delta:
+                _child(fetch_progress_messages_current, self._worker_id).inc(delta)
         except Exception:
             logger.debug(
                 "Prometheus set_progress failed (non-fatal)",
@@ -72,46 +94,36 @@ class PrometheusMetricsAdapter:
             )
 
     def reset_progress(self, chat: str, date_str: str) -> None:
-        """Reset gauge to zero for (chat, date)."""
-        try:
-            fetch_progress_messages_current.labels(
-                chat=chat, date=date_str, worker=self._worker_id
-            ).set(0)
-        except Exception:
-            logger.debug(
-                "Prometheus reset_progress failed (non-fatal)",
-                extra={"chat": chat, "date": date_str},
-                exc_info=True,
-            )
+        """Take a finished run's progress out of the worker's gauge."""
+        self.set_progress(chat, date_str, 0)
+        _IN_FLIGHT.pop((chat, date_str), None)
 
     # --- Command subscriber counters ---
     def inc_command_received(self, queue: str, worker: str) -> None:
         """Increment when a command JSON is received from Redis."""
         try:
-            commands_received_total.labels(queue=queue, worker=worker).inc()
+            _child(commands_received_total, queue, worker).inc()
         except Exception:
             logger.debug("Prometheus inc_command_received failed", exc_info=True)
 
     def inc_command_success(self, queue: str, worker: str) -> None:
         """Increment when a command is handled successfully."""
         try:
-            commands_success_total.labels(queue=queue, worker=worker).inc()
+            _child(commands_success_total, queue, worker).inc()
         except Exception:
             logger.debug("Prometheus inc_command_success failed", exc_info=True)
 
     def inc_command_failed(self, queue: str, worker: str, error_type: str) -> None:
         """Increment when command handling fails with an error type."""
         try:
-            commands_failed_total.labels(
-                queue=queue, worker=worker, error_type=error_type
-            ).inc()
+            _child(commands_failed_total, queue, worker, error_type).inc()
         except Exception:
             logger.debug("Prometheus inc_command_failed failed", exc_info=True)
 
     def inc_command_timeout(self, queue: str, worker: str) -> None:
         """Increment when BLPOP times out without receiving a command."""
         try:
-            commands_timeout_total.labels(queue=queue, worker=worker).inc()
+            _child(commands_timeout_total, queue, worker).inc()
         except Exception:
             logger.debug("Prometheus inc_command_timeout failed", exc_info=True)
 
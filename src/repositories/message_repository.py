@@ -4,17 +4,37 @@ Handles reading/writing MessageCollection objects to JSON files with
 atomic operations and versioned schema support.
 """
 
-import json
 import logging
+import os
 from datetime import date
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+
+from pydantic import ValidationError
 
 from src.models.schemas import Message, MessageCollection, SourceInfo
+from src.utils import serialization
 
 logger = logging.getLogger(__name__)
 
 
+def _fsync_dir(path: Path) -> None:
+    """Flush a directory entry (e.g. after rename) so it survives a crash.
+
+    Best-effort: platforms that cannot open directories (Windows) skip it.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        logger.debug("fsync of %s failed (non-fatal)", path, exc_info=True)
+    finally:
+        os.close(fd)
+
+
 class MessageRepository:
     """Repository for storing and retrieving messages from JSON files.
 
@@ -33,7 +53,9 @@ class MessageRepository:
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self._schema_version = schema_version
-        logger.info(f"MessageRepository initialized with data_dir={self.data_dir}")
+        # Source directories already created by this repository (skip mkdir)
+        self._known_dirs: set[Path] = set()
+        logger.info("MessageRepository initialized with data_dir=%s", self.data_dir)
 
     def _get_file_path(self, source_name: str, target_date: date) -> Path:
         """Get file path for source and date.
@@ -45,14 +67,23 @@ class MessageRepository:
         Returns:
             Path to JSON file
         """
-        # Remove @ prefix if present for directory name
-        clean_source = source_name.lstrip("@")
-        source_dir = self.data_dir / clean_source
-        source_dir.mkdir(parents=True, exist_ok=True)
-
         # Format: YYYY-MM-DD.json
-        filename = f"{target_date.isoformat()}.json"
-        return source_dir / filename
+        return self._source_dir(source_name) / f"{target_date.isoformat()}.json"
+
+    def _source_dir(self, source_name: str) -> Path:
+        """Return the directory for a source, creating it once per repository.
+
+        Args:
+            source_name: Source identifier (leading @ is dropped)
+
+        Returns:
+            Path to the source directory
+        """
+        source_dir = self.data_dir / source_name.lstrip("@")
+        if source_dir not in self._known_dirs:
+            source_dir.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(source_dir)
+        return source_dir
 
     # Public accessors for artifact paths (used by services for idempotent checks)
     def get_output_file_path(self, source_name: str, target_date: date) -> Path:
@@ -86,20 +117,27 @@ class MessageRepository:
         """
         file_path = self._get_file_path(source_name, target_date)
 
-        # Use Pydantic's model_dump with JSON-compatible types
-        data = collection.model_dump(mode="json")
-
         # Atomic write: write to temp file, then rename
         temp_path = file_path.with_suffix(".tmp")
         try:
-            with open(temp_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-
-            # Atomic rename
+            payload = collection.to_json_bytes()
+            if not temp_path.parent.is_dir():
+                # Removed since it was cached (e.g. by a retention cleanup)
+                temp_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, "wb") as f:
+                f.write(payload)
+                # Data must be on disk before the rename can expose it
+                f.flush()
+                os.fsync(f.fileno())
+
+            # Atomic rename, then persist the directory entry itself
             temp_path.replace(file_path)
+            _fsync_dir(file_path.parent)
 
             logger.info(
-                f"Saved {len(collection.messages)} messages to {file_path}",
+                "Saved %d messages to %s",
+                len(collection.messages),
+                file_path,
                 extra={
                     "source": source_name,
                     "date": target_date.isoformat(),
@@ -110,12 +148,13 @@ class MessageRepository:
             return str(file_path)
         except Exception as e:
             logger.error(
-                f"Failed to save messages to {file_path}: {e}",
+                "Failed to save messages to %s: %s",
+                file_path,
+                e,
                 extra={"source": source_name, "date": target_date.isoformat()},
             )
             # Clean up temp file if it exists
-            if temp_path.exists():
-                temp_path.unlink()
+            temp_path.unlink(missing_ok=True)
             raise
 
     def load_collection(
@@ -133,18 +172,20 @@ class MessageRepository:
         file_path = self._get_file_path(source_name, target_date)
 
         if not file_path.exists():
-            logger.debug(f"File not found: {file_path}")
+            logger.debug("File not found: %s", file_path)
             return None
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(file_path, "rb") as f:
+                raw = f.read()
 
-            # Use Pydantic validation
-            collection = MessageCollection.model_validate(data)
+            # Parse and validate in one pydantic-core pass (no interim dicts)
+            collection = MessageCollection.model_validate_json(raw)
 
             logger.info(
-                f"Loaded {len(collection.messages)} messages from {file_path}",
+                "Loaded %d messages from %s",
+                len(collection.messages),
+                file_path,
                 extra={
                     "source": source_name,
                     "date": target_date.isoformat(),
@@ -153,15 +194,19 @@ class MessageRepository:
             )
             return collection
 
-        except json.JSONDecodeError as e:
+        except ValidationError as e:
             logger.error(
-                f"Invalid JSON in {file_path}: {e}",
+                "Invalid collection JSON in %s: %s",
+                file_path,
+                e,
                 extra={"source": source_name, "date": target_date.isoformat()},
             )
             return None
         except Exception as e:
             logger.error(
-                f"Failed to load messages from {file_path}: {e}",
+                "Failed to load messages from %s: %s",
+                file_path,
+                e,
                 extra={"source": source_name, "date": target_date.isoformat()},
             )
             return None
@@ -174,10 +219,10 @@ class MessageRepository:
             target_date: Date to check
 
         Returns:
-            True if file exists, False otherwise
+            True if a regular file exists, False otherwise
         """
         file_path = self._get_file_path(source_name, target_date)
-        return file_path.exists()
+        return file_path.is_file()
 
     def create_collection(
         self, source_info: SourceInfo, messages: Optional[list[Message]] = None
@@ -247,11 +292,14 @@ class MessageRepository:
     def _get_artifact_path(
         self, source_name: str, target_date: date, suffix: str
     ) -> Path:
-        clean_source = source_name.lstrip("@")
-        source_dir = self.data_dir / clean_source
-        source_dir.mkdir(parents=True, exist_ok=True)
         filename = f"{target_date.isoformat()}_{suffix}.json"
-        return source_dir / filename
+        return self._source_dir(source_name) / filename
+
+    @staticmethod
+    def _write_json(path: Path, payload: Any) -> None:
+        """Write an indented UTF-8 JSON artifact (orjson when available)."""
+        with open(path, "wb") as f:
+            f.write(serialization.dumps(payload, indent=True))
 
     def save_summary(self, source_name: str, target_date: date, summary: dict) -> str:
         """Persist a per-day summary artifact.
@@ -265,10 +313,10 @@ class MessageRepository:
             Path string to written summary file
         """
         path = self._get_artifact_path(source_name, target_date, "summary")
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(summary, f, ensure_ascii=False, indent=2)
+        self._write_json(path, summary)
         logger.info(
-            f"Saved summary to {path}",
+            "Saved summary to %s",
+            path,
             extra={
                 "source": source_name,
                 "date": target_date.isoformat(),
@@ -289,10 +337,10 @@ class MessageRepository:
             Path string to written threads file
         """
         path = self._get_artifact_path(source_name, target_date, "threads")
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(threads, f, ensure_ascii=False, indent=2)
+        self._write_json(path, threads)
         logger.info(
-            f"Saved threads to {path}",
+            "Saved threads to %s",
+            path,
             extra={
                 "source": source_name,
                 "date": target_date.isoformat(),
@@ -320,10 +368,10 @@ class MessageRepository:
             "date": target_date.isoformat(),
             "participants": participants,
         }
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(artifact, f, ensure_ascii=False, indent=2)
+        self._write_json(path, artifact)
         logger.info(
-            f"Saved participants to {path}",
+            "Saved participants to %s",
+            path,
             extra={
                 "source": source_name,
                 "date": target_date.isoformat(),
@@ -86,7 +86,7 @@ class MongoMessageRepository(MessageRepositoryProtocol):
             "version": collection.version,
             "timezone": collection.timezone,
             "source_info": collection.source_info.model_dump(mode="json"),
-            "senders": collection.senders,
+            "senders": collection.senders_json(),
             "messages": [m.model_dump(mode="json") for m in collection.messages],
         }
         self._coll.update_one(
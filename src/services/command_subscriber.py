@@ -1,20 +1,53 @@
 """Redis command subscriber for receiving fetch commands.
 
 Uses Redis List (queue pattern) for fair distribution across multiple fetcher workers.
-Each command is processed by exactly one worker (BLPOP).
+Each command is processed by exactly one worker (BLPOP). Workers pull a single
+command, handle it and only then pull the next one (prefetch=1 by default), so
+a slow worker never hoards queued work; a larger prefetch trades that fairness
+for fewer round-trips under backlog.
 """
 
 from __future__ import annotations
 
-import json
+import asyncio
+import contextlib
 import logging
+import time
 from datetime import datetime
-from typing import Any, Callable, Optional
+from typing import Any, AsyncIterator, Callable, Optional
 
 import redis
 
+from src.utils import serialization
+
 logger = logging.getLogger(__name__)
 
+# Moves due members of the delayed set (KEYS[1]) to the queue tail (KEYS[2]).
+# Runs atomically on the server, so a worker dying mid-promotion cannot drop
+# a command and concurrent workers never promote the same one twice.
+_PROMOTE_DUE_LUA = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1])
+for _, payload in ipairs(due) do
+    redis.call('ZREM', KEYS[1], payload)
+    redis.call('RPUSH', KEYS[2], payload)
+end
+return #due
+"""
+
+# Moves every command of a processing list (KEYS[1]) back to the queue head
+# (KEYS[2]), oldest command first in line, in one atomic step.
+_RECLAIM_LUA = """
+local moved = 0
+while redis.call('LMOVE', KEYS[1], KEYS[2], 'RIGHT', 'LEFT') do
+    moved = moved + 1
+end
+return moved
+"""
+
+# Seconds a worker's liveness key outlives its last refresh; processing lists
+# of workers without one are reclaimed by the next worker that connects
+_WORKER_ALIVE_TTL = 60
+
 
 class CommandSubscriber:
     """Subscribe to Redis commands queue and handle fetch commands.
@@ -32,7 +65,12 @@ class CommandSubscriber:
         *,
         commands_queue: str = "tg_commands",
         blpop_timeout: int = 5,
+        max_blpop_timeout: int = 30,
+        ack_enabled: bool = False,
+        delayed_enabled: bool = False,
+        prefetch_count: int = 1,
         metrics: Optional[Any] = None,
+        connection_pool: Optional[redis.ConnectionPool] = None,
     ):
         """Initialize command subscriber.
 
@@ -43,7 +81,20 @@ class CommandSubscriber:
             worker_id: Unique identifier for this worker (for logging)
             commands_queue: Redis list name for commands (queue pattern)
             blpop_timeout: BLPOP timeout in seconds for listen loop
+            max_blpop_timeout: Upper bound for the adaptive BLPOP timeout
+                while the queue stays idle
+            ack_enabled: If True, commands are moved (BLMOVE) to a per-worker
+                processing list and removed only after handling completes;
+                lists left behind by crashed workers are re-queued on connect
+            delayed_enabled: If True, due commands from the delayed set
+                (see defer_command) are moved back to the queue while listening
+            prefetch_count: Max commands taken per poll; after a blocking pop
+                up to ``prefetch_count - 1`` queued commands are drained in
+                one pipelined round-trip and handled concurrently (commands
+                for the same chat still run one after another)
             metrics: Metrics adapter for observability (optional)
+            connection_pool: Optional shared Redis pool; when given, the
+                client borrows connections from it instead of opening its own
         """
         # Local import to avoid circular imports at module import time
         from src.observability.metrics_adapter import MetricsAdapter, NoopMetricsAdapter
@@ -54,9 +105,28 @@ class CommandSubscriber:
         self.worker_id = worker_id
         self._queue = commands_queue
         self._blpop_timeout = blpop_timeout
+        self._max_blpop_timeout = max_blpop_timeout
+        # Per-worker in-flight list used when acknowledgements are enabled
+        self._processing_queue: Optional[str] = (
+            f"{commands_queue}:processing:{worker_id}" if ack_enabled else None
+        )
+        # Refreshed while listening so live workers' lists are not reclaimed
+        self._alive_key = f"{commands_queue}:alive:{worker_id}"
+        self._reclaim_script: Any = None
         # Using Any for Redis client to avoid mypy stub mismatches across redis/aioredis
         self._redis_client: Any = None
+        self._connection_pool = connection_pool
         self._running = False
+        # True while a popped command is being handled (not just polled)
+        self._busy = False
+        # Sorted set of deferred commands scored by due unix timestamp
+        self._delayed_queue = f"{commands_queue}:delayed"
+        self._delayed_enabled = delayed_enabled
+        # Registered on first promotion (EVALSHA, reloaded if flushed)
+        self._promote_script: Any = None
+        self._prefetch_count = max(1, prefetch_count)
+        # Per-chat locks (with user counts) for concurrently handled batches
+        self._chat_locks: dict[Any, list[Any]] = {}
         # Metrics adapter (Prometheus or Noop)
         self._metrics: MetricsAdapter = (
             metrics if metrics is not None else NoopMetricsAdapter()
@@ -65,15 +135,21 @@ class CommandSubscriber:
     def connect(self) -> None:
         """Connect to Redis."""
         try:
-            self._redis_client = redis.from_url(
-                self.redis_url,
-                password=self.redis_password,
-                decode_responses=True,
-            )
+            if self._connection_pool is not None:
+                self._redis_client = redis.Redis(connection_pool=self._connection_pool)
+            else:
+                self._redis_client = redis.from_url(
+                    self.redis_url,
+                    password=self.redis_password,
+                    decode_responses=True,
+                )
             # Test connection
             self._redis_client.ping()
+            if self._processing_queue is not None:
+                self.reclaim_stranded_commands()
             logger.info(
-                f"Connected to Redis queue: {self._queue}",
+                "Connected to Redis queue: %s",
+                self._queue,
                 extra={
                     "queue": self._queue,
                     "redis_url": self.redis_url,
@@ -82,7 +158,8 @@ class CommandSubscriber:
             )
         except Exception as e:
             logger.error(
-                f"Failed to connect to Redis: {e}",
+                "Failed to connect to Redis: %s",
+                e,
                 extra={"error": str(e), "redis_url": self.redis_url},
             )
             raise
@@ -90,6 +167,9 @@ class CommandSubscriber:
     def disconnect(self) -> None:
         """Disconnect from Redis."""
         if self._redis_client:
+            if self._processing_queue is not None:
+                with contextlib.suppress(Exception):
+                    self._redis_client.delete(self._alive_key)
             self._redis_client.close()
         logger.info("Disconnected from Redis", extra={"worker_id": self.worker_id})
 
@@ -99,6 +179,12 @@ class CommandSubscriber:
         Uses blocking list pop (BLPOP) to ensure each command is processed
         by exactly one worker. This enables horizontal scaling.
 
+        The blocking call runs in a worker thread so the event loop stays
+        responsive. While the queue is idle the BLPOP timeout doubles after
+        every empty poll (capped by ``max_blpop_timeout``) and is reset once a
+        command arrives; BLPOP returns as soon as work is pushed, so this cuts
+        idle Redis round-trips without adding dequeue latency.
+
         Command format (JSON):
         {
             "command": "fetch",
@@ -111,47 +197,68 @@ class CommandSubscriber:
         }
 
         Args:
-            timeout: BLPOP timeout in seconds (default: 5)
+            timeout: Initial BLPOP timeout in seconds (default: blpop_timeout)
         """
         if not self._redis_client:
             raise RuntimeError("Not connected to Redis. Call connect() first.")
 
         self._running = True
+        base_timeout = timeout if timeout is not None else self._blpop_timeout
+        max_timeout = max(base_timeout, self._max_blpop_timeout)
         logger.info(
             "Started listening for commands",
             extra={
                 "worker_id": self.worker_id,
                 "queue": self._queue,
-                "pattern": "queue (BLPOP)",
-                "timeout": timeout if timeout is not None else self._blpop_timeout,
+                "pattern": (
+                    "queue (BLMOVE+ack)" if self._processing_queue else "queue (BLPOP)"
+                ),
+                "timeout": base_timeout,
+                "max_timeout": max_timeout,
             },
         )
 
+        effective_timeout = base_timeout
+        keep_alive = (
+            asyncio.ensure_future(self._keep_alive())
+            if self._processing_queue is not None
+            else None
+        )
         try:
             while self._running:
                 # BLPOP: blocks until command available or timeout
                 # Only ONE worker will receive each command (queue pattern)
-                # Pass queue as a list to align with redis-py signature;
-                # client typed as Any to bypass stub issues
-                effective_timeout = (
-                    timeout if timeout is not None else self._blpop_timeout
-                )
-                result = self._redis_client.blpop(
-                    [self._queue], timeout=effective_timeout
+                poll = asyncio.ensure_future(
+                    asyncio.to_thread(self._pop_batch, effective_timeout)
                 )
-
-                if result:
-                    queue_name, command_json = result
+                try:
+                    batch = await asyncio.shield(poll)
+                except asyncio.CancelledError:
+                    # Abandoned mid-poll (shutdown): hand back anything it pops
+                    poll.add_done_callback(self._requeue_abandoned)
+                    raise
+
+                if batch:
+                    # Work arrived: fall back to the short timeout
+                    effective_timeout = base_timeout
                     # Metrics: command received
                     try:
-                        self._metrics.inc_command_received(
-                            queue=self._queue, worker=self.worker_id
-                        )
+                        for _ in batch:
+                            self._metrics.inc_command_received(
+                                queue=self._queue, worker=self.worker_id
+                            )
                     except Exception:
                         logger.debug(
                             "inc_command_received failed (non-fatal)", exc_info=True
                         )
-                    await self._handle_command(command_json)
+                    self._busy = True
+                    try:
+                        if len(batch) == 1:
+                            await self._process(batch[0])
+                        else:
+                            await asyncio.gather(*(self._process(p) for p in batch))
+                    finally:
+                        self._busy = False
                 else:
                     # Heartbeat on timeout to indicate liveness
                     logger.debug(
@@ -171,6 +278,8 @@ class CommandSubscriber:
                         logger.debug(
                             "inc_command_timeout failed (non-fatal)", exc_info=True
                         )
+                    # Idle: back off the poll rate up to the configured cap
+                    effective_timeout = min(max_timeout, effective_timeout * 2)
 
         except KeyboardInterrupt:
             logger.info(
@@ -178,21 +287,257 @@ class CommandSubscriber:
                 extra={"worker_id": self.worker_id, "reason": "keyboard_interrupt"},
             )
         except Exception as e:
-            logger.error(f"Error in listen loop: {e}", exc_info=True)
+            logger.error("Error in listen loop: %s", e, exc_info=True)
         finally:
             self._running = False
+            if keep_alive is not None:
+                keep_alive.cancel()
+
+    async def _process(self, command_json: Any) -> None:
+        """Handle one popped command and acknowledge it."""
+        await self._handle_command(command_json)
+        self._ack(command_json)
+
+    def _pop_batch(self, timeout: int) -> list[Any]:
+        """Pop up to ``prefetch_count`` commands, blocking only for the first.
+
+        Returns:
+            Payloads in queue order (empty on timeout or after stop())
+        """
+        result = self._pop_next(timeout)
+        if not result:
+            return []
+        batch = [result[1]]
+        if self._prefetch_count > 1 and self._running:
+            try:
+                batch.extend(self._drain(self._prefetch_count - 1))
+            except Exception:
+                logger.debug("Prefetching queued commands failed", exc_info=True)
+        if not self._running:
+            # Stopped while blocked: nobody will handle these, give them back
+            self._requeue(batch)
+            return []
+        return batch
+
+    def _drain(self, count: int) -> list[Any]:
+        """Take up to ``count`` already-queued commands in one round-trip."""
+        pipe = self._redis_client.pipeline(transaction=False)
+        for _ in range(count):
+            if self._processing_queue is None:
+                pipe.lpop(self._queue)
+            else:
+                pipe.lmove(self._queue, self._processing_queue, "LEFT", "RIGHT")
+        return [payload for payload in pipe.execute() if payload is not None]
+
+    def _pop_next(self, timeout: int) -> Optional[tuple[str, Any]]:
+        """Pop exactly one command, blocking up to ``timeout``.
+
+        Returns:
+            ``(queue, payload)`` tuple or None on timeout
+        """
+        if self._delayed_enabled:
+            self.promote_due_commands()
+        if self._processing_queue is None:
+            # Pass queue as a list to align with redis-py signature;
+            # client typed as Any to bypass stub issues
+            result = self._redis_client.blpop([self._queue], timeout=timeout)
+        else:
+            payload = self._redis_client.blmove(
+                self._queue, self._processing_queue, timeout, "LEFT", "RIGHT"
+            )
+            result = (self._queue, payload) if payload is not None else None
+        return result
+
+    @property
+    def busy(self) -> bool:
+        """Whether a command is currently being handled (not just polled)."""
+        return self._busy
+
+    def _requeue(self, payloads: list[Any]) -> None:
+        """Return popped but unhandled commands to the head of the queue."""
+        try:
+            pipe = self._redis_client.pipeline(transaction=False)
+            # Push back newest first so the original queue order is restored
+            for payload in reversed(payloads):
+                if self._processing_queue is None:
+                    pipe.lpush(self._queue, payload)
+                else:
+                    pipe.lmove(self._processing_queue, self._queue, "RIGHT", "LEFT")
+            pipe.execute()
+            logger.info(
+                "Re-queued unhandled commands on shutdown",
+                extra={
+                    "worker_id": self.worker_id,
+                    "queue": self._queue,
+                    "count": len(payloads),
+                },
+            )
+        except Exception:
+            logger.warning(
+                "Failed to re-queue unhandled command",
+                extra={"worker_id": self.worker_id, "queue": self._queue},
+                exc_info=True,
+            )
+
+    def _requeue_abandoned(self, poll: "asyncio.Future[Any]") -> None:
+        """Done-callback for a poll whose listener was cancelled."""
+        if poll.cancelled() or poll.exception() is not None:
+            return
+        batch = poll.result()
+        if batch:
+            self._requeue(batch)
+
+    async def queue_depth_async(self) -> int:
+        """``queue_depth`` off the event loop (the Redis call is blocking)."""
+        return await asyncio.to_thread(self.queue_depth)
+
+    def queue_depth(self) -> int:
+        """Return the number of commands waiting in the queue (0 on error)."""
+        if not self._redis_client:
+            return 0
+        try:
+            return int(self._redis_client.llen(self._queue))
+        except Exception:
+            logger.debug("LLEN failed (treat queue as empty)", exc_info=True)
+            return 0
+
+    def defer_command(self, command: dict[str, Any], delay_seconds: float) -> bool:
+        """Park a command in the delayed set until ``delay_seconds`` elapse.
+
+        Args:
+            command: Command dict as received from the queue
+            delay_seconds: Delay before the command becomes due again
+
+        Returns:
+            True if the command was stored, False otherwise
+        """
+        if not self._redis_client:
+            return False
+        try:
+            payload = serialization.dumps(command)
+            self._redis_client.zadd(
+                self._delayed_queue, {payload: time.time() + delay_seconds}
+            )
+            return True
+        except Exception:
+            logger.error(
+                "Failed to defer command",
+                extra={"worker_id": self.worker_id, "queue": self._delayed_queue},
+                exc_info=True,
+            )
+            return False
+
+    def promote_due_commands(self, now: Optional[float] = None) -> int:
+        """Move due commands from the delayed set back to the queue tail.
+
+        One server-side script (see ``_PROMOTE_DUE_LUA``) removes and pushes
+        each due command atomically, so with several workers every due
+        command is re-queued exactly once and never lost in between.
+
+        Returns:
+            Number of commands re-queued
+        """
+        moved = 0
+        try:
+            if self._promote_script is None:
+                self._promote_script = self._redis_client.register_script(
+                    _PROMOTE_DUE_LUA
+                )
+            moved = int(
+                self._promote_script(
+                    keys=[self._delayed_queue, self._queue],
+                    args=[now if now is not None else time.time()],
+                )
+            )
+        except Exception:
+            logger.debug("Promoting delayed commands failed", exc_info=True)
+        if moved:
+            logger.info(
+                "Re-queued deferred commands",
+                extra={"worker_id": self.worker_id, "count": moved},
+            )
+        return moved
+
+    def reclaim_stranded_commands(self) -> int:
+        """Re-queue commands left in processing lists by dead workers.
+
+        This worker's own list is always reclaimed (nothing is in flight
+        before it listens); other workers' lists are reclaimed once their
+        liveness key has expired, so a crashed worker's commands are picked
+        up by the others even if it never comes back under the same id.
+
+        Returns:
+            Number of commands re-queued
+        """
+        if self._processing_queue is None:
+            return 0
+        moved = 0
+        try:
+            self._refresh_alive()
+            if self._reclaim_script is None:
+                self._reclaim_script = self._redis_client.register_script(_RECLAIM_LUA)
+            prefix = f"{self._queue}:processing:"
+            for name in self._redis_client.scan_iter(match=f"{prefix}*"):
+                key = name.decode() if isinstance(name, bytes) else name
+                worker = key[len(prefix) :]
+                if key != self._processing_queue and self._redis_client.exists(
+                    f"{self._queue}:alive:{worker}"
+                ):
+                    continue
+                moved += int(self._reclaim_script(keys=[key, self._queue]))
+        except Exception:
+            logger.warning(
+                "Reclaiming stranded commands failed",
+                extra={"worker_id": self.worker_id, "queue": self._queue},
+                exc_info=True,
+            )
+        if moved:
+            logger.info(
+                "Re-queued commands stranded in processing lists",
+                extra={"worker_id": self.worker_id, "count": moved},
+            )
+        return moved
+
+    def _refresh_alive(self) -> None:
+        """Mark this worker as alive for ``_WORKER_ALIVE_TTL`` seconds."""
+        self._redis_client.set(self._alive_key, self.worker_id, ex=_WORKER_ALIVE_TTL)
+
+    async def _keep_alive(self) -> None:
+        """Refresh the liveness key while listening, including during handling."""
+        while True:
+            try:
+                await asyncio.to_thread(self._refresh_alive)
+            except Exception:
+                logger.debug("Refreshing worker liveness failed", exc_info=True)
+            await asyncio.sleep(_WORKER_ALIVE_TTL / 3)
+
+    def _ack(self, command_json: Any) -> None:
+        """Remove a handled command from the processing list (if enabled)."""
+        if self._processing_queue is None:
+            return
+        try:
+            self._redis_client.lrem(self._processing_queue, 1, command_json)
+        except Exception:
+            logger.warning(
+                "Failed to ack command (left in processing list)",
+                extra={
+                    "worker_id": self.worker_id,
+                    "processing_queue": self._processing_queue,
+                },
+                exc_info=True,
+            )
 
-    async def _handle_command(self, command_json: str) -> None:  # noqa: C901
+    async def _handle_command(self, command_json: str | bytes) -> None:  # noqa: C901
         """Handle incoming Redis command with validation and error handling.
 
         Args:
-            command_json: JSON string with command data
+            command_json: JSON document (str or raw bytes) with command data
         """
         start_time = datetime.utcnow()
 
         try:
             # Parse command
-            command_data = json.loads(command_json)
+            command_data = serialization.loads(command_json)
             logger.info(
                 "Received command from queue",
                 extra={
@@ -232,7 +577,12 @@ class CommandSubscriber:
 
             # Execute command
             if self.command_handler:
-                await self.command_handler(command_data)
+                if self._prefetch_count > 1:
+                    # Batches run concurrently; keep one command per chat active
+                    async with self._chat_guard(command_data.get("chat")):
+                        await self.command_handler(command_data)
+                else:
+                    await self.command_handler(command_data)
 
                 # Log success
                 duration = (datetime.utcnow() - start_time).total_seconds()
@@ -261,7 +611,7 @@ class CommandSubscriber:
                     extra={"worker_id": self.worker_id, "error_type": "config_error"},
                 )
 
-        except json.JSONDecodeError as e:
+        except serialization.JSONDecodeError as e:
             logger.error(
                 "Failed to parse command JSON",
                 extra={
@@ -309,6 +659,21 @@ class CommandSubscriber:
                     "inc_command_failed(command_handler_error) failed", exc_info=True
                 )
 
+    @contextlib.asynccontextmanager
+    async def _chat_guard(self, chat: Any) -> AsyncIterator[None]:
+        """Serialize handlers for the same chat; the lock is dropped when idle."""
+        entry = self._chat_locks.get(chat)
+        if entry is None:
+            entry = self._chat_locks[chat] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                del self._chat_locks[chat]
+
     def stop(self) -> None:
         """Stop listening for commands."""
         self._running = False
@@ -343,3 +708,76 @@ def create_fetch_command(
         "requested_by": requested_by,
         "timestamp": datetime.utcnow().isoformat() + "Z",
     }
+
+
+def compute_enqueue_delay(
+    queue_depth: int,
+    max_queue_depth: int,
+    *,
+    delay_ms: int = 100,
+    max_delay_ms: int = 5000,
+) -> float:
+    """Return producer backpressure delay (seconds) for the given queue depth.
+
+    The delay grows linearly with how far the queue is above the threshold:
+    ``delay_ms * (depth - threshold) / threshold``, capped at ``max_delay_ms``.
+
+    Args:
+        queue_depth: Current length of the commands list
+        max_queue_depth: Threshold above which producers are slowed (0 disables)
+        delay_ms: Base delay per threshold-worth of excess depth
+        max_delay_ms: Upper bound for the delay
+
+    Returns:
+        Delay in seconds (0.0 when below threshold or disabled)
+    """
+    if max_queue_depth <= 0 or queue_depth <= max_queue_depth:
+        return 0.0
+    excess = queue_depth - max_queue_depth
+    return min(max_delay_ms, delay_ms * excess / max_queue_depth) / 1000.0
+
+
+def enqueue_command(
+    client: Any,
+    queue: str,
+    command: dict[str, Any],
+    *,
+    max_queue_depth: int = 0,
+    delay_ms: int = 100,
+    max_delay_ms: int = 5000,
+) -> float:
+    """Push a command to the queue, applying backpressure when it is too deep.
+
+    Producers are slowed (not rejected) while workers lag behind so the list
+    cannot grow unbounded and exhaust Redis memory.
+
+    Args:
+        client: Sync redis client
+        queue: Redis list name
+        command: Command dict (see create_fetch_command)
+        max_queue_depth: Backpressure threshold (0 disables the LLEN check)
+        delay_ms: Base delay per threshold-worth of excess depth
+        max_delay_ms: Upper bound for the delay
+
+    Returns:
+        Applied delay in seconds
+    """
+    delay = 0.0
+    if max_queue_depth > 0:
+        depth = int(client.llen(queue))
+        delay = compute_enqueue_delay(
+            depth, max_queue_depth, delay_ms=delay_ms, max_delay_ms=max_delay_ms
+        )
+        if delay > 0:
+            logger.warning(
+                "Commands queue above threshold; delaying enqueue",
+                extra={
+                    "queue": queue,
+                    "queue_depth": depth,
+                    "max_queue_depth": max_queue_depth,
+                    "delay_seconds": round(delay, 3),
+                },
+            )
+            time.sleep(delay)
+    client.rpush(queue, serialization.dumps(command))
+    return delay
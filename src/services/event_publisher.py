@@ -4,18 +4,23 @@ Publishes events to 'tg_events' channel after successful message fetch,
 allowing other services (like tg_analyzer) to react automatically.
 """
 
-import json
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Optional, Protocol, cast
+from typing import Any, Iterator, Optional, Protocol, cast
 
 import redis
 
-from src.observability.metrics import events_published_total
+from src.observability.metrics import WORKER_ID, events_published_total
+from src.utils import serialization
 from src.utils.correlation import get_correlation_id
 
 logger = logging.getLogger(__name__)
 
+# (event_type, correlation_id, encoded event)
+_PendingEvent = tuple[str, Optional[str], bytes]
+
 
 class EventPublisherProtocol(Protocol):
     """Protocol for event publisher to enable dependency inversion and testing.
@@ -52,6 +57,10 @@ class EventPublisherProtocol(Protocol):
         """Publish a completion event after a successful fetch."""
         ...
 
+    def publish_fetch_complete_payload(self, payload: dict[str, Any]) -> None:
+        """Publish a completion event from a prebuilt payload dict."""
+        ...
+
     def publish_fetch_failed(
         self,
         chat: str,
@@ -112,6 +121,11 @@ class EventPublisher:
         enabled: bool = True,
         events_channel: str = "tg_events",
         service_name: str = "tg_fetcher",
+        *,
+        connection_pool: Optional[redis.ConnectionPool] = None,
+        max_retry_attempts: Optional[int] = None,
+        retry_backoff_factor: Optional[float] = None,
+        fire_and_forget: bool = False,
     ):
         """Initialize event publisher.
 
@@ -121,6 +135,15 @@ class EventPublisher:
             enabled: If False, events are disabled and Redis won't be contacted
             events_channel: Redis Pub/Sub channel name for events
             service_name: Service name reported in event payloads
+            connection_pool: Optional shared Redis pool; when given, the
+                client borrows connections from it instead of opening its own
+            max_retry_attempts: Publish attempts before giving up (defaults
+                to FetcherConfig.max_retry_attempts)
+            retry_backoff_factor: Backoff factor for publish retries (defaults
+                to FetcherConfig.retry_backoff_factor)
+            fire_and_forget: If True, publishes are handed to a single
+                background thread (ordering preserved) and callers never wait
+                for the Redis reply; pending events are drained on disconnect
         """
         self.redis_url = redis_url
         self.redis_password = redis_password
@@ -128,6 +151,14 @@ class EventPublisher:
         self._redis_client: Optional[redis.Redis] = None
         self._channel = events_channel
         self._service = service_name
+        self._connection_pool = connection_pool
+        self._max_retry_attempts = max_retry_attempts
+        self._retry_backoff_factor = retry_backoff_factor
+        # Buffer of encoded events while inside pipeline(); None otherwise
+        self._pending: Optional[list[_PendingEvent]] = None
+        self._fire_and_forget = fire_and_forget
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._last_future: Optional[Future[None]] = None
 
     def connect(self) -> None:
         """Connect to Redis."""
@@ -137,11 +168,15 @@ class EventPublisher:
             )
             return
         try:
-            self._redis_client = redis.from_url(
-                self.redis_url,
-                password=self.redis_password,
-                decode_responses=True,
-            )
+            if self._connection_pool is not None:
+                self._redis_client = redis.Redis(connection_pool=self._connection_pool)
+            else:
+                self._redis_client = redis.from_url(
+                    self.redis_url,
+                    password=self.redis_password,
+                    decode_responses=True,
+                    socket_keepalive=True,
+                )
             # Test connection
             self._redis_client.ping()
             logger.info(
@@ -150,23 +185,73 @@ class EventPublisher:
             )
         except Exception as e:
             logger.error(
-                f"Failed to connect to Redis: {e}",
+                "Failed to connect to Redis: %s",
+                e,
                 extra={"error": str(e), "redis_url": self.redis_url},
             )
             raise
 
     def disconnect(self) -> None:
-        """Disconnect from Redis."""
+        """Disconnect from Redis, draining background publishes first."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
         if self._redis_client:
             self._redis_client.close()
         logger.info("Disconnected from Redis")
 
-    def _build_and_publish(  # noqa: C901 - orchestrator with retries and metrics
-        self, event_type: str, payload: dict
-    ) -> None:
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Wait until events handed to the background publisher are sent.
+
+        Args:
+            timeout: Max seconds to wait (None waits indefinitely)
+        """
+        future = self._last_future
+        if future is not None:
+            try:
+                future.result(timeout=timeout)
+            except Exception:
+                logger.debug("flush: background publish not finished", exc_info=True)
+
+    def _retry_settings(self) -> tuple[int, float]:
+        """Return (max_attempts, backoff_factor) for publish retries.
+
+        Falls back to FetcherConfig once (cached) when not given explicitly.
+        """
+        if self._max_retry_attempts is None or self._retry_backoff_factor is None:
+            from src.core.config import FetcherConfig
+
+            cfg = FetcherConfig()
+            if self._max_retry_attempts is None:
+                self._max_retry_attempts = cfg.max_retry_attempts
+            if self._retry_backoff_factor is None:
+                self._retry_backoff_factor = cfg.retry_backoff_factor
+        return self._max_retry_attempts, self._retry_backoff_factor
+
+    @contextmanager
+    def pipeline(self) -> Iterator["EventPublisher"]:
+        """Buffer events published inside the block and send them in one batch.
+
+        Events are flushed through a non-transactional Redis pipeline on exit
+        (one round-trip instead of one per event). Nested blocks join the
+        outermost one.
+        """
+        if self._pending is not None:
+            yield self
+            return
+        self._pending = []
+        try:
+            yield self
+        finally:
+            batch, self._pending = self._pending, None
+            if batch:
+                self._dispatch(batch)
+
+    def _build_and_publish(self, event_type: str, payload: dict) -> None:
         """Compose base event fields and publish to Redis.
 
-        Non-fatal on errors: logs and returns.
+        Non-fatal on errors: logs and returns. Inside ``pipeline()`` the
+        encoded event is buffered and sent when the block exits.
         """
         correlation_id = get_correlation_id()
         if not self._enabled:
@@ -191,32 +276,65 @@ class EventPublisher:
 
         event = {
             "event": event_type,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            # Formatted by the (orjson) encoder, same text as isoformat()
+            "timestamp": datetime.now(timezone.utc),
             "service": self._service,
             "correlation_id": correlation_id,
         }
         event.update(payload)
 
         try:
-            import time
+            # Bytes are passed to redis-py as-is (no str -> bytes re-encode)
+            event_json = serialization.dumps(event)
+        except Exception as e:
+            self._report_failure([(event_type, correlation_id, b"")], e)
+            return
 
-            event_json = json.dumps(event)
-            # Publish with a simple retry/backoff loop (sync)
-            from src.core.config import FetcherConfig
+        if self._pending is not None:
+            self._pending.append((event_type, correlation_id, event_json))
+            return
+        self._dispatch([(event_type, correlation_id, event_json)])
 
-            cfg = FetcherConfig()
+    def _dispatch(self, batch: list[_PendingEvent]) -> None:
+        """Send now, or hand off to the background thread in fire-and-forget mode."""
+        if not self._fire_and_forget:
+            self._send(batch)
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="event-publisher"
+            )
+        try:
+            self._last_future = self._executor.submit(self._send, batch)
+        except RuntimeError:
+            # Executor already shut down (late publish during teardown)
+            self._send(batch)
+
+    def _publish_batch(self, batch: list[_PendingEvent]) -> list[int]:
+        """Publish encoded events; more than one goes through a pipeline."""
+        assert self._redis_client is not None
+        if len(batch) == 1:
+            return [cast(int, self._redis_client.publish(self._channel, batch[0][2]))]
+        pipe = self._redis_client.pipeline(transaction=False)
+        for _, _, data in batch:
+            pipe.publish(self._channel, data)
+        return [cast(int, r) for r in pipe.execute()]
+
+    def _send(self, batch: list[_PendingEvent]) -> None:
+        """Publish a batch with a simple retry/backoff loop (sync), then report."""
+        import time
+
+        try:
+            max_attempts, backoff = self._retry_settings()
             attempts = 0
-            delay = max(0.1, cfg.retry_backoff_factor / 4)
-            subscribers: int = 0
+            delay = max(0.1, backoff / 4)
             while True:
                 try:
-                    assert self._redis_client is not None
-                    result = self._redis_client.publish(self._channel, event_json)
-                    subscribers = cast(int, result)
+                    results = self._publish_batch(batch)
                     break
                 except Exception as pub_err:  # pragma: no cover - network dependent
                     attempts += 1
-                    if attempts >= cfg.max_retry_attempts:
+                    if attempts >= max_attempts:
                         raise pub_err
                     logger.warning(
                         "Retrying redis_publish",
@@ -224,11 +342,17 @@ class EventPublisher:
                             "attempt": attempts,
                             "delay": round(delay, 3),
                             "error_class": type(pub_err).__name__,
+                            "batch_size": len(batch),
                         },
                     )
                     time.sleep(delay)
                     # Exponential backoff with a soft cap
-                    delay = min(max(1.0, cfg.retry_backoff_factor * 4), delay * 2)
+                    delay = min(max(1.0, backoff * 4), delay * 2)
+        except Exception as e:
+            self._report_failure(batch, e)
+            return
+
+        for (event_type, correlation_id, _), subscribers in zip(batch, results):
             logger.info(
                 "Event published",
                 extra={
@@ -239,39 +363,33 @@ class EventPublisher:
                     "status": "success",
                 },
             )
-            # metrics: success publish
-            try:
-                from os import getenv
+            self._count(event_type, "success")
 
-                worker = getenv("HOSTNAME", "fetcher-1")
-                events_published_total.labels(
-                    event_type=event_type, status="success", worker=worker
-                ).inc()
-            except Exception:
-                # metrics must never break publishing
-                pass
-        except Exception as e:
+    def _report_failure(self, batch: list[_PendingEvent], error: Exception) -> None:
+        """Log and count events that could not be published (non-fatal)."""
+        for event_type, correlation_id, _ in batch:
             logger.error(
                 "Failed to publish event",
                 extra={
                     "correlation_id": correlation_id,
                     "error_type": "publish_error",
-                    "error_class": type(e).__name__,
+                    "error_class": type(error).__name__,
                     "event_type": event_type,
                 },
-                exc_info=True,
+                exc_info=error,
             )
             # Rate-limit specific metrics are handled elsewhere; skip here
-            # metrics: failure publish
-            try:
-                from os import getenv
+            self._count(event_type, "failure")
 
-                worker = getenv("HOSTNAME", "fetcher-1")
-                events_published_total.labels(
-                    event_type=event_type, status="failure", worker=worker
-                ).inc()
-            except Exception:
-                pass
+    @staticmethod
+    def _count(event_type: str, status: str) -> None:
+        """Increment events_published_total; metrics must never break publishing."""
+        try:
+            events_published_total.labels(
+                event_type=event_type, status=status, worker=WORKER_ID
+            ).inc()
+        except Exception:
+            pass
 
     def publish_fetch_complete(
         self,
@@ -308,8 +426,7 @@ class EventPublisher:
             threads_file_path: Optional path to generated threads file.
             participants_file_path: Optional path to participants file.
         """
-        self._build_and_publish(
-            "messages_fetched",
+        self.publish_fetch_complete_payload(
             {
                 "chat": chat,
                 "date": date,
@@ -325,9 +442,21 @@ class EventPublisher:
                 "summary_file_path": summary_file_path,
                 "threads_file_path": threads_file_path,
                 "participants_file_path": participants_file_path,
-            },
+            }
         )
 
+    def publish_fetch_complete_payload(self, payload: dict[str, Any]) -> None:
+        """Publish a ``messages_fetched`` event from a caller-built payload.
+
+        For callers that already hold the fields (the daemon also logs them):
+        the dict is merged into the event as-is, with no keyword round-trip.
+
+        Args:
+            payload: Event fields as documented for ``publish_fetch_complete``
+                (``duration_seconds`` is expected to be rounded already)
+        """
+        self._build_and_publish("messages_fetched", payload)
+
     def publish_fetch_failed(
         self,
         chat: str,
@@ -158,6 +158,8 @@ class MessageExtractor:
     This provides a stable `extract()` callable for DI into use-cases.
     """
 
+    __slots__ = ("_gateway", "_limit")
+
     def __init__(
         self, gateway: TelegramGatewayProtocol, comments_limit: int = 50
     ) -> None:
@@ -10,6 +10,8 @@ Environment variables:
 - SCHEDULE_TIME: daily time in HH:MM (24h) when to enqueue (default: 02:00)
 - TIMEZONE: use "UTC" or leave empty to use container local time (default: UTC)
 - RUN_ON_START: if "true", send job immediately at start (default: false)
+- COMMANDS_MAX_QUEUE_DEPTH: slow down enqueueing above this queue depth
+  (default: 0, disabled)
 
 The command format matches CommandSubscriber expectations and includes `date`
 explicitly set to yesterday in YYYY-MM-DD.
@@ -17,7 +19,6 @@ explicitly set to yesterday in YYYY-MM-DD.
 
 from __future__ import annotations
 
-import json
 import os
 import sys
 import time
@@ -26,6 +27,8 @@ from typing import List
 
 import redis
 
+from src.services.command_subscriber import enqueue_command
+
 COMMANDS_QUEUE = "tg_commands"
 
 
@@ -80,6 +83,7 @@ def main() -> int:
     schedule_time = os.getenv("SCHEDULE_TIME", "02:00")
     timezone_name = (os.getenv("TIMEZONE") or "UTC").upper()
     run_on_start = os.getenv("RUN_ON_START", "false").lower() == "true"
+    max_queue_depth = int(os.getenv("COMMANDS_MAX_QUEUE_DEPTH", "0") or 0)
 
     chats: List[str] = [c.strip() for c in chats_env.split(",") if c.strip()]
     use_utc = timezone_name == "UTC"
@@ -100,7 +104,7 @@ def main() -> int:
         date_str = _yesterday_yyyy_mm_dd(use_utc=use_utc)
         for chat in chats:
             cmd = _create_fetch_command(chat, date_str)
-            r.rpush(COMMANDS_QUEUE, json.dumps(cmd))
+            enqueue_command(r, COMMANDS_QUEUE, cmd, max_queue_depth=max_queue_depth)
             print(f"→ Enqueued on start: {chat} {date_str}")
 
     # Main loop
@@ -113,7 +117,7 @@ def main() -> int:
             date_str = _yesterday_yyyy_mm_dd(use_utc=use_utc)
             for chat in chats:
                 cmd = _create_fetch_command(chat, date_str)
-                r.rpush(COMMANDS_QUEUE, json.dumps(cmd))
+                enqueue_command(r, COMMANDS_QUEUE, cmd, max_queue_depth=max_queue_depth)
                 print(f"→ Enqueued daily: {chat} {date_str}")
 
         except KeyboardInterrupt:
@@ -12,6 +12,7 @@ from typing import Any, Optional
 
 from src.core.config import FetcherConfig
 from src.di.container import Container
+from src.models.command import FetchRequest
 from src.observability.metrics_adapter import MetricsAdapter
 from src.repositories.protocols import MessageRepositoryProtocol
 from src.services.event_publisher import EventPublisherProtocol
@@ -35,11 +36,13 @@ class FetcherService:
     Coordinates session management, strategy execution, and data persistence.
     """
 
-    def __init__(self, config: FetcherConfig):
+    def __init__(self, config: FetcherConfig, *, redis_pool: Any = None):
         """Initialize fetcher service.
 
         Args:
             config: Validated FetcherConfig instance
+            redis_pool: Optional Redis connection pool shared with the caller
+                (the daemon) for event publishing
         """
         self.config = config
         # Validate mode-specific requirements early to fail fast on misconfiguration
@@ -49,7 +52,7 @@ class FetcherService:
             logger.error("Invalid configuration for fetch mode", exc_info=True)
             raise
         # Build application container
-        container = Container(config=self.config)
+        container = Container.instance(self.config, redis_pool=redis_pool)
         self._container = container
 
         # Initialize external resources via container (IoC)
@@ -82,10 +85,33 @@ class FetcherService:
         self._chat_use_case = container.provide_fetch_chat_use_case(
             date_range_use_case=self._date_range_use_case
         )
+        # Resolved once: every run/fetch_request reuses the same runner
+        self._runner = container.provide_fetch_runner()
 
-    def _create_strategy(self, date_str: Optional[str] = None) -> Any:
+    def _create_strategy(
+        self, date_str: Optional[str] = None, *, mode: Optional[str] = None
+    ) -> Any:
         """Delegate strategy creation to container's factory."""
-        return self._container.provide_strategy(date_str)
+        return self._container.provide_strategy(date_str, mode=mode)
+
+    async def open_session(self) -> None:
+        """Connect the Telegram client now and keep it open until ``aclose``."""
+        await self._container.provide_client()
+
+    async def aclose(self) -> None:
+        """Release the Telegram session and event publisher held by the service.
+
+        Long-lived owners (the daemon) reuse one service across commands and
+        call this once on shutdown.
+        """
+        try:
+            await self._container.provide_session_manager().close()
+        except Exception:
+            logger.debug("Failed to close Telegram session (non-fatal)", exc_info=True)
+        try:
+            self.event_publisher.disconnect()
+        except Exception:
+            logger.debug("Failed to disconnect event publisher", exc_info=True)
 
     # Skip logic fully handled inside use-cases; no local checks here
 
@@ -109,8 +135,7 @@ class FetcherService:
         )
 
         # Delegate orchestration to FetchRunner to keep facade minimal
-        runner = self._container.provide_fetch_runner()
-        await runner.run_all(strategy=strategy, correlation_id=correlation_id)
+        await self._runner.run_all(strategy=strategy, correlation_id=correlation_id)
 
     # Output existence checks are encapsulated within repository-aware use-cases
 
@@ -120,11 +145,31 @@ class FetcherService:
         self,
         chat_identifier: str,
         date_str: Optional[str] = None,
+        *,
+        override_mode: Optional[str] = None,
     ) -> dict[str, Any]:
-        """Fetch messages from a single chat (for daemon mode commands).
+        """Fetch messages from a single chat.
 
         Args:
             chat_identifier: Chat username or ID
+            date_str: Optional target date (YYYY-MM-DD)
+            override_mode: Optional fetch_mode override (e.g. "date")
+
+        Returns:
+            Result dictionary (see fetch_request)
+        """
+        return await self.fetch_request(
+            FetchRequest(chat_identifier, date_str, override_mode)
+        )
+
+    async def fetch_request(self, req: FetchRequest) -> dict[str, Any]:
+        """Fetch messages from a single chat (for daemon mode commands).
+
+        The service is reusable across calls: per-request date/mode travel in
+        ``req`` instead of rebuilding the service with a patched config.
+
+        Args:
+            req: Chat, target date and optional fetch_mode override
 
         Returns:
             Dictionary with fetch results:
@@ -139,7 +184,7 @@ class FetcherService:
         result: dict[str, Any] = {
             "message_count": 0,
             "file_path": "",
-            "source_id": chat_identifier,
+            "source_id": req.chat,
             "dates": [],
             "checksum_sha256": None,
             "estimated_tokens_total": 0,
@@ -150,10 +195,10 @@ class FetcherService:
             "participants_file_path": None,
         }
 
-        strategy = self._create_strategy(date_str)
+        chat_identifier = req.chat
+        strategy = self._create_strategy(req.date, mode=req.fetch_mode)
         try:
-            runner = self._container.provide_fetch_runner()
-            fetched = await runner.run_single(
+            fetched = await self._runner.run_single(
                 strategy=strategy,
                 chat_identifier=chat_identifier,
                 correlation_id=ensure_correlation_id(),
@@ -161,7 +206,8 @@ class FetcherService:
             result["message_count"] = fetched
 
             logger.info(
-                f"Fetch completed for chat {chat_identifier}",
+                "Fetch completed for chat %s",
+                chat_identifier,
                 extra={"fetched": result["message_count"]},
             )
             # Enforce result contract via Pydantic model, then return dict for
@@ -179,7 +225,9 @@ class FetcherService:
                 return result
         except Exception as e:
             logger.error(
-                f"Failed to fetch single chat {chat_identifier}: {e}",
+                "Failed to fetch single chat %s: %s",
+                chat_identifier,
+                e,
                 extra={"chat": chat_identifier},
                 exc_info=True,
             )
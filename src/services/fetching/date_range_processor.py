@@ -7,7 +7,7 @@ handler for each message.
 from __future__ import annotations
 
 from datetime import date, datetime
-from typing import Awaitable, Callable, Tuple
+from typing import Awaitable, Callable, Optional, Tuple
 
 from telethon import TelegramClient
 from telethon.hints import Entity
@@ -59,9 +59,13 @@ class DateRangeProcessor:
         end_datetime: datetime,
         correlation_id: str,
         handle: Callable[[TelethonMessage], Awaitable[bool]],
+        flush: Optional[Callable[[], Awaitable[int]]] = None,
     ) -> Tuple[int, int]:
         """Iterate messages for a date range and call the handler.
 
+        ``flush`` (optional) is awaited after the last message and returns how
+        many buffered messages it contributed, for handlers that work ahead.
+
         Returns a tuple of (processed_count, fetched_count).
         """
         iterator = MessageIterator(
@@ -77,4 +81,4 @@ class DateRangeProcessor:
             strategy_name=self._strategy_name,
             correlation_id=correlation_id,
         )
-        return await iterator.run(handle)
+        return await iterator.run(handle, flush=flush)
@@ -129,12 +129,15 @@ class MessageIterator:
     async def run(  # noqa: C901
         self,
         handle_message: Callable[[TelethonMessage], Awaitable[bool]],
+        flush: Optional[Callable[[], Awaitable[int]]] = None,
     ) -> Tuple[int, int]:
         """Iterate messages and invoke handler per message.
 
         Args:
             handle_message: Async function returning True if message contributed
                 to the fetched count (e.g., appended), False if skipped (e.g., merged)
+            flush: Optional async function awaited after iteration; returns the
+                number of buffered messages it contributed to the fetched count
 
         Returns:
             (messages_fetched, messages_processed)
@@ -168,13 +171,14 @@ class MessageIterator:
                 if elapsed < min_interval:
                     try:
                         from asyncio import sleep as _sleep
-                        from os import getenv
 
-                        from src.observability.metrics import rate_limit_hits_total
+                        from src.observability.metrics import (
+                            WORKER_ID,
+                            rate_limit_hits_total,
+                        )
 
-                        worker = getenv("HOSTNAME", "fetcher-1")
                         rate_limit_hits_total.labels(
-                            source="iterator", reason="throttle", worker=worker
+                            source="iterator", reason="throttle", worker=WORKER_ID
                         ).inc()
                         await _sleep(min_interval - elapsed)
                     except Exception:
@@ -217,11 +221,21 @@ class MessageIterator:
                     exc_info=True,
                 )
 
+        if flush is not None:
+            try:
+                fetched += await flush()
+            except Exception:
+                logger.warning(
+                    "Message handler flush failed (continuing)",
+                    extra={"correlation_id": self.correlation_id},
+                    exc_info=True,
+                )
+
         # Observe duration and counters at the end (best-effort)
         try:
-            from os import getenv
-
             from src.observability.metrics import (
+                WORKER_ID,
+                chat_label,
                 fetch_duration_seconds,
                 fetch_lag_seconds,
                 fetch_messages_total,
@@ -229,21 +243,16 @@ class MessageIterator:
             )
 
             duration = max(0.0, time.perf_counter() - started_at)
-            worker = getenv("HOSTNAME", "fetcher-1")
-            date_str = self.start_date.isoformat()
-            # Histogram: duration per chat/date
-            fetch_duration_seconds.labels(
-                chat=self.source_id, date=date_str, worker=worker
-            ).observe(duration)
-            # Counter: total messages per chat/date
+            worker = WORKER_ID
+            chat = chat_label(self.source_id)
+            # Histogram: duration per chat
+            fetch_duration_seconds.labels(chat=chat, worker=worker).observe(duration)
+            # Counter: total messages per chat
             if fetched > 0:
-                fetch_messages_total.labels(
-                    chat=self.source_id, date=date_str, worker=worker
-                ).inc(fetched)
-            # Counter: run per chat/date/strategy
+                fetch_messages_total.labels(chat=chat, worker=worker).inc(fetched)
+            # Counter: run per chat/strategy
             fetch_runs_total.labels(
-                chat=self.source_id,
-                date=date_str,
+                chat=chat,
                 worker=worker,
                 strategy=self.strategy_name,
             ).inc()
@@ -256,9 +265,9 @@ class MessageIterator:
                     now_utc = datetime.now(tz=_tz.utc)
                     end_ref = self.end_datetime
                     lag_seconds = max(0.0, (now_utc - end_ref).total_seconds())
-                    fetch_lag_seconds.labels(
-                        chat=self.source_id, date=date_str, worker=worker
-                    ).observe(lag_seconds)
+                    fetch_lag_seconds.labels(chat=chat, worker=worker).observe(
+                        lag_seconds
+                    )
                 except Exception:
                     pass
         except Exception:
@@ -113,21 +113,22 @@ class FinalizationOrchestrator:
                 "file_checksum_sha256": checksum,
             },
             threads=self._build_threads(collection),
-            participants=collection.senders,
+            participants=collection.senders_json(),
         )
 
         # Observe freshness lag if possible
         try:
-            from os import getenv
+            from src.observability.metrics import (
+                WORKER_ID,
+                chat_label,
+                fetch_lag_seconds,
+            )
 
-            from src.observability.metrics import fetch_lag_seconds
-
-            worker = getenv("HOSTNAME", "fetcher-1")
             if last_ts_dt is not None:
                 now_utc = datetime.now(tz=timezone.utc)
                 lag = max(0.0, (now_utc - last_ts_dt).total_seconds())
                 fetch_lag_seconds.labels(
-                    chat=source_info.id, date=start_date.isoformat(), worker=worker
+                    chat=chat_label(source_info.id), worker=WORKER_ID
                 ).observe(lag)
         except Exception:
             pass
@@ -20,6 +20,8 @@ from src.models.schemas import ForwardInfo, Message, Reaction, SourceInfo
 class TelegramGateway:
     """Facade for Telethon interactions and message extraction helpers."""
 
+    __slots__ = ()
+
     async def get_entity(self, client: TelegramClient, chat_identifier: str) -> Entity:
         """Resolve chat/channel/user entity by identifier."""
         return await client.get_entity(chat_identifier)
@@ -5,7 +5,8 @@ Keeps Telethon-specific entity mapping away from orchestration logic.
 
 from __future__ import annotations
 
-from typing import Any
+from functools import lru_cache
+from typing import Any, Optional
 
 from telethon.hints import Entity
 from telethon.tl.types import Channel, Chat, User
@@ -13,9 +14,54 @@ from telethon.tl.types import Channel, Chat, User
 from src.models.schemas import SourceInfo
 
 
+@lru_cache(maxsize=1024)
+def _build_source_info(
+    kind: str,
+    entity_id: Optional[int],
+    username: Optional[str],
+    title: Optional[str],
+    megagroup: bool,
+    chat_identifier: str,
+) -> SourceInfo:
+    """Build a (frozen) SourceInfo from plain entity fields.
+
+    Memoized on the fields that determine the result, so repeated lookups of
+    the same chat share one validated model.
+    """
+    source_id = chat_identifier
+    source_type = "unknown"
+    url = ""
+
+    if kind == "channel":
+        source_type = "supergroup" if megagroup else "channel"
+        if username:
+            source_id = f"@{username}"
+            url = f"https://t.me/{username}"
+        else:
+            source_id = f"channel_{entity_id}"
+            url = f"https://t.me/c/{entity_id}"
+    elif kind == "chat":
+        source_type = "chat" if not megagroup else "group"
+        source_id = f"chat_{entity_id}"
+        url = f"https://t.me/c/{entity_id}"
+    elif kind == "user":
+        source_type = "chat"
+        if username:
+            source_id = f"@{username}"
+            url = f"https://t.me/{username}"
+        else:
+            source_id = f"user_{entity_id}"
+    else:
+        title = "Unknown"
+
+    return SourceInfo(id=source_id, title=title, url=url, type=source_type)
+
+
 class SourceInfoMapper:
     """Map Telethon entities to SourceInfo and resolve sender display names."""
 
+    __slots__ = ()
+
     def extract_source_info(self, entity: Entity, chat_identifier: str) -> SourceInfo:
         """Build SourceInfo from a Telethon entity and fallback identifier.
 
@@ -26,40 +72,34 @@ class SourceInfoMapper:
         Returns:
             SourceInfo describing the source id, title, url, and type
         """
-        source_id = chat_identifier
-        title = "Unknown"
-        source_type = "unknown"
-        url = ""
-
         if isinstance(entity, Channel):
-            title = entity.title
-            if entity.megagroup:
-                source_type = "supergroup"
-            else:
-                source_type = "channel"
-            if entity.username:
-                source_id = f"@{entity.username}"
-                url = f"https://t.me/{entity.username}"
-            else:
-                source_id = f"channel_{entity.id}"
-                url = f"https://t.me/c/{entity.id}"
-
-        elif isinstance(entity, Chat):
-            title = entity.title
-            source_type = "chat" if not entity.megagroup else "group"
-            source_id = f"chat_{entity.id}"
-            url = f"https://t.me/c/{entity.id}"
-
-        elif isinstance(entity, User):
-            title = self.get_sender_name(entity)
-            source_type = "chat"
-            if entity.username:
-                source_id = f"@{entity.username}"
-                url = f"https://t.me/{entity.username}"
-            else:
-                source_id = f"user_{entity.id}"
-
-        return SourceInfo(id=source_id, title=title, url=url, type=source_type)
+            return _build_source_info(
+                "channel",
+                entity.id,
+                entity.username,
+                entity.title,
+                bool(entity.megagroup),
+                chat_identifier,
+            )
+        if isinstance(entity, Chat):
+            return _build_source_info(
+                "chat",
+                entity.id,
+                None,
+                entity.title,
+                bool(entity.megagroup),
+                chat_identifier,
+            )
+        if isinstance(entity, User):
+            return _build_source_info(
+                "user",
+                entity.id,
+                entity.username,
+                self.get_sender_name(entity),
+                False,
+                chat_identifier,
+            )
+        return _build_source_info("unknown", None, None, None, False, chat_identifier)
 
     def get_sender_name(self, sender: Any) -> str:
         """Resolve a human-friendly sender display name.
@@ -6,10 +6,23 @@ and short-message merge policy.
 
 from __future__ import annotations
 
+import re
 from typing import Any, Callable, Optional
 
 from src.models.schemas import Message
 
+# A pipeline step writes one enrichment field given the message and its text
+EnrichStep = Callable[[Message, str], None]
+
+_LINK_PATTERNS = tuple(
+    re.compile(pat, flags=re.IGNORECASE)
+    for pat in (
+        r"https?://\S+",
+        r"t\.me/\S+",
+        r"[\w.-]+\.(?:com|org|io|dev|ru)(?:/\S*)?",
+    )
+)
+
 
 class MessagePreprocessor:
     """Encapsulates message enrichment and merge policy.
@@ -24,6 +37,22 @@ class MessagePreprocessor:
     Delegates to provided callables to avoid duplication during initial extraction.
     """
 
+    # Read for every message: slot access instead of instance-dict lookups
+    __slots__ = (
+        "link_normalize_enabled",
+        "token_estimate_enabled",
+        "message_classifier_enabled",
+        "language_detect_enabled",
+        "merge_short_messages_enabled",
+        "merge_short_messages_max_length",
+        "merge_short_messages_max_gap_seconds",
+        "_normalize_url",
+        "_estimate_tokens",
+        "_classify_message",
+        "_detect_language",
+        "_pipeline",
+    )
+
     def __init__(
         self,
         *,
@@ -52,25 +81,39 @@ class MessagePreprocessor:
         self._estimate_tokens = estimate_tokens_fn
         self._classify_message = classify_message_fn
         self._detect_language = detect_language_fn
+        # Feature flags are fixed for the preprocessor's lifetime, so resolve
+        # them once into the list of steps ``enrich`` runs for every message
+        self._pipeline: tuple[EnrichStep, ...] = tuple(
+            step
+            for enabled, step in (
+                (link_normalize_enabled, self._enrich_links),
+                (token_estimate_enabled, self._enrich_tokens),
+                (message_classifier_enabled, self._enrich_type),
+                (language_detect_enabled, self._enrich_lang),
+            )
+            if enabled
+        )
 
     def enrich(self, message: Message) -> Message:
         """Apply lightweight enrichments to a single message instance."""
         text = message.text or ""
-        # Links
-        if self.link_normalize_enabled:
-            message.normalized_links = self._extract_and_normalize_links(text)
-        # Tokens
-        if self.token_estimate_enabled:
-            message.token_count = self._estimate_tokens(text)
-        # Classifier
-        if self.message_classifier_enabled:
-            # `source_info` is not needed inside classifier for now; pass None
-            message.message_type = self._classify_message(text, message, None)
-        # Lang
-        if self.language_detect_enabled:
-            message.lang = self._detect_language(text)
+        for step in self._pipeline:
+            step(message, text)
         return message
 
+    def _enrich_links(self, message: Message, text: str) -> None:
+        message.normalized_links = self._extract_and_normalize_links(text)
+
+    def _enrich_tokens(self, message: Message, text: str) -> None:
+        message.token_count = self._estimate_tokens(text)
+
+    def _enrich_type(self, message: Message, text: str) -> None:
+        # `source_info` is not needed inside classifier for now; pass None
+        message.message_type = self._classify_message(text, message, None)
+
+    def _enrich_lang(self, message: Message, text: str) -> None:
+        message.lang = self._detect_language(text)
+
     def _can_merge_short(self, prev: Optional[Message], curr: Message) -> bool:
         """Check whether two consecutive messages are eligible for merge.
 
@@ -123,18 +166,11 @@ class MessagePreprocessor:
         return True
 
     def _extract_and_normalize_links(self, text: str) -> list[str]:
-        import re
-
         if not text:
             return []
-        patterns = [
-            r"https?://\S+",
-            r"t\.me/\S+",
-            r"[\w.-]+\.(?:com|org|io|dev|ru)(?:/\S*)?",
-        ]
         candidates: list[str] = []
-        for pat in patterns:
-            candidates.extend(re.findall(pat, text, flags=re.IGNORECASE))
+        for pat in _LINK_PATTERNS:
+            candidates.extend(pat.findall(text))
         links: list[str] = []
         for raw in candidates:
             norm = self._normalize_url(raw)
@@ -4,7 +4,6 @@ This module provides tracking of which dates have been successfully fetched
 for each source, preventing duplicate work and allowing resumable fetching.
 """
 
-import json
 import logging
 from datetime import date, datetime
 from pathlib import Path
@@ -12,6 +11,8 @@ from typing import Optional
 
 from pydantic import BaseModel, Field
 
+from src.utils import serialization
+
 logger = logging.getLogger(__name__)
 
 
@@ -78,8 +79,8 @@ class ProgressTracker:
             return Progress(version=self._schema_version)
 
         try:
-            with open(self.progress_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(self.progress_file, "rb") as f:
+                data = serialization.loads(f.read())
             progress = Progress(**data)
             logger.info(
                 f"Loaded progress for {len(progress.sources)} sources",
@@ -95,13 +96,11 @@ class ProgressTracker:
         try:
             # Atomic write: temp file then rename
             temp_path = self.progress_file.with_suffix(".tmp")
-            with open(temp_path, "w", encoding="utf-8") as f:
-                json.dump(
-                    self.progress.model_dump(mode="json"),
-                    f,
-                    ensure_ascii=False,
-                    indent=2,
-                )
+            payload = serialization.dumps(
+                self.progress.model_dump(mode="json"), indent=True
+            )
+            with open(temp_path, "wb") as f:
+                f.write(payload)
             temp_path.replace(self.progress_file)
             logger.debug(f"Progress saved to {self.progress_file}")
         except Exception as e:
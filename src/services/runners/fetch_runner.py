@@ -10,9 +10,10 @@ from dataclasses import dataclass
 from typing import Any, Protocol
 
 from telethon import TelegramClient
+from telethon.errors import FloodWaitError as TelethonFloodWaitError
 
 from src.core.config import FetcherConfig
-from src.core.exceptions import ChatNotFoundError, NetworkError
+from src.core.exceptions import ChatNotFoundError, FloodWaitError, NetworkError
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +30,7 @@ class _ChatUseCase(Protocol):
     ) -> int: ...
 
 
-@dataclass
+@dataclass(slots=True)
 class FetchRunnerDeps:
     """Dependencies container for FetchRunner."""
 
@@ -86,7 +87,19 @@ class FetchRunner:
         correlation_id: str,
     ) -> None:
         """Run fetching for one chat (fire-and-forget wrapper)."""
-        await self._safe_execute(client, chat_identifier, strategy, correlation_id)
+        try:
+            await self._safe_execute(client, chat_identifier, strategy, correlation_id)
+        except FloodWaitError as fw:
+            # No caller retries batch runs; report and move on to other chats
+            logger.warning(
+                "Telegram rate limit hit; chat skipped",
+                extra={
+                    "correlation_id": correlation_id,
+                    "error_type": "rate_limit",
+                    "chat": chat_identifier,
+                    "wait_seconds": fw.wait_seconds,
+                },
+            )
 
     async def _safe_execute(
         self,
@@ -95,7 +108,12 @@ class FetchRunner:
         strategy: Any,
         correlation_id: str,
     ) -> int:
-        """Safely execute use-case with error categorization and logging."""
+        """Safely execute use-case with error categorization and logging.
+
+        FloodWaits are not swallowed: Telethon's error is translated into
+        ``src.core.exceptions.FloodWaitError`` and raised, so callers can sleep
+        through or defer the fetch.
+        """
         try:
             return await self.d.chat_use_case.execute(
                 client=client,
@@ -104,6 +122,15 @@ class FetchRunner:
                 correlation_id=correlation_id,
                 concurrency=self.d.config.fetch_concurrency_per_chat,
             )
+        except FloodWaitError:
+            raise
+        except TelethonFloodWaitError as fw:
+            raise FloodWaitError(
+                str(fw),
+                wait_seconds=fw.seconds,
+                chat=chat_identifier,
+                correlation_id=correlation_id,
+            ) from fw
         except ChatNotFoundError:
             logger.error(
                 "Chat not found or inaccessible",
@@ -1,5 +1,6 @@
 """Telegram session management."""
 
+import asyncio
 from pathlib import Path
 from typing import Any, Optional
 
@@ -42,6 +43,11 @@ class SessionManager:
         self.session_dir.mkdir(parents=True, exist_ok=True)
 
         self._client: Optional[TelegramClient] = None
+        # Concurrent users share one client: connect once, close after the last
+        self._connect_lock = asyncio.Lock()
+        self._users = 0
+        # Set by open(): long-lived workers keep the client across commands
+        self._keep_alive = False
         # Remove + from phone for safe filename
         safe_phone = phone.replace("+", "")
         self._session_file = self.session_dir / f"session_{safe_phone}.session"
@@ -56,6 +62,31 @@ class SessionManager:
         Returns:
             Connected TelegramClient instance
         """
+        async with self._connect_lock:
+            return await self._ensure_client()
+
+    async def open(self) -> TelegramClient:
+        """Connect now and keep the client open until :meth:`close`.
+
+        Context-manager users then share the live client instead of
+        connecting and disconnecting around every fetch.
+
+        Returns:
+            Connected TelegramClient instance
+        """
+        self._keep_alive = True
+        return await self.get_client()
+
+    def is_connected(self) -> bool:
+        """Return True if a client exists and its connection is up."""
+        return self._client is not None and self._client.is_connected()
+
+    async def _ensure_client(self) -> TelegramClient:
+        """Create, connect and authorize the client if needed (lock held)."""
+        if self._client is not None and not self._client.is_connected():
+            # A kept-alive client may have dropped between commands
+            logger.info("Telegram client disconnected, reconnecting")
+            await self._client.connect()
         if self._client is None:
             # Mask phone for logs to avoid PII leakage
             masked_phone = (
@@ -136,6 +167,7 @@ class SessionManager:
 
     async def close(self) -> None:
         """Close the Telegram client connection."""
+        self._keep_alive = False
         if self._client is not None:
             logger.info("Closing Telegram client")
             await self._client.disconnect()
@@ -147,7 +179,12 @@ class SessionManager:
         Returns:
             Connected and authorized TelegramClient instance
         """
-        return await self.get_client()
+        self._users += 1
+        try:
+            return await self.get_client()
+        except BaseException:
+            self._users -= 1
+            raise
 
     async def __aexit__(
         self,
@@ -162,4 +199,6 @@ class SessionManager:
             exc_val: Exception value if an exception was raised
             exc_tb: Exception traceback if an exception was raised
         """
-        await self.close()
+        self._users = max(0, self._users - 1)
+        if self._users == 0 and not self._keep_alive:
+            await self.close()
@@ -31,13 +31,19 @@ class StrategyFactory:
         """
         self._config = config
 
-    def create(self, date_str: Optional[str] = None) -> BaseFetchStrategy:
+    def create(
+        self, date_str: Optional[str] = None, *, mode: Optional[str] = None
+    ) -> BaseFetchStrategy:
         """Return strategy for current config.
 
+        Args:
+            date_str: Optional ISO date string override
+            mode: Optional fetch_mode override (takes precedence over config)
+
         Raises:
             ValueError: if fetch_mode is unsupported
         """
-        mode = self._config.fetch_mode
+        mode = mode or self._config.fetch_mode
         if mode == "date":
             if not date_str:
                 # fall back to config.fetch_date if available
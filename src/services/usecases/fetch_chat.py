@@ -9,8 +9,10 @@ from datetime import date
 from typing import Any, AsyncIterator, Protocol
 
 from telethon import TelegramClient
+from telethon.errors import FloodWaitError as TelethonFloodWaitError
 
 from src.core.config import FetcherConfig
+from src.core.exceptions import FloodWaitError
 from src.models.schemas import SourceInfo
 
 logger = logging.getLogger(__name__)
@@ -45,7 +47,7 @@ class _DateRangeUseCase(Protocol):
     ) -> int: ...
 
 
-@dataclass
+@dataclass(slots=True)
 class FetchChatDeps:
     """Dependencies required by FetchChatUseCase."""
 
@@ -105,10 +107,16 @@ class FetchChatUseCase:
 
         if tasks:
             results = await asyncio.gather(*tasks, return_exceptions=True)
+            flood: BaseException | None = None
             for r in results:
-                if isinstance(r, Exception):
+                if isinstance(r, (FloodWaitError, TelethonFloodWaitError)):
+                    flood = flood or r
+                elif isinstance(r, Exception):
                     logger.warning("Date range task failed", exc_info=True)
                 elif isinstance(r, int):
                     fetched_total += r
+            if flood is not None:
+                # Rate limits are the caller's to sleep through or defer
+                raise flood
 
         return fetched_total
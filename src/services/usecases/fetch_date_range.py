@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections import deque
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
 from typing import Any, Awaitable, Callable, Protocol, Tuple
@@ -51,6 +53,7 @@ class _DateRangeProcessor(Protocol):
         end_datetime: datetime,
         correlation_id: str,
         handle: Any,
+        flush: Any = None,
     ) -> Tuple[int, int]: ...
 
 
@@ -90,7 +93,7 @@ class _ProgressTracker(Protocol):
     def get_source_progress(self, source: str) -> Any | None: ...
 
 
-@dataclass
+@dataclass(slots=True)
 class FetchDateRangeDeps:
     """Dependencies required by FetchDateRangeUseCase."""
 
@@ -183,6 +186,10 @@ class FetchDateRangeUseCase:
         last_processed_id: int | None = None
         # Optional in-run deduplication
         seen_ids: set[int] = set()
+        # Senders already named in this collection: one lookup per sender
+        named_senders: set[Any] = set()
+        # Read once: the config is fixed for the run and handle() is per message
+        dedup_in_run = cfg.dedup_in_run_enabled
         try:
             sp = self.d.progress_tracker.get_source_progress(source_info.id)
             if sp and sp.last_processed_date == start_date.isoformat():
@@ -190,45 +197,47 @@ class FetchDateRangeUseCase:
         except Exception:
             logger.debug("Progress lookup failed for last_message_id", exc_info=True)
 
-        # Iterate
-        async def handle(msg):  # type: ignore[no-untyped-def]
-            message_data = await self.d.extract_message_data(
-                client, entity, msg, source_info
-            )
-            message_data = self.d.preprocessor.enrich(message_data)
+        # Extraction (comment lookups are Telegram round-trips) runs up to
+        # `window` messages ahead; merge/dedup below still apply in order
+        extract = self.d.extract_message_data
+        window = max(1, int(getattr(cfg, "extract_concurrency", 1)))
+        pending: deque[tuple[Any, asyncio.Future[Any]]] = deque()
+
+        async def apply(msg, extraction):  # type: ignore[no-untyped-def]
+            message_data = self.d.preprocessor.enrich(await extraction)
             # Idempotency by last processed id (chat:date:last_message_id threshold)
             mid = getattr(message_data, "id", None)
             if isinstance(mid, int):
                 # Skip if we've already processed up to this id for the same date
                 if last_processed_id is not None and mid <= last_processed_id:
                     try:
-                        from os import getenv
-
-                        from src.observability.metrics import dedup_skipped_total
+                        from src.observability.metrics import (
+                            WORKER_ID,
+                            chat_label,
+                            dedup_skipped_total,
+                        )
 
-                        worker = getenv("HOSTNAME", "fetcher-1")
                         dedup_skipped_total.labels(
-                            chat=source_info.id,
-                            date=start_date.isoformat(),
+                            chat=chat_label(source_info.id),
                             reason="leq_last",
-                            worker=worker,
+                            worker=WORKER_ID,
                         ).inc()
                     except Exception:
                         pass
                     return False
                 # Optional: skip duplicates encountered within the same run
-                if self.d.config.dedup_in_run_enabled and mid in seen_ids:
+                if dedup_in_run and mid in seen_ids:
                     try:
-                        from os import getenv
-
-                        from src.observability.metrics import dedup_skipped_total
+                        from src.observability.metrics import (
+                            WORKER_ID,
+                            chat_label,
+                            dedup_skipped_total,
+                        )
 
-                        worker = getenv("HOSTNAME", "fetcher-1")
                         dedup_skipped_total.labels(
-                            chat=source_info.id,
-                            date=start_date.isoformat(),
+                            chat=chat_label(source_info.id),
                             reason="seen_in_run",
-                            worker=worker,
+                            worker=WORKER_ID,
                         ).inc()
                     except Exception:
                         pass
@@ -240,28 +249,68 @@ class FetchDateRangeUseCase:
                 return False
             collection.messages.append(message_data)
             # Track seen ids only if in-run dedup is enabled
-            if (
-                isinstance(getattr(message_data, "id", None), int)
-                and self.d.config.dedup_in_run_enabled
-            ):
+            if dedup_in_run and isinstance(getattr(message_data, "id", None), int):
                 seen_ids.add(message_data.id)
-            if getattr(message_data, "sender_id", None):
+            sender_id = getattr(message_data, "sender_id", None)
+            if sender_id and sender_id not in named_senders:
+                named_senders.add(sender_id)
                 sender_name = self.d.source_mapper.get_sender_name(
                     getattr(msg, "sender", None)
                 )
-                collection.add_sender(message_data.sender_id, sender_name)
+                collection.add_sender(sender_id, sender_name)
             return True
 
-        fetched, processed = await self.d.date_range_processor.iterate(
-            client=client,
-            entity=entity,
-            source_info=source_info,
-            start_date=start_date,
-            start_datetime=start_datetime,
-            end_datetime=end_datetime,
-            correlation_id=correlation_id,
-            handle=handle,
-        )
+        appended = 0
+
+        async def apply_next() -> bool:
+            nonlocal appended
+            added = bool(await apply(*pending.popleft()))
+            appended += added
+            return added
+
+        # Iterate
+        async def handle(msg):  # type: ignore[no-untyped-def]
+            pending.append(
+                (msg, asyncio.ensure_future(extract(client, entity, msg, source_info)))
+            )
+            if len(pending) < window:
+                return False
+            return await apply_next()
+
+        async def flush() -> int:
+            """Apply extractions still in flight, in message order."""
+            added = 0
+            while pending:
+                try:
+                    added += await apply_next()
+                except Exception:
+                    logger.warning(
+                        "Message handler failed (continuing)",
+                        extra={"correlation_id": correlation_id},
+                        exc_info=True,
+                    )
+            return added
+
+        try:
+            await self.d.date_range_processor.iterate(
+                client=client,
+                entity=entity,
+                source_info=source_info,
+                start_date=start_date,
+                start_datetime=start_datetime,
+                end_datetime=end_datetime,
+                correlation_id=correlation_id,
+                handle=handle,
+                flush=flush,
+            )
+            # No-op when the processor already flushed
+            await flush()
+        finally:
+            for _, extraction in pending:
+                extraction.cancel()
+            # The gauge sums in-flight runs: take this one out even if it failed
+            self.d.progress_service.reset_gauge(source_info.id, start_date.isoformat())
+        fetched = appended
 
         # Save
         file_path = None
@@ -303,7 +352,4 @@ class FetchDateRangeUseCase:
         except Exception:
             logger.warning("Finalization failed (non-fatal)", exc_info=True)
 
-        # Reset progress gauge
-        self.d.progress_service.reset_gauge(source_info.id, start_date.isoformat())
-
         return fetched
@@ -4,6 +4,8 @@ Provides context management for correlation IDs across async request lifecycle.
 """
 
 import contextvars
+import itertools
+import os
 import uuid
 from types import TracebackType
 from typing import Optional
@@ -13,14 +15,33 @@ _correlation_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
     "correlation_id", default=None
 )
 
+# IDs are a random per-process base plus a counter: one urandom read per
+# process instead of one per ID. Only the low 62 bits vary, which the UUID
+# version/variant bits never touch, so IDs stay unique for 2**61 calls.
+_id_base = 0
+_id_counter = itertools.count()
+
+
+def _reseed_ids() -> None:
+    """Draw a fresh random base (at import and in forked children)."""
+    global _id_base, _id_counter
+    _id_base = int.from_bytes(os.urandom(16), "big")
+    _id_counter = itertools.count()
+
+
+_reseed_ids()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_ids)
+
 
 def generate_correlation_id() -> str:
     """Generate a new correlation ID.
 
     Returns:
-        UUID4 string for correlation tracking
+        UUID4-formatted string for correlation tracking
     """
-    return str(uuid.uuid4())
+    value = (_id_base + next(_id_counter)) & ((1 << 128) - 1)
+    return str(uuid.UUID(int=value, version=4))
 
 
 def get_correlation_id() -> Optional[str]:
@@ -0,0 +1,39 @@
+"""Event loop helpers.
+
+Runs entry points on uvloop when it is available; the stdlib loop is used
+otherwise (e.g. on Windows, where uvloop is unsupported).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Coroutine
+from typing import Any, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def _uvloop_factory() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """Return uvloop's loop constructor, or None for the stdlib default."""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """Run an entry-point coroutine on uvloop when available.
+
+    Uses ``asyncio.Runner`` with an explicit loop factory instead of swapping
+    the global event loop policy, then closes the loop as ``asyncio.run``
+    does.
+
+    Args:
+        main: Coroutine to run to completion
+
+    Returns:
+        The coroutine's result
+    """
+    with asyncio.Runner(loop_factory=_uvloop_factory()) as runner:
+        return runner.run(main)
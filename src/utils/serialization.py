@@ -0,0 +1,78 @@
+"""Fast JSON (de)serialization helpers for the Redis hot path.
+
+Uses ``orjson`` when it is installed and falls back to the stdlib ``json``
+module otherwise, so callers never need to care which backend is active.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import date
+from typing import Any, Callable, Optional
+
+try:  # pragma: no cover - exercised implicitly depending on environment
+    import orjson as _orjson
+except ImportError:  # pragma: no cover
+    _orjson = None  # type: ignore[assignment]
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so catching the
+# stdlib class covers both backends.
+JSONDecodeError = json.JSONDecodeError
+
+HAS_ORJSON = _orjson is not None
+
+
+def _default(obj: Any) -> Any:
+    """Stdlib fallback for types orjson encodes natively (ISO 8601 dates)."""
+    if isinstance(obj, date):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(
+    obj: Any, *, indent: bool = False, default: Optional[Callable[[Any], Any]] = None
+) -> bytes:
+    """Serialize an object to UTF-8 JSON bytes (compact unless ``indent``).
+
+    ``date``/``datetime`` values are encoded as ISO 8601 strings (same text as
+    ``isoformat()``), so callers can pass them without formatting first.
+
+    Args:
+        obj: JSON-serializable object
+        indent: Pretty-print with two-space indentation (for files on disk);
+            the output matches ``json.dump(..., ensure_ascii=False, indent=2)``
+        default: Fallback encoder for types neither backend handles natively
+
+    Returns:
+        Encoded JSON document as bytes (accepted natively by redis-py)
+    """
+    if _orjson is not None:
+        return _orjson.dumps(
+            obj, default=default, option=_orjson.OPT_INDENT_2 if indent else None
+        )
+    if indent:
+        return json.dumps(
+            obj, ensure_ascii=False, indent=2, default=default or _default
+        ).encode("utf-8")
+    return json.dumps(
+        obj, ensure_ascii=False, separators=(",", ":"), default=default or _default
+    ).encode("utf-8")
+
+
+def loads(data: str | bytes | bytearray | memoryview) -> Any:
+    """Deserialize a JSON document from ``str`` or bytes-like input.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Decoded Python object
+
+    Raises:
+        JSONDecodeError: If the document is not valid JSON
+    """
+    if _orjson is not None:
+        return _orjson.loads(data)
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = bytes(data).decode("utf-8")
+    return json.loads(data)
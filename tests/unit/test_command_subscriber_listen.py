@@ -0,0 +1,341 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from src.services.command_subscriber import CommandSubscriber
+
+
+class StubRedis:
+    """Returns queued BLPOP results in order and records requested timeouts."""
+
+    def __init__(self, results, subscriber):
+        self._results = list(results)
+        self._subscriber = subscriber
+        self.timeouts: list[int] = []
+
+    def blpop(self, keys, timeout=0):
+        self.timeouts.append(timeout)
+        if not self._results:
+            self._subscriber.stop()
+            return None
+        return self._results.pop(0)
+
+
+@pytest.mark.asyncio
+async def test_listen_adapts_blpop_timeout_when_idle():
+    handled: list[dict] = []
+
+    async def handler(cmd):
+        handled.append(cmd)
+
+    sub = CommandSubscriber(
+        "redis://localhost:6379",
+        command_handler=handler,
+        blpop_timeout=2,
+        max_blpop_timeout=5,
+    )
+    results = [
+        None,
+        None,
+        None,
+        ("tg_commands", '{"command": "fetch", "chat": "c1"}'),
+        None,
+    ]
+    sub._redis_client = StubRedis(results, sub)
+
+    await sub.listen()
+
+    # Doubles while idle (capped at max), resets after a command arrives
+    assert sub._redis_client.timeouts[:6] == [2, 4, 5, 5, 2, 4]
+    assert handled == [{"command": "fetch", "chat": "c1"}]
+
+
+@pytest.mark.asyncio
+async def test_handle_command_invalid_json_is_non_fatal():
+    sub = CommandSubscriber("redis://localhost:6379")
+    # Must not raise on malformed payloads (str or bytes)
+    await sub._handle_command("{oops")
+    await sub._handle_command(b"{oops")
+
+
+class StubAckRedis:
+    def __init__(self, payloads, subscriber):
+        self._payloads = list(payloads)
+        self._subscriber = subscriber
+        self.moved: list[tuple[str, str]] = []
+        self.removed: list[tuple[str, int, str]] = []
+
+    def blmove(self, src, dst, timeout, wherefrom, whereto):
+        if not self._payloads:
+            self._subscriber.stop()
+            return None
+        payload = self._payloads.pop(0)
+        self.moved.append((src, dst))
+        return payload
+
+    def lrem(self, name, count, value):
+        self.removed.append((name, count, value))
+        return 1
+
+
+@pytest.mark.asyncio
+async def test_listen_acks_after_handling_when_enabled():
+    order: list[str] = []
+
+    sub = CommandSubscriber("redis://localhost:6379", worker_id="w1", ack_enabled=True)
+    stub = StubAckRedis(['{"command": "fetch", "chat": "c1"}'], sub)
+
+    async def handler(cmd):
+        # Nothing acknowledged while the command is still being handled
+        assert stub.removed == []
+        order.append(cmd["chat"])
+
+    sub.command_handler = handler
+    sub._redis_client = stub
+
+    await sub.listen(timeout=1)
+
+    assert order == ["c1"]
+    assert stub.moved == [("tg_commands", "tg_commands:processing:w1")]
+    assert stub.removed == [
+        ("tg_commands:processing:w1", 1, '{"command": "fetch", "chat": "c1"}')
+    ]
+
+
+class StubDelayedRedis:
+    def __init__(self) -> None:
+        self.zset: dict[bytes, float] = {}
+        self.queue: list[bytes] = []
+
+    def zadd(self, name, mapping):
+        self.zset.update(mapping)
+
+    def zrangebyscore(self, name, lo, hi):
+        return [
+            m
+            for m, score in sorted(self.zset.items(), key=lambda kv: kv[1])
+            if score <= hi
+        ]
+
+    def zrem(self, name, member):
+        return 1 if self.zset.pop(member, None) is not None else 0
+
+    def rpush(self, name, value):
+        self.queue.append(value)
+
+    def register_script(self, script):
+        # Python stand-in for _PROMOTE_DUE_LUA (ZRANGEBYSCORE, ZREM + RPUSH)
+        assert "ZRANGEBYSCORE" in script and "RPUSH" in script
+
+        def run(keys, args):
+            due = self.zrangebyscore(keys[0], "-inf", args[0])
+            for payload in due:
+                self.zrem(keys[0], payload)
+                self.rpush(keys[1], payload)
+            return len(due)
+
+        return run
+
+
+def test_defer_and_promote_due_commands():
+    sub = CommandSubscriber("redis://localhost:6379", delayed_enabled=True)
+    stub = StubDelayedRedis()
+    sub._redis_client = stub
+
+    assert sub.defer_command({"command": "fetch", "chat": "late"}, 100)
+    assert sub.defer_command({"command": "fetch", "chat": "soon"}, 0)
+
+    assert sub.promote_due_commands() == 1
+    assert [json.loads(p)["chat"] for p in stub.queue] == ["soon"]
+    # Not due yet, stays parked
+    assert len(stub.zset) == 1
+    assert sub.promote_due_commands(now=time.time() + 200) == 1
+    assert [json.loads(p)["chat"] for p in stub.queue] == ["soon", "late"]
+
+
+class _ListsRedis:
+    """Lists and string keys, enough for reclaiming processing lists."""
+
+    def __init__(self, lists, alive):
+        self.lists = {k: list(v) for k, v in lists.items()}
+        self.keys = set(alive)
+
+    def ping(self):
+        return True
+
+    def set(self, name, value, ex=None):
+        self.keys.add(name)
+
+    def exists(self, name):
+        return int(name in self.keys)
+
+    def scan_iter(self, match):
+        prefix = match.rstrip("*")
+        return [k.encode() for k in list(self.lists) if k.startswith(prefix)]
+
+    def register_script(self, script):
+        # Python stand-in for _RECLAIM_LUA (LMOVE RIGHT -> LEFT until empty)
+        assert "LMOVE" in script
+
+        def run(keys, args=()):
+            src = self.lists.get(keys[0], [])
+            dst = self.lists.setdefault(keys[1], [])
+            moved = 0
+            while src:
+                dst.insert(0, src.pop())
+                moved += 1
+            return moved
+
+        return run
+
+
+def test_connect_reclaims_own_and_dead_workers_processing_lists(monkeypatch):
+    stub = _ListsRedis(
+        {
+            "tg_commands": ["queued"],
+            "tg_commands:processing:w1": ["own-1", "own-2"],
+            "tg_commands:processing:dead": ["dead-1"],
+            "tg_commands:processing:live": ["live-1"],
+        },
+        alive={"tg_commands:alive:live"},
+    )
+    monkeypatch.setattr(
+        "src.services.command_subscriber.redis.from_url", lambda *a, **k: stub
+    )
+    sub = CommandSubscriber("redis://localhost:6379", worker_id="w1", ack_enabled=True)
+
+    sub.connect()
+
+    # Stranded commands go back to the head in their original order
+    assert stub.lists["tg_commands"][-1] == "queued"
+    assert sorted(stub.lists["tg_commands"][:3]) == ["dead-1", "own-1", "own-2"]
+    assert stub.lists["tg_commands"].index("own-1") < stub.lists["tg_commands"].index(
+        "own-2"
+    )
+    assert stub.lists["tg_commands:processing:w1"] == []
+    assert stub.lists["tg_commands:processing:dead"] == []
+    # A worker that is still alive keeps its in-flight command
+    assert stub.lists["tg_commands:processing:live"] == ["live-1"]
+    assert "tg_commands:alive:w1" in stub.keys
+
+
+class _RequeueRedis:
+    def __init__(self, subscriber):
+        self._subscriber = subscriber
+        self.pushed: list = []
+
+    def blpop(self, keys, timeout=0):
+        # Shutdown lands while blocked; the pop still returns a command
+        self._subscriber.stop()
+        return ("tg_commands", '{"command": "fetch", "chat": "c1"}')
+
+    def lpush(self, queue, payload):
+        self.pushed.append((queue, payload))
+
+    def pipeline(self, transaction=True):
+        return _StubPipeline(self)
+
+
+class _StubPipeline:
+    """Records queued commands and runs them against the stub on execute()."""
+
+    def __init__(self, client):
+        self._client = client
+        self._calls: list = []
+
+    def __getattr__(self, name):
+        def _queue(*args):
+            self._calls.append((name, args))
+            return self
+
+        return _queue
+
+    def execute(self):
+        return [getattr(self._client, n)(*a) for n, a in self._calls]
+
+
+@pytest.mark.asyncio
+async def test_command_popped_after_stop_is_requeued():
+    handled: list[dict] = []
+
+    async def handler(cmd):
+        handled.append(cmd)
+
+    sub = CommandSubscriber(
+        "redis://localhost:6379", command_handler=handler, commands_queue="q"
+    )
+    sub._redis_client = _RequeueRedis(sub)
+
+    await sub.listen()
+
+    assert handled == []
+    assert sub._redis_client.pushed == [("q", '{"command": "fetch", "chat": "c1"}')]
+    assert sub.busy is False
+
+
+class _BacklogRedis:
+    """Queue with a backlog; records how many round-trips the consumer makes."""
+
+    def __init__(self, payloads, subscriber):
+        self.queue = list(payloads)
+        self._subscriber = subscriber
+        self.blocking_pops = 0
+        self.pipelines = 0
+        self.pushed: list = []
+
+    def blpop(self, keys, timeout=0):
+        self.blocking_pops += 1
+        if not self.queue:
+            self._subscriber.stop()
+            return None
+        return ("q", self.queue.pop(0))
+
+    def lpop(self, key):
+        return self.queue.pop(0) if self.queue else None
+
+    def lpush(self, queue, payload):
+        self.pushed.append(payload)
+
+    def pipeline(self, transaction=True):
+        self.pipelines += 1
+        return _StubPipeline(self)
+
+
+@pytest.mark.asyncio
+async def test_prefetch_drains_backlog_and_serializes_same_chat():
+    active: dict[str, int] = {}
+    overlap: list[str] = []
+    handled: list[str] = []
+
+    async def handler(cmd):
+        chat = cmd["chat"]
+        active[chat] = active.get(chat, 0) + 1
+        if active[chat] > 1:
+            overlap.append(chat)
+        await asyncio.sleep(0.01)
+        active[chat] -= 1
+        handled.append(f"{chat}:{cmd['n']}")
+
+    sub = CommandSubscriber(
+        "redis://localhost:6379",
+        command_handler=handler,
+        commands_queue="q",
+        prefetch_count=4,
+    )
+    payloads = [
+        json.dumps({"command": "fetch", "chat": c, "n": i})
+        for i, c in enumerate(["a", "a", "b", "c", "d"])
+    ]
+    sub._redis_client = _BacklogRedis(payloads, sub)
+
+    await sub.listen()
+
+    assert sorted(handled) == ["a:0", "a:1", "b:2", "c:3", "d:4"]
+    # Same chat never ran concurrently and kept queue order
+    assert overlap == [] and handled.index("a:0") < handled.index("a:1")
+    # 5 commands: 2 blocking pops + 1 drain pipeline (+1 final idle pop)
+    assert sub._redis_client.blocking_pops == 3
+    assert sub._redis_client.pipelines == 2
+    assert sub._chat_locks == {}
@@ -6,6 +6,7 @@ import pytest
 from pydantic import ValidationError
 
 from src.models.command import FetchCommand, FetchMode, FetchStrategy
+from src.utils import serialization
 
 
 class TestFetchCommandValidation:
@@ -369,3 +370,78 @@ class TestEdgeCases:
             strategy=FetchStrategy.BATCH,
         )
         assert (cmd.to_date - cmd.from_date).days == 365
+
+
+def test_fetch_request_is_frozen_and_slotted():
+    import dataclasses
+
+    from src.models.command import FetchRequest
+
+    req = FetchRequest("@c", "2025-01-02", "date")
+    assert not hasattr(req, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        req.date = "2025-01-03"  # type: ignore[misc]
+    assert FetchRequest("@c") == FetchRequest("@c", None, None)
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        ({"date": date(2025, 1, 15)}, {"date": "2025-01-15"}),
+        ({"mode": FetchMode.DAYS, "days": 3, "limit": 5}, {"days": 3, "limit": 5}),
+        (
+            {
+                "mode": FetchMode.RANGE,
+                "from_date": date(2025, 1, 1),
+                "to_date": date(2025, 1, 2),
+            },
+            {"from": "2025-01-01", "to": "2025-01-02"},
+        ),
+    ],
+)
+def test_to_event_params_per_mode(kwargs, expected):
+    kwargs.setdefault("mode", FetchMode.DATE)
+    cmd = FetchCommand(command="fetch", chat="@testchat", **kwargs)
+    params = cmd.to_event_params()
+    assert params == {
+        "mode": cmd.mode.value,
+        "strategy": "batch",
+        "force": False,
+        **expected,
+    }
+    assert serialization.loads(serialization.dumps(params))["mode"] == cmd.mode.value
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("https://t.me/somechat", "https://t.me/somechat"),
+        (" -100123 ", "-100123"),
+        ("-", "@-"),
+        ("chat123", "@chat123"),
+    ],
+)
+def test_normalize_chat_edge_cases(raw, expected):
+    cmd = FetchCommand(command="fetch", chat=raw, mode=FetchMode.DAYS, days=1)
+    assert cmd.chat == expected
+
+
+def test_get_output_path_uses_chat_name():
+    cmd = FetchCommand(command="fetch", chat="@news", mode=FetchMode.DAYS, days=1)
+    assert cmd.chat_name == "news"
+    assert "chat_name" not in FetchCommand.model_fields
+    assert (
+        cmd.get_output_path("data", date(2025, 3, 4))
+        == "data/news/2025/discussions_2025-03-04.json"
+    )
+    assert "chat_name" not in cmd.model_dump()
+
+
+def test_chat_name_follows_chat_changes():
+    cmd = FetchCommand(command="fetch", chat="@foo", mode=FetchMode.DAYS, days=1)
+    assert cmd.chat_name == "foo"
+
+    cmd.chat = "@bar"
+    assert cmd.get_output_path("x", date(2025, 3, 4)).startswith("x/bar/")
+    copied = cmd.model_copy(update={"chat": "@baz"})
+    assert copied.chat_name == "baz"
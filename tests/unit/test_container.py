@@ -0,0 +1,157 @@
+"""Unit tests for lazy wiring in the DI container."""
+
+import sys
+from types import SimpleNamespace
+
+from src.di.container import Container
+from src.repositories.message_repository import MessageRepository
+
+
+def test_container_builds_services_on_first_use(tmp_path):
+    cfg = SimpleNamespace(
+        storage_backend="file", data_dir=tmp_path, data_schema_version="1.0"
+    )
+    container = Container(config=cfg)  # type: ignore[arg-type]
+
+    # Nothing is constructed up front
+    assert "_repository" not in vars(container)
+    assert "_telegram_gateway" not in vars(container)
+
+    repo = container.provide_repository()
+    assert isinstance(repo, MessageRepository)
+    assert container.provide_repository() is repo
+    assert container.provide_telegram_gateway() is container.provide_telegram_gateway()
+    # Unused services stay unbuilt
+    assert "_session" not in vars(container)
+
+
+def test_file_backend_does_not_import_mongo(tmp_path):
+    sys.modules.pop("src.repositories.mongo_repository", None)
+    cfg = SimpleNamespace(
+        storage_backend="file", data_dir=tmp_path, data_schema_version="1.0"
+    )
+    Container(config=cfg).provide_repository()  # type: ignore[arg-type]
+    assert "src.repositories.mongo_repository" not in sys.modules
+
+
+def _config(tmp_path):
+    from src.core.config import FetcherConfig
+
+    return FetcherConfig(
+        telegram_api_id=1,
+        telegram_api_hash="a" * 32,
+        telegram_phone="+12345678901",
+        telegram_chats=["@c"],
+        data_dir=tmp_path / "data",
+        session_dir=tmp_path / "sessions",
+        progress_file=tmp_path / "progress.json",
+        enable_metrics=False,
+        enable_events=False,
+    )
+
+
+def test_fetch_graph_is_composed_once(tmp_path):
+    container = Container(config=_config(tmp_path))
+
+    runner = container.provide_fetch_runner()
+    assert container.provide_fetch_runner() is runner
+    date_range = container.provide_fetch_date_range_use_case()
+    assert container.provide_fetch_date_range_use_case() is date_range
+    assert runner.d.chat_use_case.d.date_range_use_case is date_range
+
+    # A custom extractor still gets its own use-case
+    async def _extract(*_args):
+        return None
+
+    custom = container.provide_fetch_date_range_use_case(extract_message_data=_extract)
+    assert custom is not date_range
+    assert custom.d.finalization_orchestrator is date_range.d.finalization_orchestrator
+    assert custom.d.extract_message_data is _extract
+
+    chat = container.provide_fetch_chat_use_case(date_range_use_case=date_range)
+    assert chat is runner.d.chat_use_case
+    custom_chat = container.provide_fetch_chat_use_case(date_range_use_case=custom)
+    assert custom_chat is not chat
+    assert custom_chat.d.date_range_use_case is custom
+    assert custom_chat.d.telegram_gateway is chat.d.telegram_gateway
+
+
+def test_command_handler_and_strategies_are_memoized(tmp_path):
+    container = Container(config=_config(tmp_path))
+
+    assert container.provide_command_handler() is container.provide_command_handler()
+
+    yesterday = container.provide_strategy()
+    assert container.provide_strategy() is yesterday
+    by_date = container.provide_strategy("2025-01-02", mode="date")
+    assert container.provide_strategy("2025-01-02", mode="date") is by_date
+    assert by_date is not yesterday
+
+    container.reset_strategy_cache()
+    assert container.provide_strategy() is not yesterday
+
+
+def test_instance_is_shared_per_config(tmp_path):
+    Container.reset()
+    cfg = _config(tmp_path)
+    try:
+        shared = Container.instance(cfg)
+        assert Container.instance(cfg) is shared
+        other = Container.instance(_config(tmp_path))
+        assert other is not shared
+        Container.reset()
+        assert Container.instance(cfg) is not shared
+    finally:
+        Container.reset()
+
+
+def test_parse_command_builds_request_for_fetch_only():
+    from src.di.container import _parse_command
+    from src.models.command import FetchRequest
+
+    assert _parse_command({"command": "fetch", "chat": 42, "date": "2025-01-02"}) == (
+        FetchRequest("42", "2025-01-02")
+    )
+    assert _parse_command({"command": "fetch", "chat": "@c"}) == FetchRequest("@c")
+    assert _parse_command({"command": "ping", "chat": "@c"}) is None
+    assert _parse_command({"command": "fetch", "chat": ""}) is None
+
+
+def test_fetcher_service_reuses_container_runner(tmp_path):
+    from src.services.fetcher_service import FetcherService
+
+    Container.reset()
+    try:
+        service = FetcherService(_config(tmp_path))
+        assert service._runner is service._container.provide_fetch_runner()
+    finally:
+        Container.reset()
+
+
+def test_strategy_label_is_pushed_only_on_change(tmp_path):
+    container = Container(config=_config(tmp_path))
+    names = []
+    container._date_range_processor.set_strategy_name = names.append
+
+    container.provide_strategy()
+    container.provide_strategy()
+    container.provide_strategy("2025-01-02", mode="date")
+    container.provide_strategy()
+
+    assert names == ["yesterday", "date", "yesterday"]
+
+
+def test_event_publisher_borrows_the_shared_redis_pool():
+    cfg = SimpleNamespace(
+        redis_url="redis://localhost:6379",
+        redis_password=None,
+        enable_events=True,
+        events_channel="tg_events",
+        service_name="svc",
+        max_retry_attempts=1,
+        retry_backoff_factor=0.1,
+        events_fire_and_forget=False,
+    )
+    pool = object()
+    publisher = Container(config=cfg, redis_pool=pool).provide_event_publisher()
+    assert publisher._connection_pool is pool  # type: ignore[attr-defined]
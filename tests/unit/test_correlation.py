@@ -31,3 +31,11 @@ def test_context_manager_sets_and_resets():
         assert get_correlation_id() == "custom-123"
     # After context exit, previous value restored
     assert get_correlation_id() == prev
+
+
+def test_generated_ids_are_unique_uuid4():
+    import uuid
+
+    ids = [generate_correlation_id() for _ in range(1000)]
+    assert len(set(ids)) == len(ids)
+    assert all(uuid.UUID(cid).version == 4 for cid in ids)
@@ -0,0 +1,410 @@
+"""Unit tests for FetcherDaemon._handle_fetch_command request handling."""
+
+import asyncio
+import contextlib
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from src.core.exceptions import (
+    ChatNotFoundError,
+    FloodWaitError,
+    NetworkError,
+    TelegramAuthError,
+)
+from src.daemon import FetcherDaemon
+
+
+class _Config(SimpleNamespace):
+    def model_copy(self, *args: Any, **kwargs: Any) -> Any:
+        raise AssertionError("config must not be copied per command")
+
+
+class _StubService:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, str | None, str | None]] = []
+
+    async def fetch_request(self, req):
+        self.calls.append((req.chat, req.date, req.fetch_mode))
+        return {"message_count": 1}
+
+
+class _StubPublisher:
+    def __init__(self) -> None:
+        self.completed: list[dict[str, Any]] = []
+        self.failed: list[dict[str, Any]] = []
+
+    def pipeline(self):
+        return contextlib.nullcontext()
+
+    def publish_fetch_complete_payload(self, payload: dict[str, Any]) -> None:
+        self.completed.append(payload)
+
+    def publish_fetch_failed(self, **kwargs: Any) -> None:
+        self.failed.append(kwargs)
+
+
+def _make_daemon() -> tuple[FetcherDaemon, _StubService, _StubPublisher]:
+    cfg = _Config(
+        max_retry_attempts=1,
+        retry_backoff_factor=0.1,
+        max_flood_wait_seconds=600,
+        flood_wait_defer_threshold=60,
+        max_parallel_days=4,
+        fetch_mode="date",
+    )
+    daemon = FetcherDaemon(cfg)  # type: ignore[arg-type]
+    service = _StubService()
+    publisher = _StubPublisher()
+    daemon._fetcher_service = service  # type: ignore[assignment]
+    daemon.event_publisher = publisher  # type: ignore[assignment]
+    return daemon, service, publisher
+
+
+@pytest.mark.asyncio
+async def test_date_command_overrides_mode_without_copying_config():
+    daemon, service, publisher = _make_daemon()
+
+    await daemon._handle_fetch_command(
+        {"command": "fetch", "chat": "@c", "date": "2025-01-02", "days_back": 2}
+    )
+
+    # Every offset maps to the same explicit date, so it is fetched once
+    assert service.calls == [("@c", "2025-01-02", "date")]
+    assert [e["date"] for e in publisher.completed] == ["2025-01-02"]
+
+
+@pytest.mark.asyncio
+async def test_recent_command_keeps_configured_mode():
+    daemon, service, _ = _make_daemon()
+
+    await daemon._handle_fetch_command({"command": "fetch", "chat": "@c"})
+
+    assert len(service.calls) == 1
+    assert service.calls[0][2] is None
+
+
+@pytest.mark.asyncio
+async def test_service_is_reused_across_commands_and_closed_on_stop():
+    daemon, service, _ = _make_daemon()
+    closed: list[bool] = []
+
+    async def _aclose() -> None:
+        closed.append(True)
+
+    service.aclose = _aclose  # type: ignore[attr-defined]
+
+    await daemon._handle_fetch_command({"command": "fetch", "chat": "@a"})
+    await daemon._handle_fetch_command({"command": "fetch", "chat": "@b"})
+    assert [c[0] for c in service.calls] == ["@a", "@b"]
+    assert daemon._fetcher_service is service
+
+    daemon.running = True
+    daemon.event_publisher = None
+    await daemon.stop()
+    assert closed == [True]
+    assert daemon._fetcher_service is None
+
+
+class _BlockingSubscriber:
+    def __init__(self, busy: bool) -> None:
+        self.busy = busy
+        self.stopped = False
+        self._release = asyncio.Event()
+
+    async def listen(self, timeout: int = 5) -> None:
+        if self.busy:
+            # Simulate an in-flight command that finishes after stop()
+            while not self.stopped:
+                await asyncio.sleep(0)
+            return
+        await self._release.wait()  # idle BLPOP that never returns
+
+    def stop(self) -> None:
+        self.stopped = True
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("busy", [False, True])
+async def test_shutdown_event_interrupts_listen(busy):
+    daemon, _, _ = _make_daemon()
+    sub = _BlockingSubscriber(busy=busy)
+    daemon.command_subscriber = sub  # type: ignore[assignment]
+
+    task = asyncio.create_task(daemon._listen_until_shutdown())
+    await asyncio.sleep(0)
+    daemon._handle_shutdown(15)
+    await asyncio.wait_for(task, timeout=1)
+
+    assert sub.stopped is True
+
+
+@pytest.mark.asyncio
+async def test_days_are_fetched_concurrently_within_limit():
+    daemon, service, publisher = _make_daemon()
+    daemon.config.max_parallel_days = 2
+    active = {"now": 0, "peak": 0}
+
+    async def _fetch(req):
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        await asyncio.sleep(0.01)
+        active["now"] -= 1
+        service.calls.append((req.chat, req.date, req.fetch_mode))
+        return {"message_count": 1}
+
+    service.fetch_request = _fetch  # type: ignore[method-assign]
+
+    await daemon._handle_fetch_command(
+        {"command": "fetch", "chat": "@c", "days_back": 5}
+    )
+
+    assert active["peak"] == 2
+    assert len(service.calls) == 5
+    # Events keep day order regardless of completion order
+    dates = [e["date"] for e in publisher.completed]
+    assert dates == sorted(dates, reverse=True) and len(set(dates)) == 5
+
+
+@pytest.mark.asyncio
+async def test_days_back_without_date_fetches_yesterday_once():
+    from datetime import date, timedelta
+
+    daemon, service, publisher = _make_daemon()
+    daemon.config.fetch_mode = "yesterday"
+
+    await daemon._handle_fetch_command(
+        {"command": "fetch", "chat": "@c", "days_back": 3}
+    )
+
+    # The strategy ignores per-day dates, so every offset is the same window
+    yesterday = (date.today() - timedelta(days=1)).isoformat()
+    assert service.calls == [("@c", yesterday, None)]
+    assert [e["date"] for e in publisher.completed] == [yesterday]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "error", [ChatNotFoundError("gone", chat="@c"), RuntimeError("boom")]
+)
+async def test_failure_event_reports_monotonic_duration(error):
+    daemon, service, publisher = _make_daemon()
+
+    async def _fail(req):
+        raise error
+
+    service.fetch_request = _fail  # type: ignore[method-assign]
+
+    await daemon._handle_fetch_command(
+        {"command": "fetch", "chat": "@c", "date": "2025-01-02"}
+    )
+
+    assert len(publisher.failed) == 1
+    assert publisher.failed[0]["date"] == "2025-01-02"
+    assert 0 <= publisher.failed[0]["duration_seconds"] < 5
+
+
+@pytest.mark.asyncio
+async def test_main_logs_fatal_errors(monkeypatch, caplog):
+    import logging
+
+    import src.daemon as daemon_mod
+
+    class _Cfg:
+        log_level = "INFO"
+        log_format = "text"
+        loki_url = None
+
+        def validate_mode_requirements(self) -> None:
+            pass
+
+    async def _boom(self) -> None:
+        raise RuntimeError("redis down")
+
+    monkeypatch.setattr(daemon_mod, "FetcherConfig", _Cfg)
+    monkeypatch.setattr(daemon_mod, "setup_logging", lambda **_: None)
+    monkeypatch.setattr(daemon_mod.FetcherDaemon, "start", _boom)
+
+    with caplog.at_level(logging.CRITICAL, logger="src.daemon"):
+        assert await daemon_mod.main() == 1
+
+    (record,) = caplog.records
+    assert record.getMessage() == "Fatal error in daemon"
+    assert record.exc_info is not None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("error", "prefix"),
+    [
+        (TelegramAuthError("denied"), "auth_error:"),
+        (FloodWaitError("slow", wait_seconds=1000), "rate_limit: wait 1000s"),
+        (NetworkError("reset"), "network_error:"),
+        (ChatNotFoundError("gone", chat="@c"), "chat_not_found:"),
+        (ValueError("odd"), "ValueError:"),
+    ],
+)
+async def test_typed_errors_publish_their_failure_reason(error, prefix):
+    daemon, service, publisher = _make_daemon()
+
+    async def _fail(req):
+        raise error
+
+    service.fetch_request = _fail  # type: ignore[method-assign]
+
+    await daemon._handle_fetch_command({"command": "fetch", "chat": "@c"})
+
+    (failed,) = publisher.failed
+    assert failed["error"].startswith(prefix)
+
+
+def test_worker_id_falls_back_to_hostname(monkeypatch):
+    import socket
+
+    from src.observability import metrics
+
+    monkeypatch.delenv("HOSTNAME", raising=False)
+    monkeypatch.setattr(socket, "gethostname", lambda: "node-7")
+    assert metrics._resolve_worker_id() == "node-7"
+    monkeypatch.setattr(socket, "gethostname", lambda: "")
+    assert metrics._resolve_worker_id().startswith("fetcher-")
+    assert metrics._resolve_worker_id() != "fetcher-1"
+
+    # The daemon labels its metrics with the same id as every other module
+    daemon, _, _ = _make_daemon()
+    assert daemon.worker_id is metrics.WORKER_ID
+
+
+def test_command_subscriber_uses_configured_queue_and_timeouts():
+    daemon, _, _ = _make_daemon()
+    daemon.config.redis_url = "redis://localhost:6379"
+    daemon.config.redis_password = None
+    daemon.config.commands_queue = "custom_q"
+    daemon.config.commands_blpop_timeout = 10
+    daemon.config.commands_blpop_max_timeout = 60
+    daemon.config.commands_ack_enabled = True
+    daemon.config.commands_prefetch_count = 8
+    daemon.config.enable_metrics = False
+
+    sub = daemon._create_command_subscriber()
+
+    assert sub._queue == "custom_q"
+    assert (sub._blpop_timeout, sub._max_blpop_timeout) == (10, 60)
+    assert sub._processing_queue == f"custom_q:processing:{daemon.worker_id}"
+    assert sub._delayed_enabled is True
+    assert sub._prefetch_count == 8
+
+
+@pytest.mark.asyncio
+async def test_completion_log_start_ts_is_wall_clock(caplog):
+    import logging
+    from datetime import datetime, timezone
+
+    daemon, _, _ = _make_daemon()
+    before = datetime.now(timezone.utc)
+
+    with caplog.at_level(logging.INFO, logger="src.daemon"):
+        await daemon._handle_fetch_command(
+            {"command": "fetch", "chat": "@c", "days_back": 2}
+        )
+
+    done = [
+        r for r in caplog.records if r.getMessage() == "Fetch completed successfully"
+    ]
+    assert len(done) == 2
+    for record in done:
+        start_ts = datetime.fromisoformat(record.start_ts)
+        assert before <= start_ts <= datetime.now(timezone.utc)
+
+
+def test_pub_pool_size_is_fixed_unless_overridden():
+    daemon, _, _ = _make_daemon()
+    daemon.config.redis_max_connections = None
+    assert daemon._pub_pool_size() == 4
+    daemon.config.max_parallel_days = 16
+    assert daemon._pub_pool_size() == 4
+    daemon.config.redis_max_connections = 20
+    assert daemon._pub_pool_size() == 20
+
+
+def _subscriber_daemon(**settings: Any) -> FetcherDaemon:
+    daemon, _, _ = _make_daemon()
+    defaults = dict(
+        redis_url="redis://localhost:6379",
+        redis_password=None,
+        commands_queue="tg_commands",
+        commands_blpop_timeout=5,
+        commands_blpop_max_timeout=30,
+        commands_ack_enabled=False,
+        commands_prefetch_count=1,
+        enable_metrics=False,
+    )
+    for key, value in {**defaults, **settings}.items():
+        setattr(daemon.config, key, value)
+    return daemon
+
+
+@pytest.mark.asyncio
+async def test_daemon_listen_backs_off_to_configured_blpop_max_timeout():
+    daemon = _subscriber_daemon(commands_blpop_timeout=2, commands_blpop_max_timeout=5)
+    sub = daemon._create_command_subscriber()
+    timeouts: list[int] = []
+
+    def blpop(keys, timeout=0):
+        timeouts.append(timeout)
+        if len(timeouts) == 4:
+            sub.stop()
+        return None
+
+    sub._redis_client = SimpleNamespace(blpop=blpop)
+    await sub.listen()
+
+    assert timeouts == [2, 4, 5, 5]
+
+
+@pytest.mark.asyncio
+async def test_daemon_subscriber_acks_after_handling_and_counts():
+    from src.observability.metrics_adapter import PrometheusMetricsAdapter
+
+    daemon = _subscriber_daemon(commands_ack_enabled=True, enable_metrics=True)
+    service = daemon._fetcher_service
+    sub = daemon._create_command_subscriber()
+    assert isinstance(sub._metrics, PrometheusMetricsAdapter)
+
+    payloads = ['{"command": "fetch", "chat": "@c", "days_back": 1}']
+    removed: list[tuple[str, int, str]] = []
+
+    def blmove(src, dst, timeout, wherefrom, whereto):
+        if not payloads:
+            sub.stop()
+            return None
+        return payloads.pop(0)
+
+    def lrem(name, count, value):
+        # Acknowledged only once the fetch has run
+        assert service.calls  # type: ignore[union-attr]
+        removed.append((name, count, value))
+
+    sub._redis_client = SimpleNamespace(blmove=blmove, lrem=lrem)
+    await sub.listen()
+
+    processing = f"tg_commands:processing:{daemon.worker_id}"
+    assert [r[0] for r in removed] == [processing]
+
+
+def test_fetcher_service_shares_the_daemon_publish_pool(monkeypatch):
+    import src.daemon as daemon_mod
+
+    built: list[tuple[Any, Any]] = []
+    monkeypatch.setattr(
+        daemon_mod,
+        "FetcherService",
+        lambda config, *, redis_pool=None: built.append((config, redis_pool)),
+    )
+    daemon, _, _ = _make_daemon()
+    daemon._fetcher_service = None
+    daemon._pub_pool = pool = object()  # type: ignore[assignment]
+
+    daemon._get_fetcher_service()
+    assert built == [(daemon.config, pool)]
@@ -0,0 +1,105 @@
+"""Regression tests: retry/FloodWait waits in the daemon must not block the loop."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.exceptions import FloodWaitError
+from src.daemon import FetcherDaemon
+
+_real_sleep = asyncio.sleep
+
+
+def _make_daemon() -> FetcherDaemon:
+    cfg = SimpleNamespace(
+        max_retry_attempts=3,
+        retry_backoff_factor=0.4,
+        max_flood_wait_seconds=600,
+        flood_wait_defer_threshold=60,
+    )
+    return FetcherDaemon(cfg)  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_floodwaits_do_not_block_event_loop(monkeypatch):
+    def _blocking_sleep(_s):
+        raise AssertionError("time.sleep must never be used on retry paths")
+
+    async def _scaled_sleep(seconds, *args, **kwargs):
+        # FloodWait(1) sleeps wait+1=2s; scale to 0.2s to keep the test fast
+        await _real_sleep(seconds / 10)
+
+    monkeypatch.setattr(time, "sleep", _blocking_sleep)
+    monkeypatch.setattr(asyncio, "sleep", _scaled_sleep)
+
+    daemon = _make_daemon()
+
+    def make_op(chat: str):
+        calls = {"n": 0}
+
+        async def op():
+            calls["n"] += 1
+            if calls["n"] == 1:
+                raise FloodWaitError("flood", wait_seconds=1, chat=chat)
+            return {"message_count": 1}
+
+        return op
+
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        daemon._run_with_retries(make_op("a"), "a", "2025-01-01", "cid-a"),
+        daemon._run_with_retries(make_op("b"), "b", "2025-01-01", "cid-b"),
+    )
+    elapsed = time.perf_counter() - started
+
+    assert results == [{"message_count": 1}, {"message_count": 1}]
+    # Both 0.2s waits overlap; a blocking sleep would take >= 0.4s
+    assert elapsed < 0.35
+
+
+class _StubSubscriber:
+    def __init__(self, depth: int) -> None:
+        self.depth = depth
+        self.deferred: list[tuple[dict, float]] = []
+
+    async def queue_depth_async(self) -> int:
+        return self.depth
+
+    def defer_command(self, command, delay_seconds) -> bool:
+        self.deferred.append((command, delay_seconds))
+        return True
+
+
+@pytest.mark.asyncio
+async def test_max_flood_wait_drops_to_threshold_when_queue_has_work():
+    daemon = _make_daemon()
+    assert await daemon._max_flood_wait() == 600  # no subscriber yet
+    daemon.command_subscriber = _StubSubscriber(depth=0)  # type: ignore[assignment]
+    assert await daemon._max_flood_wait() == 600
+    daemon.command_subscriber.depth = 3  # type: ignore[union-attr]
+    assert await daemon._max_flood_wait() == 60
+
+
+@pytest.mark.asyncio
+async def test_max_flood_wait_skips_queue_depth_when_deferral_disabled():
+    daemon = _make_daemon()
+    daemon.config.flood_wait_defer_threshold = 0
+
+    class _NoDepth(_StubSubscriber):
+        async def queue_depth_async(self) -> int:
+            raise AssertionError("LLEN must not run with deferral disabled")
+
+    daemon.command_subscriber = _NoDepth(depth=3)  # type: ignore[assignment]
+    assert await daemon._max_flood_wait() == 600
+
+
+def test_maybe_defer_only_long_waits():
+    daemon = _make_daemon()
+    sub = _StubSubscriber(depth=1)
+    daemon.command_subscriber = sub  # type: ignore[assignment]
+    cmd = {"command": "fetch", "chat": "c"}
+    assert daemon._maybe_defer(cmd, 30) is False
+    assert daemon._maybe_defer(cmd, 300) is True
+    assert sub.deferred == [(cmd, 300)]
@@ -0,0 +1,46 @@
+import json
+
+from src.services import command_subscriber as cs
+
+
+def test_compute_enqueue_delay_linear_and_capped():
+    assert cs.compute_enqueue_delay(50, 100) == 0.0
+    assert cs.compute_enqueue_delay(500, 0) == 0.0  # disabled
+    assert cs.compute_enqueue_delay(150, 100, delay_ms=100) == 0.05
+    assert cs.compute_enqueue_delay(10_000, 100, delay_ms=100, max_delay_ms=2000) == 2.0
+
+
+class StubRedis:
+    def __init__(self, depth: int) -> None:
+        self.depth = depth
+        self.pushed: list[tuple[str, bytes]] = []
+
+    def llen(self, name):
+        return self.depth
+
+    def rpush(self, name, value):
+        self.pushed.append((name, value))
+
+
+def test_enqueue_command_sleeps_when_over_threshold(monkeypatch):
+    slept: list[float] = []
+    monkeypatch.setattr(cs.time, "sleep", lambda s: slept.append(s))
+    client = StubRedis(depth=30)
+
+    delay = cs.enqueue_command(
+        client, "tg_commands", {"command": "fetch", "chat": "c"}, max_queue_depth=10
+    )
+
+    assert delay == slept[0] == 0.2
+    name, payload = client.pushed[0]
+    assert name == "tg_commands"
+    assert json.loads(payload) == {"command": "fetch", "chat": "c"}
+
+
+def test_enqueue_command_no_check_when_disabled(monkeypatch):
+    slept: list[float] = []
+    monkeypatch.setattr(cs.time, "sleep", lambda s: slept.append(s))
+    client = StubRedis(depth=10_000)
+    assert cs.enqueue_command(client, "q", {"command": "fetch"}) == 0.0
+    assert slept == []
+    assert len(client.pushed) == 1
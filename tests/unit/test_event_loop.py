@@ -0,0 +1,30 @@
+import asyncio
+import sys
+from types import SimpleNamespace
+
+from src.utils.event_loop import run
+
+
+def test_run_uses_stdlib_loop_without_uvloop(monkeypatch):
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+
+    async def _main():
+        return type(asyncio.get_running_loop())
+
+    assert issubclass(run(_main()), asyncio.BaseEventLoop)
+
+
+def test_run_uses_uvloop_factory_when_available(monkeypatch):
+    created = []
+
+    def _factory():
+        created.append(True)
+        return asyncio.new_event_loop()
+
+    monkeypatch.setitem(sys.modules, "uvloop", SimpleNamespace(new_event_loop=_factory))
+
+    async def _main():
+        return 7
+
+    assert run(_main()) == 7
+    assert created == [True]
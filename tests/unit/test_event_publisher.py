@@ -64,3 +64,116 @@ def test_event_publisher_publish_failure_is_non_fatal(monkeypatch):
         message_count=1,
         file_path="/tmp/file.json",
     )
+
+
+def test_event_publisher_uses_shared_connection_pool(monkeypatch):
+    import src.services.event_publisher as ep
+
+    created: dict = {}
+
+    class StubRedis:
+        def __init__(self, **kwargs):
+            created.update(kwargs)
+
+        def ping(self):
+            return True
+
+        def close(self):
+            pass
+
+    def _no_from_url(*_a, **_k):
+        raise AssertionError("from_url must not be used when a pool is given")
+
+    monkeypatch.setattr(ep.redis, "Redis", StubRedis)
+    monkeypatch.setattr(ep.redis, "from_url", _no_from_url)
+
+    pool = object()
+    pub = EventPublisher(
+        redis_url="redis://localhost:6379",
+        connection_pool=pool,  # type: ignore[arg-type]
+    )
+    pub.connect()
+    assert created == {"connection_pool": pool}
+
+
+def test_event_publisher_pipeline_flushes_once():
+    pub = EventPublisher(
+        redis_url="redis://localhost:6379",
+        max_retry_attempts=1,
+        retry_backoff_factor=1.0,
+    )
+
+    class StubPipe:
+        def __init__(self, sink):
+            self.sink = sink
+            self.buffer = []
+
+        def publish(self, channel, payload):
+            self.buffer.append((channel, payload))
+
+        def execute(self):
+            self.sink.append(list(self.buffer))
+            return [1] * len(self.buffer)
+
+    class StubRedis:
+        def __init__(self):
+            self.executed: list = []
+            self.direct: list = []
+
+        def publish(self, channel, payload):
+            self.direct.append(payload)
+            return 1
+
+        def pipeline(self, transaction=True):
+            assert transaction is False
+            return StubPipe(self.executed)
+
+    stub = StubRedis()
+    pub._redis_client = stub  # type: ignore[attr-defined]
+
+    with pub.pipeline():
+        for day in ("2025-01-01", "2025-01-02", "2025-01-03"):
+            pub.publish_fetch_failed(chat="@c", date=day, error="x")
+        assert stub.executed == []  # buffered until exit
+
+    assert stub.direct == []
+    assert len(stub.executed) == 1 and len(stub.executed[0]) == 3
+
+    # Outside the block events are published immediately
+    pub.publish_fetch_failed(chat="@c", date="2025-01-04", error="x")
+    assert len(stub.direct) == 1
+
+
+def test_event_publisher_fire_and_forget_drains_on_disconnect():
+    import threading
+
+    pub = EventPublisher(
+        redis_url="redis://localhost:6379",
+        max_retry_attempts=1,
+        retry_backoff_factor=1.0,
+        fire_and_forget=True,
+    )
+    release = threading.Event()
+    caller = threading.get_ident()
+    published: list = []
+
+    class SlowRedis:
+        def publish(self, channel, payload):
+            assert threading.get_ident() != caller  # off the calling thread
+            release.wait(timeout=2)
+            published.append(payload)
+            return 1
+
+        def close(self):
+            pass
+
+    pub._redis_client = SlowRedis()  # type: ignore[attr-defined]
+
+    pub.publish_fetch_failed(chat="@c", date="2025-01-01", error="x")
+    pub.publish_fetch_failed(chat="@c", date="2025-01-02", error="x")
+    # Caller returned without waiting for Redis
+    assert published == []
+
+    release.set()
+    pub.disconnect()
+    assert len(published) == 2
@@ -66,3 +66,35 @@ def test_event_publisher_payload_structure_and_content():
     assert data["summary_file_path"].endswith("summary.json")
     assert data["threads_file_path"].endswith("threads.json")
     assert data["participants_file_path"].endswith("participants.json")
+
+
+def test_fetch_complete_payload_matches_keyword_form():
+    published: list[bytes] = []
+
+    class StubRedis:
+        def publish(self, channel, payload):
+            published.append(payload)
+            return 1
+
+    pub = EventPublisher(
+        redis_url="redis://localhost:6379",
+        enabled=True,
+        max_retry_attempts=1,
+        retry_backoff_factor=0.1,
+    )
+    pub._redis_client = StubRedis()  # type: ignore[attr-defined]
+    fields = dict(
+        chat="@c",
+        date="2025-01-02",
+        message_count=3,
+        file_path="/data/c/2025-01-02.json",
+        duration_seconds=1.5,
+    )
+    pub.publish_fetch_complete(**fields)
+    pub.publish_fetch_complete_payload(fields)
+
+    keyword, prebuilt = (json.loads(p) for p in published)
+    for data in (keyword, prebuilt):
+        data.pop("timestamp")
+    keyword = {k: v for k, v in keyword.items() if v is not None}
+    assert prebuilt == keyword
@@ -73,3 +73,35 @@ async def test_fetch_chat_use_case_aggregates_results():
     )
 
     assert total == 10
+
+
+class _FloodDateRangeUC:
+    async def execute(self, **kwargs) -> int:  # type: ignore[no-untyped-def]
+        from src.core.exceptions import FloodWaitError
+
+        await asyncio.sleep(0)
+        if kwargs["start_date"] == date(2025, 1, 2):
+            raise FloodWaitError("flood", wait_seconds=90)
+        return 3
+
+
+@pytest.mark.asyncio
+async def test_fetch_chat_use_case_propagates_floodwait():
+    from types import SimpleNamespace
+
+    from src.core.exceptions import FloodWaitError
+
+    deps = FetchChatDeps(
+        config=SimpleNamespace(fetch_concurrency_per_chat=2),
+        telegram_gateway=_TG(),
+        source_mapper=_Mapper(),
+        date_range_use_case=_FloodDateRangeUC(),
+    )
+    strat = _Strategy(
+        [(date(2025, 1, 1), date(2025, 1, 1)), (date(2025, 1, 2), date(2025, 1, 2))]
+    )
+
+    with pytest.raises(FloodWaitError):
+        await FetchChatUseCase(deps).execute(
+            client=None, chat_identifier="@test", strategy=strat, correlation_id="cid"
+        )
@@ -73,3 +73,39 @@ async def test_fetch_runner_handles_errors_and_continues():
 
     # Calls were recorded for non-failing chats
     assert [c["chat_identifier"] for c in uc.calls] == ["@good", "@good2"]
+
+
+class _FloodChatUC(_ChatUC):
+    async def execute(self, **kwargs) -> int:  # type: ignore[no-untyped-def]
+        from telethon.errors import FloodWaitError as TelethonFloodWaitError
+
+        if kwargs.get("chat_identifier") == "@flood":
+            raise TelethonFloodWaitError(request=None, capture=120)
+        return await super().execute(**kwargs)
+
+
+@pytest.mark.asyncio
+async def test_fetch_runner_raises_floodwait_as_core_error():
+    from types import SimpleNamespace
+
+    from src.core.exceptions import FloodWaitError
+
+    cfg = SimpleNamespace(
+        telegram_chats=["@flood", "@ok"],
+        max_parallel_channels=2,
+        fetch_concurrency_per_chat=1,
+    )
+    uc = _FloodChatUC()
+    runner = FetchRunner(
+        FetchRunnerDeps(config=cfg, session_manager=_Session(), chat_use_case=uc)
+    )
+
+    with pytest.raises(FloodWaitError) as exc_info:
+        await runner.run_single(
+            strategy=_Strategy(), chat_identifier="@flood", correlation_id="cid"
+        )
+    assert (exc_info.value.wait_seconds, exc_info.value.chat) == (120, "@flood")
+
+    # Batch runs log the rate limit and keep going with other chats
+    await runner.run_all(strategy=_Strategy(), correlation_id="cid")
+    assert [c["chat_identifier"] for c in uc.calls] == ["@ok"]
@@ -0,0 +1,155 @@
+"""Unit tests for logging helpers."""
+
+import json
+import logging
+import subprocess
+import sys
+from datetime import date
+
+import pytest
+
+from src.observability import logging_config
+from src.observability.logging_config import ContextLoggerAdapter, add_correlation_id
+
+
+def test_context_adapter_merges_call_extra(caplog):
+    log = ContextLoggerAdapter(
+        logging.getLogger("test.ctx"), {"correlation_id": "cid", "chat": "@c"}
+    )
+
+    with caplog.at_level(logging.INFO, logger="test.ctx"):
+        log.info("done", extra={"status": "success", "chat": "@override"})
+        log.info("bare")
+
+    first, second = caplog.records
+    assert first.correlation_id == "cid"
+    assert first.status == "success"
+    assert first.chat == "@override"  # per-call keys win
+    assert second.chat == "@c"
+
+
+def test_add_correlation_id_keeps_call_extra(caplog):
+    log = add_correlation_id(logging.getLogger("test.cid"), "abc")
+
+    with caplog.at_level(logging.INFO, logger="test.cid"):
+        log.info("x", extra={"status": "ok"})
+
+    (record,) = caplog.records
+    assert (record.correlation_id, record.status) == ("abc", "ok")
+
+
+def test_text_logging_does_not_import_jsonlogger():
+    code = (
+        "import sys; from src.observability.logging_config import setup_logging; "
+        "setup_logging(log_format='text'); "
+        "print('pythonjsonlogger' in sys.modules)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip().splitlines()[-1] == "False"
+
+
+def test_custom_json_formatter_resolves_lazily():
+    cls = logging_config.CustomJsonFormatter
+    assert cls is logging_config._get_json_formatter_cls()
+    record = logging.LogRecord("t", logging.INFO, __file__, 1, "hi", None, None)
+    record.correlation_id = "cid"
+    out = cls("%(message)s").format(record)
+    assert json.loads(out)["correlation_id"] == "cid"
+
+
+def test_context_defaults_apply_to_child_loggers(caplog, monkeypatch):
+    monkeypatch.setenv("ENVIRONMENT", "test")
+    monkeypatch.delenv("APP_VERSION", raising=False)
+    try:
+        logging_config._install_context_defaults("svc")
+        with caplog.at_level(logging.INFO, logger="test.ctx.child"):
+            log = logging.getLogger("test.ctx.child")
+            log.info("plain")
+            log.info("override", extra={"service": "other"})
+    finally:
+        logging.setLogRecordFactory(logging.LogRecord)
+
+    plain, override = caplog.records
+    assert (plain.service, plain.environment) == ("svc", "test")
+    assert "service" not in vars(plain)
+    assert not hasattr(plain, "version")
+    assert override.service == "other"
+
+
+def test_json_timestamp_matches_stdlib_format_time():
+    fmt = "%Y-%m-%d %H:%M:%S"
+    formatter = logging_config._get_json_formatter_cls()("%(message)s", datefmt=fmt)
+    record = logging.LogRecord("t", logging.INFO, __file__, 1, "hi", None, None)
+
+    expected = logging.Formatter(datefmt=fmt).formatTime(record, fmt)
+    assert formatter.formatTime(record, fmt) == expected
+    assert formatter.formatTime(record, fmt) is formatter.formatTime(record, fmt)
+    assert json.loads(formatter.format(record))["timestamp"] == expected
+
+
+def test_json_formatter_encodes_extras_like_stdlib():
+    formatter = logging_config._get_json_formatter_cls()("%(message)s")
+    record = logging.LogRecord("t", logging.INFO, __file__, 1, "привет", None, None)
+    record.chat = "@c"
+    record.error = ValueError("boom")
+    record.when = date(2024, 1, 2)
+    record.ids = {1: "a"}  # non-str key: orjson rejects it, stdlib path used
+
+    payload = json.loads(formatter.format(record))
+    assert payload["message"] == "привет"
+    assert payload["chat"] == "@c"
+    assert payload["error"] == "ValueError: boom"
+    assert payload["when"] == "2024-01-02"
+    assert payload["ids"] == {"1": "a"}
+
+    del record.ids
+    assert "привет" in formatter.format(record)
+
+
+def test_loki_handler_is_queue_backed_by_default(monkeypatch):
+    logging_loki = pytest.importorskip("logging_loki")
+    sent = []
+    monkeypatch.setattr(
+        logging_loki.LokiHandler, "emit", lambda self, record: sent.append(record)
+    )
+    monkeypatch.delenv("LOKI_BATCH", raising=False)
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    try:
+        logging_config.setup_logging(log_format="text", loki_url="http://loki:3100")
+        (loki_handler,) = [h for h in root.handlers if hasattr(h, "listener")]
+        assert isinstance(loki_handler, logging_loki.LokiQueueHandler)
+
+        logging.getLogger("test.loki").warning("queued")
+        logging_config._stop_listener(loki_handler.listener)
+        logging_config._stop_listener(loki_handler.listener)  # idempotent
+        assert any(r.getMessage() == "queued" for r in sent)
+    finally:
+        root.handlers[:] = saved_handlers
+        root.setLevel(saved_level)
+        logging.setLogRecordFactory(logging.LogRecord)
+
+
+def test_loki_stream_labels_exclude_request_fields(monkeypatch):
+    logging_loki = pytest.importorskip("logging_loki")
+    monkeypatch.setenv("LOKI_BATCH", "false")
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    try:
+        logging_config.setup_logging(log_format="json", loki_url="http://loki:3100")
+        (handler,) = [
+            h for h in root.handlers if isinstance(h, logging_loki.LokiHandler)
+        ]
+        record = logging.LogRecord("t", logging.INFO, __file__, 1, "x", None, None)
+        record.correlation_id, record.chat, record.date = "cid", "@c", "2025-01-01"
+
+        tags = handler.emitter.build_tags(record)
+    finally:
+        root.handlers[:] = saved_handlers
+        root.setLevel(saved_level)
+        logging.setLogRecordFactory(logging.LogRecord)
+
+    assert tags["service"] == "telegram-fetcher"
+    assert not {"correlation_id", "chat", "date"} & set(tags)
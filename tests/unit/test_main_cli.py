@@ -0,0 +1,65 @@
+"""Unit tests for CLI argument to config override mapping."""
+
+import subprocess
+import sys
+from types import SimpleNamespace
+
+from src.main import _build_parser, _load_config, _pushgateway_enabled
+
+
+def _env(monkeypatch, tmp_path):
+    monkeypatch.setenv("TELEGRAM_API_ID", "1")
+    monkeypatch.setenv("TELEGRAM_API_HASH", "a" * 32)
+    monkeypatch.setenv("TELEGRAM_PHONE", "+12345678901")
+    monkeypatch.setenv("TELEGRAM_CHATS", '["@env_chat"]')
+    monkeypatch.setenv("DATA_DIR", str(tmp_path / "data"))
+    monkeypatch.setenv("SESSION_DIR", str(tmp_path / "sessions"))
+    monkeypatch.setenv("PROGRESS_FILE", str(tmp_path / "progress.json"))
+
+
+def test_run_overrides_only_given_arguments(monkeypatch, tmp_path):
+    _env(monkeypatch, tmp_path)
+    args = _build_parser().parse_args(
+        ["run", "--mode", "date", "--date", "2025-01-02", "--chats", "@a", "@b"]
+    )
+
+    config = _load_config("run", args)
+
+    assert config is not None
+    assert config.fetch_mode == "date"
+    assert config.fetch_date.isoformat() == "2025-01-02"
+    assert config.telegram_chats == ["@a", "@b"]
+
+
+def test_listen_overrides_queue_and_keeps_run_defaults(monkeypatch, tmp_path):
+    _env(monkeypatch, tmp_path)
+    args = _build_parser().parse_args(["listen", "--queue", "q:custom"])
+
+    config = _load_config("listen", args)
+
+    assert config is not None
+    assert config.commands_queue == "q:custom"
+    assert config.telegram_chats == ["@env_chat"]
+
+
+def test_cli_import_does_not_load_telethon():
+    code = "import sys, src.main; print('telethon' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "False"
+
+
+def test_pushgateway_enabled_requires_metrics_url_and_push_mode():
+    def cfg(**kw):
+        base = dict(
+            enable_metrics=True, pushgateway_url="http://pg:9091", metrics_mode="push"
+        )
+        base.update(kw)
+        return SimpleNamespace(**base)
+
+    assert _pushgateway_enabled(cfg())
+    assert _pushgateway_enabled(cfg(metrics_mode="both"))
+    assert not _pushgateway_enabled(cfg(metrics_mode="scrape"))
+    assert not _pushgateway_enabled(cfg(enable_metrics=False))
+    assert not _pushgateway_enabled(cfg(pushgateway_url=None))
@@ -0,0 +1,27 @@
+"""Unit tests for MessageCollection sender bookkeeping."""
+
+from src.models.schemas import MessageCollection, SourceInfo
+
+
+def _collection(**kwargs):
+    return MessageCollection(
+        source_info=SourceInfo(id="@c", title="t", url="u", type="channel"),
+        **kwargs,
+    )
+
+
+def test_senders_use_int_keys_in_memory():
+    coll = _collection()
+    coll.add_sender(42, "Alice")
+
+    assert coll.senders == {42: "Alice"}
+    assert coll.get_sender_name(42) == "Alice"
+    assert coll.get_sender_name(7) is None
+
+
+def test_senders_string_keys_at_json_boundary():
+    coll = _collection(senders={"10": "Bob"})
+
+    assert coll.get_sender_name(10) == "Bob"
+    assert coll.senders_json() == {"10": "Bob"}
+    assert coll.model_dump(mode="json")["senders"] == {"10": "Bob"}
@@ -174,3 +174,21 @@ def test_maybe_merge_short_rejects_large_gap_or_sender_mismatch() -> None:
 
     assert p.maybe_merge_short(prev, curr1) is False
     assert p.maybe_merge_short(prev, curr2) is False
+
+
+def test_message_preprocessor_has_no_instance_dict():
+    p = MessagePreprocessor(
+        link_normalize_enabled=True,
+        token_estimate_enabled=True,
+        message_classifier_enabled=True,
+        language_detect_enabled=True,
+        merge_short_messages_enabled=False,
+        merge_short_messages_max_length=200,
+        merge_short_messages_max_gap_seconds=120,
+        normalize_url_fn=lambda u: u,
+        estimate_tokens_fn=lambda t: 0,
+        classify_message_fn=lambda *a: "other",
+        detect_language_fn=lambda t: "en",
+    )
+    assert not hasattr(p, "__dict__")
+    assert len(p._pipeline) == 4
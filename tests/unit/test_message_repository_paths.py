@@ -21,3 +21,122 @@ def test_artifact_paths_shape(tmp_path):
     assert summary.endswith("_summary.json")
     assert threads.endswith("_threads.json")
     assert participants.endswith("_participants.json")
+
+
+def test_collection_round_trip_keeps_stdlib_file_format(tmp_path):
+    import json
+    from datetime import datetime, timezone
+
+    from src.models.schemas import Message, MessageCollection, Reaction, SourceInfo
+
+    repo = MessageRepository(tmp_path)
+    d = date(2025, 2, 3)
+    coll = MessageCollection(
+        source_info=SourceInfo(id="@demo", title="Демо", url="https://t.me/demo"),
+        messages=[
+            Message(
+                id=1,
+                date=datetime(2025, 2, 3, 10, 0, tzinfo=timezone.utc),
+                text="привет",
+                sender_id=7,
+                reactions=[Reaction(emoji="👍", count=2)],
+            )
+        ],
+    )
+    coll.add_sender(7, "Анна")
+
+    path = Path(repo.save_collection("@demo", d, coll))
+
+    expected = json.dumps(coll.model_dump(mode="json"), ensure_ascii=False, indent=2)
+    assert path.read_text(encoding="utf-8") == expected
+    loaded = repo.load_collection("@demo", d)
+    assert loaded == coll
+
+
+def test_load_collection_returns_none_for_invalid_json(tmp_path: Path):
+    repo = MessageRepository(tmp_path)
+    d = date(2025, 2, 3)
+    path = repo._get_file_path("@demo", d)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"{not json")
+
+    assert repo.load_collection("@demo", d) is None
+
+
+def test_artifacts_keep_indented_json_format(tmp_path: Path):
+    import json
+
+    repo = MessageRepository(tmp_path)
+    d = date(2025, 2, 3)
+    threads = {"roots": [1], "parent_to_children": {"1": [2]}, "depth": {}}
+
+    path = Path(repo.save_threads("@demo", d, threads))
+    assert path.read_text(encoding="utf-8") == json.dumps(
+        threads, ensure_ascii=False, indent=2
+    )
+
+    path = Path(repo.save_participants("@demo", d, {"7": "Анна"}))
+    assert json.loads(path.read_text(encoding="utf-8"))["participants"] == {"7": "Анна"}
+
+
+def test_save_collection_fsyncs_file_and_directory(tmp_path: Path, monkeypatch):
+    import os
+
+    from src.models.schemas import MessageCollection, SourceInfo
+
+    synced = []
+    real_fsync = os.fsync
+    monkeypatch.setattr(os, "fsync", lambda fd: synced.append(fd) or real_fsync(fd))
+
+    repo = MessageRepository(tmp_path)
+    coll = MessageCollection(source_info=SourceInfo(id="@demo", title="t", url="u"))
+    path = Path(repo.save_collection("@demo", date(2025, 2, 3), coll))
+
+    assert path.exists() and not path.with_suffix(".tmp").exists()
+    assert len(synced) == 2
+
+
+def test_source_dir_created_once_and_recreated_on_save(tmp_path: Path, monkeypatch):
+    import shutil
+
+    from src.models.schemas import MessageCollection, SourceInfo
+
+    repo = MessageRepository(tmp_path)
+    d = date(2025, 2, 3)
+    calls = []
+    real_mkdir = Path.mkdir
+    monkeypatch.setattr(
+        Path,
+        "mkdir",
+        lambda self, *a, **k: calls.append(self) or real_mkdir(self, *a, **k),
+    )
+
+    for _ in range(3):
+        repo.file_exists("@demo", d)
+        repo.get_summary_path("@demo", d)
+    assert calls == [tmp_path / "demo"]
+
+    shutil.rmtree(tmp_path / "demo")
+    coll = MessageCollection(source_info=SourceInfo(id="@demo", title="t", url="u"))
+    assert Path(repo.save_collection("@demo", d, coll)).exists()
+
+
+def test_file_exists_checks_for_a_regular_file(tmp_path):
+    from src.models.schemas import MessageCollection, SourceInfo
+
+    repo = MessageRepository(tmp_path)
+    d = date(2025, 2, 4)
+
+    assert repo.file_exists("@demo", d) is False
+
+    coll = MessageCollection(source_info=SourceInfo(id="@demo", title="t", url="u"))
+    saved = Path(repo.save_collection("@demo", d, coll))
+    assert repo.file_exists("@demo", d) is True
+
+    # Deletes outside the repository (retention cleanup) are seen at once
+    saved.unlink()
+    assert repo.file_exists("@demo", d) is False
+
+    # A directory with the file's name is not a saved collection
+    (tmp_path / "demo" / "2025-02-05.json").mkdir()
+    assert repo.file_exists("@demo", date(2025, 2, 5)) is False
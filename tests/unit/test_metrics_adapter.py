@@ -28,3 +28,66 @@ def test_prometheus_metrics_adapter_basic_calls_no_raise(monkeypatch):
     m.inc_command_success("cmdq", "worker-1")
     m.inc_command_failed("cmdq", "worker-1", "RuntimeError")
     m.inc_command_timeout("cmdq", "worker-1")
+
+
+def test_prometheus_metrics_adapter_updates_labelled_series():
+    from prometheus_client import REGISTRY
+
+    m = PrometheusMetricsAdapter()
+
+    def failed():
+        return (
+            REGISTRY.get_sample_value(
+                "commands_failed_total",
+                {"queue": "q-adapter", "worker": "w-a", "error_type": "KeyError"},
+            )
+            or 0.0
+        )
+
+    before = failed()
+    m.inc_command_failed("q-adapter", "w-a", "KeyError")
+    m.inc_command_failed("q-adapter", "w-a", "KeyError")
+    assert failed() == before + 2
+
+    m.set_progress("@adapter", "2025-11-01", 7)
+    labels = {"worker": m._worker_id}
+    assert REGISTRY.get_sample_value("fetch_progress_messages_current", labels) == 7
+    m.reset_progress("@adapter", "2025-11-01")
+    assert REGISTRY.get_sample_value("fetch_progress_messages_current", labels) == 0
+    assert (
+        REGISTRY.get_sample_value(
+            "fetch_progress_messages_current", {"chat": "@adapter", **labels}
+        )
+        is None
+    )
+
+
+def test_prometheus_metrics_adapters_share_worker_id(monkeypatch):
+    from src.observability.metrics import WORKER_ID
+
+    first = PrometheusMetricsAdapter()
+    monkeypatch.setenv("HOSTNAME", "changed-after-import")
+    assert PrometheusMetricsAdapter()._worker_id is first._worker_id is WORKER_ID
+
+
+def test_progress_of_concurrent_runs_adds_up_per_worker():
+    from prometheus_client import REGISTRY
+
+    labels = {"worker": PrometheusMetricsAdapter()._worker_id}
+
+    def gauge():
+        return REGISTRY.get_sample_value("fetch_progress_messages_current", labels)
+
+    m = PrometheusMetricsAdapter()
+    base = gauge() or 0.0
+    m.set_progress("@a", "2025-11-01", 10)
+    m.set_progress("@a", "2025-11-02", 4)
+    m.set_progress("@a", "2025-11-01", 15)
+    assert gauge() == base + 19
+
+    # One day finishing must not zero the day still running (any instance)
+    PrometheusMetricsAdapter().reset_progress("@a", "2025-11-01")
+    assert gauge() == base + 4
+    m.reset_progress("@a", "2025-11-02")
+    m.reset_progress("@a", "2025-11-02")
+    assert gauge() == base
@@ -1,6 +1,7 @@
 import types
 
 import pytest
+from prometheus_client import REGISTRY
 
 import src.observability.metrics as metrics
 
@@ -32,3 +33,51 @@ def test_metrics_server_swallow_exception(monkeypatch):
     # Should not raise and should not mark as started
     metrics.ensure_metrics_server(9998)
     assert metrics._server_started is False  # type: ignore[attr-defined]
+
+
+def test_track_redis_pool_reports_in_use_connections():
+    pool = types.SimpleNamespace(_in_use_connections={object(), object()})
+    metrics.track_redis_pool("pub", pool, "w-test")
+
+    value = REGISTRY.get_sample_value(
+        "redis_pool_connections_in_use", {"pool": "pub", "worker": "w-test"}
+    )
+    assert value == 2.0
+
+
+def test_track_redis_pool_supports_blocking_pools():
+    import redis
+
+    pool = redis.BlockingConnectionPool(max_connections=2)
+    metrics.track_redis_pool("queue", pool, "w-block")
+
+    def in_use():
+        return REGISTRY.get_sample_value(
+            "redis_pool_connections_in_use", {"pool": "queue", "worker": "w-block"}
+        )
+
+    assert in_use() == 0.0
+    conn = pool.make_connection()  # created and checked out, not connected
+    assert in_use() == 1.0
+    pool.pool.get_nowait()
+    pool.pool.put_nowait(conn)  # returned to the pool
+    assert in_use() == 0.0
+
+
+def test_no_metric_uses_a_date_label():
+    collectors = [
+        v
+        for v in vars(metrics).values()
+        if hasattr(v, "_labelnames") and hasattr(v, "labels")
+    ]
+    assert collectors
+    assert all("date" not in c._labelnames for c in collectors)
+
+
+def test_chat_label_folds_unlisted_chats(monkeypatch):
+    monkeypatch.setattr(metrics, "_CHAT_ALLOWLIST", frozenset())
+    assert metrics.chat_label("@any") == "@any"
+
+    monkeypatch.setattr(metrics, "_CHAT_ALLOWLIST", frozenset({"@news"}))
+    assert metrics.chat_label("@news") == "@news"
+    assert metrics.chat_label("@random") == "other"
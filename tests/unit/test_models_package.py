@@ -0,0 +1,27 @@
+"""Unit tests for lazy exports of the src.models package."""
+
+import subprocess
+import sys
+
+import pytest
+
+
+def test_command_module_does_not_import_schemas():
+    code = (
+        "import sys, src.models.command; " "print('src.models.schemas' in sys.modules)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "False"
+
+
+def test_exports_resolve_to_schema_classes():
+    import src.models as models
+    from src.models import schemas
+
+    for name in models.__all__:
+        assert getattr(models, name) is getattr(schemas, name)
+    assert set(models.__all__) <= set(dir(models))
+    with pytest.raises(AttributeError):
+        models.DoesNotExist  # noqa: B018
@@ -169,3 +169,35 @@ def test_message_preprocessor_merge_short():
     assert merged is True
     assert "first" in m1.text and "second" in m1.text
     assert m1.token_count is not None and m1.token_count >= 2
+
+
+def test_message_preprocessor_runs_only_enabled_steps():
+    """Disabled features are dropped from the pipeline at construction."""
+    calls: list[str] = []
+    p = MessagePreprocessor(
+        link_normalize_enabled=False,
+        token_estimate_enabled=True,
+        message_classifier_enabled=False,
+        language_detect_enabled=True,
+        merge_short_messages_enabled=False,
+        merge_short_messages_max_length=200,
+        merge_short_messages_max_gap_seconds=120,
+        normalize_url_fn=lambda u: calls.append("url") or u,
+        estimate_tokens_fn=lambda t: calls.append("tokens") or 1,
+        classify_message_fn=lambda *a: calls.append("cls") or "other",
+        detect_language_fn=lambda t: calls.append("lang") or "en",
+    )
+    assert len(p._pipeline) == 2
+    msg = Message(
+        id=1,
+        date=__import__("datetime").datetime.now(__import__("datetime").timezone.utc),
+        text="see example.com",
+        sender_id=1,
+        reply_to_msg_id=None,
+        forward_from=None,
+        reactions=[],
+        comments=[],
+    )
+    p.enrich(msg)
+    assert calls == ["tokens", "lang"]
+    assert msg.token_count == 1 and msg.lang == "en"
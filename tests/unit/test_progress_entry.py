@@ -0,0 +1,16 @@
+"""Unit tests for ProgressEntry date bookkeeping."""
+
+from src.models.schemas import ProgressEntry
+
+
+def test_mark_date_completed_keeps_sorted_unique():
+    entry = ProgressEntry()
+    for d in ["2025-01-03", "2025-01-01", "2025-01-05", "2025-01-03", "2025-01-02"]:
+        entry.mark_date_completed(d)
+
+    assert entry.completed_dates == [
+        "2025-01-01",
+        "2025-01-02",
+        "2025-01-03",
+        "2025-01-05",
+    ]
@@ -0,0 +1,22 @@
+"""Unit tests for progress.json persistence in ProgressTracker."""
+
+import json
+from datetime import date
+from pathlib import Path
+
+from src.services.progress_tracker import ProgressTracker
+
+
+def test_progress_file_round_trip_keeps_format(tmp_path: Path):
+    path = tmp_path / "progress.json"
+    tracker = ProgressTracker(path)
+    tracker.mark_completed("@чат", date(2025, 1, 2), message_count=3)
+
+    text = path.read_text(encoding="utf-8")
+    assert text == json.dumps(
+        tracker.get_progress().model_dump(mode="json"), ensure_ascii=False, indent=2
+    )
+
+    reloaded = ProgressTracker(path)
+    assert reloaded.get_progress() == tracker.get_progress()
+    assert reloaded.is_date_completed("@чат", date(2025, 1, 2))
@@ -94,3 +94,35 @@ async def test_safe_operation_combines_retry_and_floodwait():
             )
     assert result == "ok"
     assert calls["n"] == 2
+
+
+@pytest.mark.asyncio
+async def test_safe_operation_decorrelated_jitter_bounds():
+    sleeps: list[float] = []
+    reported: list[float] = []
+
+    async def op():
+        raise ConnectionError("transient")
+
+    async def fake_sleep(s):
+        sleeps.append(s)
+
+    with patch.object(asyncio, "sleep", new=fake_sleep):
+        with pytest.raises(ConnectionError):
+            await retry_mod.safe_operation(
+                op,
+                max_attempts=6,
+                base_delay=0.5,
+                max_delay=4.0,
+                jitter=True,
+                retry_on=(ConnectionError,),
+                on_retry=lambda _a, d, _e: reported.append(d),
+            )
+
+    assert len(sleeps) == 5
+    # Hook receives exactly the sampled delay that is slept
+    assert reported == sleeps
+    prev = 0.5
+    for s in sleeps:
+        assert 0.5 <= s <= min(4.0, max(0.5, prev * 3))
+        prev = s
@@ -0,0 +1,48 @@
+import json
+
+import pytest
+
+from src.utils import serialization
+
+
+def test_dumps_returns_compact_bytes_roundtrip():
+    payload = {"event": "messages_fetched", "chat": "@ru_python", "count": 3}
+    raw = serialization.dumps(payload)
+    assert isinstance(raw, bytes)
+    assert json.loads(raw) == payload
+    assert serialization.loads(raw) == payload
+
+
+def test_loads_accepts_str_and_bytes():
+    doc = '{"command": "fetch", "chat": "чат"}'
+    assert serialization.loads(doc) == {"command": "fetch", "chat": "чат"}
+    assert serialization.loads(doc.encode("utf-8"))["chat"] == "чат"
+
+
+def test_loads_invalid_raises_stdlib_compatible_error():
+    with pytest.raises(json.JSONDecodeError):
+        serialization.loads("{not json")
+
+
+@pytest.mark.parametrize("backend", ["default", "stdlib"])
+def test_dumps_encodes_datetimes_like_isoformat(monkeypatch, backend):
+    from datetime import date, datetime, timezone
+
+    if backend == "stdlib":
+        monkeypatch.setattr(serialization, "_orjson", None)
+    ts = datetime(2025, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc)
+
+    raw = serialization.dumps({"ts": ts, "day": date(2025, 1, 2)})
+
+    assert json.loads(raw) == {"ts": ts.isoformat(), "day": "2025-01-02"}
+
+
+@pytest.mark.parametrize("backend", ["default", "stdlib"])
+def test_indented_dumps_matches_stdlib_file_format(monkeypatch, backend):
+    if backend == "stdlib":
+        monkeypatch.setattr(serialization, "_orjson", None)
+    doc = {"chat": "чат", "senders": {"1": "A"}, "messages": [{"id": 1}], "x": []}
+
+    raw = serialization.dumps(doc, indent=True)
+
+    assert raw.decode("utf-8") == json.dumps(doc, ensure_ascii=False, indent=2)
@@ -0,0 +1,64 @@
+"""Unit tests for SessionManager client sharing and keep-alive."""
+
+import pytest
+
+from src.services.session_manager import SessionManager
+
+
+class _FakeClient:
+    def __init__(self) -> None:
+        self.connected = True
+        self.connects = 0
+        self.disconnects = 0
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    async def connect(self) -> None:
+        self.connects += 1
+        self.connected = True
+
+    async def disconnect(self) -> None:
+        self.disconnects += 1
+        self.connected = False
+
+
+def _manager(tmp_path) -> tuple[SessionManager, _FakeClient]:
+    sm = SessionManager(
+        api_id=1, api_hash="a" * 32, phone="+12345678901", session_dir=tmp_path
+    )
+    client = _FakeClient()
+    sm._client = client  # type: ignore[assignment]
+    return sm, client
+
+
+@pytest.mark.asyncio
+async def test_client_closes_after_last_user_by_default(tmp_path):
+    sm, client = _manager(tmp_path)
+
+    async with sm:
+        pass
+
+    assert client.disconnects == 1
+    assert not sm.is_connected()
+
+
+@pytest.mark.asyncio
+async def test_open_keeps_client_across_commands_until_close(tmp_path):
+    sm, client = _manager(tmp_path)
+
+    assert await sm.open() is client
+    for _ in range(3):
+        async with sm as c:
+            assert c is client
+    assert client.disconnects == 0 and client.connects == 0
+    assert sm.is_connected()
+
+    # A dropped kept-alive connection is re-established on next use
+    client.connected = False
+    async with sm:
+        pass
+    assert client.connects == 1
+
+    await sm.close()
+    assert client.disconnects == 1
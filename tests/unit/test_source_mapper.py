@@ -133,3 +133,23 @@ def test_get_sender_name_variants():
         pass
 
     assert mapper.get_sender_name(Weird()) == "Unknown"
+
+
+def test_source_info_is_memoized_per_entity_fields():
+    mapper = sm.SourceInfoMapper()
+
+    first = mapper.extract_source_info(
+        _ChannelStub(id=321, title="Cached", username="cached", megagroup=False),
+        chat_identifier="@cached",
+    )
+    again = mapper.extract_source_info(
+        _ChannelStub(id=321, title="Cached", username="cached", megagroup=False),
+        chat_identifier="@cached",
+    )
+    renamed = mapper.extract_source_info(
+        _ChannelStub(id=321, title="Renamed", username="cached", megagroup=False),
+        chat_identifier="@cached",
+    )
+
+    assert again is first
+    assert renamed is not first and renamed.title == "Renamed"
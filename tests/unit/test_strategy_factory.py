@@ -50,3 +50,12 @@ def test_factory_unsupported_mode():
     # Invalid mode is rejected at config-validation time
     with pytest.raises(ValidationError):
         make_config("unknown")
+
+
+def test_factory_mode_override_takes_precedence():
+    from types import SimpleNamespace
+
+    cfg = SimpleNamespace(fetch_mode="yesterday", fetch_date=None)
+    factory = StrategyFactory(cfg)  # type: ignore[arg-type]
+    assert factory.create("2025-11-01", mode="date").get_strategy_name() == "date"
+    assert isinstance(factory.create(), YesterdayOnlyStrategy)
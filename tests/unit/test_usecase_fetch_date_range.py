@@ -238,3 +238,180 @@ async def test_usecase_happy_path_saves_and_finalizes():
     assert deps.progress_service.reset_calls[-1] == ("@c", "2025-01-01")
     # mark_completed called with last_message_id from last appended message (id=2 in fake)
     assert deps.progress_tracker.completed_calls
+
+
+@pytest.mark.asyncio
+async def test_usecase_resets_gauge_when_iteration_fails():
+    from types import SimpleNamespace
+
+    class _FailingProcessor:
+        async def iterate(self, **_: object):
+            raise ConnectionError("network down")
+
+    deps = FetchDateRangeDeps(
+        config=SimpleNamespace(force_refetch=True, dedup_in_run_enabled=False),
+        repository=RepoFake(),
+        preprocessor=PreprocFake(),
+        source_mapper=SourceMapperFake(),
+        date_range_processor=_FailingProcessor(),
+        progress_service=ProgressServiceFake(),
+        progress_tracker=ProgressTrackerFake(completed=False),
+        finalization_orchestrator=FinalizeFake(),
+        extract_message_data=None,
+    )
+
+    with pytest.raises(ConnectionError):
+        await FetchDateRangeUseCase(deps).execute(
+            client=object(),
+            entity=object(),
+            source_info=SourceInfo(id="@c", title="T", url="u"),
+            start_date=date(2025, 1, 1),
+            end_date=date(2025, 1, 1),
+            correlation_id="cid",
+        )
+
+    # A failed run must not leave its count in the worker's gauge
+    assert deps.progress_service.reset_calls == [("@c", "2025-01-01")]
+    assert deps.repository.saved == []
+
+
+class _FlushingProcessorFake:
+    """Mimics MessageIterator: counts handle() results, then awaits flush."""
+
+    def __init__(self, n):
+        self._n = n
+        self.fetched = None
+
+    async def iterate(self, *, handle, flush=None, **_: object):
+        class Msg:
+            def __init__(self, i):
+                self.sender = object()
+                self.id = i
+
+        fetched = 0
+        for i in range(self._n):
+            fetched += bool(await handle(Msg(i)))
+        if flush is not None:
+            fetched += await flush()
+        self.fetched = fetched
+        return fetched, self._n
+
+
+@pytest.mark.asyncio
+async def test_usecase_extracts_ahead_within_window_and_keeps_order():
+    cfg = FetcherConfig(
+        telegram_api_id=1,
+        telegram_api_hash="a" * 32,
+        telegram_phone="+12345678901",
+        telegram_chats=["@c"],
+        extract_concurrency=3,
+    )
+    in_flight = 0
+    peak = 0
+
+    async def extract_message_data(client, entity, msg, source_info):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Later messages finish first: ordering must come from the window
+        await asyncio.sleep(0.001 * (10 - msg.id))
+        in_flight -= 1
+        return type("D", (), {"id": msg.id + 1, "sender_id": 777})()
+
+    collections = []
+
+    class _Repo(RepoFake):
+        def save_collection(self, *, source_name, target_date, collection):
+            collections.append([m.id for m in collection.messages])
+            return super().save_collection(
+                source_name=source_name,
+                target_date=target_date,
+                collection=collection,
+            )
+
+        def create_collection(self, *, source_info, messages):
+            return type("C", (), {"messages": messages, "add_sender": _noop})()
+
+    def _noop(*_a):
+        return None
+
+    drp = _FlushingProcessorFake(7)
+    deps = FetchDateRangeDeps(
+        config=cfg,
+        repository=_Repo(),
+        preprocessor=PreprocFake(),
+        source_mapper=SourceMapperFake(),
+        date_range_processor=drp,
+        progress_service=ProgressServiceFake(),
+        progress_tracker=ProgressTrackerFake(completed=False),
+        finalization_orchestrator=FinalizeFake(),
+        extract_message_data=extract_message_data,
+    )
+
+    fetched = await FetchDateRangeUseCase(deps).execute(
+        client=object(),
+        entity=object(),
+        source_info=SourceInfo(id="@c", title="T", url="u"),
+        start_date=date(2025, 1, 1),
+        end_date=date(2025, 1, 1),
+        correlation_id="cid",
+    )
+
+    assert fetched == 7 and drp.fetched == 7
+    assert collections == [[1, 2, 3, 4, 5, 6, 7]]
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_usecase_names_each_sender_once():
+    cfg = FetcherConfig(
+        telegram_api_id=1,
+        telegram_api_hash="a" * 32,
+        telegram_phone="+12345678901",
+        telegram_chats=["@c"],
+    )
+
+    async def extract_message_data(client, entity, msg, source_info):
+        return type("D", (), {"id": msg.id + 1, "sender_id": 700 + msg.id % 2})()
+
+    lookups = []
+
+    class _Mapper(SourceMapperFake):
+        def get_sender_name(self, sender_obj):
+            lookups.append(sender_obj)
+            return super().get_sender_name(sender_obj)
+
+    added = []
+
+    class _Repo(RepoFake):
+        def create_collection(self, *, source_info, messages):
+            return type(
+                "C",
+                (),
+                {"messages": messages, "add_sender": lambda _s, *a: added.append(a)},
+            )()
+
+    deps = FetchDateRangeDeps(
+        config=cfg,
+        repository=_Repo(),
+        preprocessor=PreprocFake(),
+        source_mapper=_Mapper(),
+        date_range_processor=_FlushingProcessorFake(6),
+        progress_service=ProgressServiceFake(),
+        progress_tracker=ProgressTrackerFake(completed=False),
+        finalization_orchestrator=FinalizeFake(),
+        extract_message_data=extract_message_data,
+    )
+
+    fetched = await FetchDateRangeUseCase(deps).execute(
+        client=object(),
+        entity=object(),
+        source_info=SourceInfo(id="@c", title="T", url="u"),
+        start_date=date(2025, 1, 1),
+        end_date=date(2025, 1, 1),
+        correlation_id="cid",
+    )
+
+    assert fetched == 6
+    assert len(lookups) == 2
+    assert added == [(700, "SenderName"), (701, "SenderName")]